@@ -143,6 +143,7 @@ def write_pr_body(
     current_version: str,
     pyproject_current_version: str,
     latest_version: str,
+    benchmark_report: str | None = None,
 ) -> None:
     """Write the generated carrier-api update PR body.
 
@@ -152,27 +153,26 @@ def write_pr_body(
         current_version: Currently pinned manifest version.
         pyproject_current_version: Currently pinned pyproject version.
         latest_version: Target carrier-api version.
+        benchmark_report: Optional markdown comparing integration benchmarks
+            between the two versions.
     """
     release_notes = build_release_notes(
         releases=releases,
         current_version=current_version,
         latest_version=latest_version,
     )
-    body_path.write_text(
-        "\n".join(
-            [
-                "Automated update of carrier-api dependency pins.",
-                "",
-                f"- Previous manifest pinned version: `carrier-api=={current_version}`",
-                f"- Previous pyproject pinned version: `carrier-api=={pyproject_current_version}`",
-                f"- Updated pinned version: `carrier-api=={latest_version}`",
-                "",
-                "## carrier-api release notes in range",
-                release_notes,
-                "",
-            ],
-        ),
-    )
+    lines = [
+        "Automated update of carrier-api dependency pins.",
+        "",
+        f"- Previous manifest pinned version: `carrier-api=={current_version}`",
+        f"- Previous pyproject pinned version: `carrier-api=={pyproject_current_version}`",
+        f"- Updated pinned version: `carrier-api=={latest_version}`",
+        "",
+    ]
+    if benchmark_report is not None:
+        lines.extend(["## Integration benchmarks", benchmark_report.strip(), ""])
+    lines.extend(["## carrier-api release notes in range", release_notes, ""])
+    body_path.write_text("\n".join(lines))
 
 
 def fetch_releases(*, owner: str, repo: str, token: str | None = None) -> list[dict[str, object]]:
@@ -252,6 +252,7 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
     parser.add_argument("--release-owner", required=True)
     parser.add_argument("--release-repo", required=True)
     parser.add_argument("--body-path", type=Path, required=True)
+    parser.add_argument("--benchmark-report-path", type=Path)
     return parser.parse_args(argv)
 
 
@@ -286,12 +287,17 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
         return 1
 
+    benchmark_report = None
+    if args.benchmark_report_path is not None and args.benchmark_report_path.is_file():
+        benchmark_report = args.benchmark_report_path.read_text()
+
     write_pr_body(
         body_path=args.body_path,
         releases=releases,
         current_version=args.current_version,
         pyproject_current_version=args.pyproject_current_version,
         latest_version=args.latest_version,
+        benchmark_report=benchmark_report,
     )
     return 0
 
@@ -0,0 +1,293 @@
+"""Compare integration benchmarks between two carrier-api versions."""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+import json
+import logging
+from pathlib import Path
+import sys
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_THRESHOLD_PERCENT = 25.0
+# Benchmark result fields compared between versions, with their table headings.
+METRICS: tuple[tuple[str, str], ...] = (
+    ("median_seconds", "Median time"),
+    ("peak_memory_bytes", "Peak memory"),
+)
+
+
+@dataclass(frozen=True)
+class MetricChange:
+    """One benchmark metric measured with both carrier-api versions.
+
+    Attributes:
+        case: Benchmark name and parameters, e.g. ``entity_fan_out[systems=5,zones=4]``.
+        metric: Result field that was compared.
+        before: Value with the currently pinned version.
+        after: Value with the new version.
+    """
+
+    case: str
+    metric: str
+    before: float
+    after: float
+
+    @property
+    def change_percent(self) -> float | None:
+        """Return the relative change, or None when ``before`` is zero."""
+        if not self.before:
+            return None
+        return (self.after - self.before) / self.before * 100
+
+    def is_regression(self, threshold_percent: float) -> bool:
+        """Return whether the metric grew by more than ``threshold_percent``.
+
+        Args:
+            threshold_percent: Allowed growth in percent.
+
+        Returns:
+            True when the new version is worse than allowed.
+        """
+        change = self.change_percent
+        return change is not None and change > threshold_percent
+
+
+def load_results(results_path: Path) -> dict[str, Mapping[str, object]]:
+    """Load a benchmark results file keyed by benchmark case.
+
+    Args:
+        results_path: JSON file written by the benchmark suite.
+
+    Returns:
+        Benchmark results keyed by case name.
+
+    Raises:
+        TypeError: Raised when the file is not a benchmark results payload.
+    """
+    payload = json.loads(results_path.read_text())
+    if not isinstance(payload, dict) or not isinstance(payload.get("results"), list):
+        raise TypeError(f"Expected benchmark results in {results_path}")
+    return {_case_name(result): result for result in payload["results"] if isinstance(result, dict)}
+
+
+def _case_name(result: Mapping[str, object]) -> str:
+    """Return a readable name for one benchmark result.
+
+    Args:
+        result: Benchmark result object.
+
+    Returns:
+        Benchmark name followed by its parameters.
+    """
+    params = result.get("params")
+    if not isinstance(params, dict):
+        return str(result.get("name"))
+    labels = ",".join(f"{key}={value}" for key, value in sorted(params.items()))
+    return f"{result.get('name')}[{labels}]"
+
+
+def compare_results(
+    *,
+    before: Mapping[str, Mapping[str, object]],
+    after: Mapping[str, Mapping[str, object]],
+) -> list[MetricChange]:
+    """Pair up the metrics of benchmark cases present in both runs.
+
+    Args:
+        before: Results with the currently pinned version.
+        after: Results with the new version.
+
+    Returns:
+        Changes in case order of ``before``.
+    """
+    changes: list[MetricChange] = []
+    for case, old in before.items():
+        new = after.get(case)
+        if new is None:
+            continue
+        for metric, _heading in METRICS:
+            old_value = old.get(metric)
+            new_value = new.get(metric)
+            if isinstance(old_value, int | float) and isinstance(new_value, int | float):
+                changes.append(MetricChange(case, metric, float(old_value), float(new_value)))
+    return changes
+
+
+def _format_value(metric: str, value: float) -> str:
+    """Format a metric value for the report table.
+
+    Args:
+        metric: Result field the value belongs to.
+        value: Measured value.
+
+    Returns:
+        Milliseconds for timings and KiB for memory.
+    """
+    if metric == "peak_memory_bytes":
+        return f"{value / 1024:,.1f} KiB"
+    return f"{value * 1000:,.3f} ms"
+
+
+def _format_change(change: MetricChange | None, threshold_percent: float) -> str:
+    """Format one before/after cell group of the report table.
+
+    Args:
+        change: Compared metric, if both runs measured it.
+        threshold_percent: Allowed growth in percent.
+
+    Returns:
+        Markdown table cells for before, after, and change.
+    """
+    if change is None:
+        return "n/a | n/a | n/a"
+    percent = change.change_percent
+    delta = "n/a" if percent is None else f"{percent:+.1f}%"
+    if change.is_regression(threshold_percent):
+        delta = f"**{delta}** :warning:"
+    return (
+        f"{_format_value(change.metric, change.before)} | "
+        f"{_format_value(change.metric, change.after)} | {delta}"
+    )
+
+
+def build_benchmark_report(
+    *,
+    changes: Sequence[MetricChange],
+    current_version: str,
+    latest_version: str,
+    threshold_percent: float,
+) -> str:
+    """Build the markdown benchmark section for the update PR body.
+
+    Args:
+        changes: Compared metrics.
+        current_version: Currently pinned carrier-api version.
+        latest_version: Target carrier-api version.
+        threshold_percent: Growth in percent reported as a regression.
+
+    Returns:
+        Markdown with regressions listed first and the full table folded.
+    """
+    if not changes:
+        return "Benchmarks did not produce comparable results for both versions."
+
+    regressions = [change for change in changes if change.is_regression(threshold_percent)]
+    lines: list[str] = []
+    if regressions:
+        lines.append(
+            f":warning: {len(regressions)} benchmark figure(s) regressed by more than "
+            f"{threshold_percent:g}% with `carrier-api=={latest_version}`:"
+        )
+        lines.extend(
+            f"- `{change.case}` {change.metric}: {_format_value(change.metric, change.before)}"
+            f" → {_format_value(change.metric, change.after)} ({change.change_percent:+.1f}%)"
+            for change in regressions
+        )
+    else:
+        lines.append(
+            f"No benchmark figure regressed by more than {threshold_percent:g}% with "
+            f"`carrier-api=={latest_version}`."
+        )
+
+    by_case: dict[str, dict[str, MetricChange]] = {}
+    for change in changes:
+        by_case.setdefault(change.case, {})[change.metric] = change
+    header = " | ".join(
+        f"{heading} {current_version} | {heading} {latest_version} | Change"
+        for _metric, heading in METRICS
+    )
+    lines.extend(
+        [
+            "",
+            "<details><summary>All benchmark figures (fake Carrier API)</summary>",
+            "",
+            f"| Benchmark | {header} |",
+            "|---" * (1 + 3 * len(METRICS)) + "|",
+        ]
+    )
+    for case, metrics in by_case.items():
+        cells = " | ".join(
+            _format_change(metrics.get(metric), threshold_percent) for metric, _heading in METRICS
+        )
+        lines.append(f"| `{case}` | {cells} |")
+    lines.extend(["", "</details>"])
+    return "\n".join(lines)
+
+
+def _load_or_none(results_path: Path) -> dict[str, Mapping[str, object]] | None:
+    """Load a results file, logging instead of failing when it is unusable.
+
+    Args:
+        results_path: JSON file written by the benchmark suite.
+
+    Returns:
+        Results keyed by case, or None when the benchmark run did not finish.
+    """
+    try:
+        return load_results(results_path)
+    except (OSError, json.JSONDecodeError, TypeError) as err:
+        LOGGER.warning("Benchmark results in %s are unavailable: %s", results_path, err)
+        return None
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Command-line arguments excluding the executable name.
+
+    Returns:
+        Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--before-path", type=Path, required=True)
+    parser.add_argument("--after-path", type=Path, required=True)
+    parser.add_argument("--current-version", required=True)
+    parser.add_argument("--latest-version", required=True)
+    parser.add_argument("--report-path", type=Path, required=True)
+    parser.add_argument("--threshold-percent", type=float, default=DEFAULT_THRESHOLD_PERCENT)
+    parser.add_argument("--github-output", type=Path)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Write the benchmark comparison report.
+
+    A missing or broken results file still produces a report that says so,
+    so the update PR is opened either way.
+
+    Args:
+        argv: Optional command-line arguments excluding the executable name.
+
+    Returns:
+        Process exit code.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    before = _load_or_none(args.before_path)
+    after = _load_or_none(args.after_path)
+    regressed = False
+    if before is None or after is None:
+        missing = args.current_version if before is None else args.latest_version
+        report = f"Benchmarks did not complete with `carrier-api=={missing}`; see the workflow log."
+    else:
+        changes = compare_results(before=before, after=after)
+        report = build_benchmark_report(
+            changes=changes,
+            current_version=args.current_version,
+            latest_version=args.latest_version,
+            threshold_percent=args.threshold_percent,
+        )
+        regressed = any(change.is_regression(args.threshold_percent) for change in changes)
+    args.report_path.write_text(report + "\n")
+    if args.github_output is not None:
+        with args.github_output.open("a") as output_file:
+            output_file.write(f"regressed={str(regressed).lower()}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
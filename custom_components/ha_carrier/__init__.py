@@ -9,6 +9,7 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .carrier_data_update_coordinator import CarrierDataUpdateCoordinator
 from .const import (
@@ -22,7 +23,9 @@ from .const import (
 )
 from .exceptions import CarrierUnauthorizedError
 from .migrate import migrate_1_to_2, migrate_2_to_3
-from .resiliency import RetryPolicy, compute_backoff_delay
+from .resiliency import BreakerState, RetryPolicy, compute_backoff_delay
+from .scheduler import async_get_scheduler
+from .services import async_setup_services
 from .util import (
     WEBSOCKET_DATA_UPDATE_EXCEPTIONS,
     WEBSOCKET_RECOVERABLE_EXCEPTIONS,
@@ -49,6 +52,23 @@ _LOGGER: logging.Logger = logging.getLogger(__name__)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
+def _websocket_retry_delay(coordinator: CarrierDataUpdateCoordinator, attempt: int) -> float:
+    """Return the websocket reconnect delay, spending from the account's retry budget.
+
+    Args:
+        coordinator: Coordinator whose shared retry budget the reconnect spends.
+        attempt: Zero-based reconnect attempt.
+
+    Returns:
+        float: Normal backoff delay, or the longest websocket delay once the
+            retry budget is exhausted.
+    """
+    if coordinator.resiliency.retry_budget.try_spend():
+        return compute_backoff_delay(WEBSOCKET_RETRY_POLICY, attempt)
+    _LOGGER.debug("retry budget exhausted; slowing websocket reconnects")
+    return WEBSOCKET_RETRY_POLICY.max_delay
+
+
 async def _async_await_websocket_task(websocket_task: asyncio.Task[None]) -> None:
     """Await websocket task shutdown after cancellation.
 
@@ -70,12 +90,28 @@ async def _async_await_websocket_task(websocket_task: asyncio.Task[None]) -> Non
         _LOGGER.exception("websocket task raised RuntimeError during cancellation")
 
 
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Register the integration's services once per Home Assistant instance.
+
+    Args:
+        hass: Home Assistant instance.
+        _config: YAML configuration (unused; the integration is config-entry only).
+
+    Returns:
+        bool: Always True.
+    """
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntryCarrier) -> bool:
     """Set up one Carrier config entry and start platform forwarding.
 
     The setup creates a Carrier API connection, initializes the data
     coordinator, performs the first refresh, and starts a long-running
-    websocket listener task for near-real-time updates.
+    websocket listener task for near-real-time updates. Setup is not delayed:
+    logins share the integration-wide scheduler's login slots, and the first
+    periodic poll lands on this entry's phase slot.
 
     Args:
         hass: Home Assistant instance.
@@ -99,9 +135,11 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntryCarrie
 
     try:
         api_connection = ApiConnectionGraphql(username=username, password=password)
+        scheduler = async_get_scheduler(hass)
         coordinator = CarrierDataUpdateCoordinator(
             hass=hass,
             api_connection=api_connection,
+            scheduler=scheduler,
         )
         await coordinator.async_config_entry_first_refresh()
         config_entry.runtime_data = coordinator
@@ -115,18 +153,32 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntryCarrie
             after a successful listener session. The websocket loop does not
             update resiliency counters directly; it requests a coordinator
             refresh, and the refresh path owns outage accounting and any reauth
-            escalation.
+            escalation. While the shared circuit breaker is not closed the loop
+            holds off reconnecting and leaves the half-open probe to the
+            refresh path.
 
             Returns:
                 None: This coroutine runs until cancelled.
             """
             attempt = 0
             while True:
+                resiliency = coordinator.resiliency
+                if resiliency.breaker_state is not BreakerState.CLOSED:
+                    delay = max(
+                        resiliency.breaker_retry_after(),
+                        compute_backoff_delay(WEBSOCKET_RETRY_POLICY, attempt),
+                    )
+                    _LOGGER.debug(
+                        "websocket reconnect paused by circuit breaker for %.1f seconds", delay
+                    )
+                    await asyncio.sleep(delay)
+                    continue
                 try:
                     _LOGGER.debug("websocket task listening")
                     api_websocket = coordinator.api_connection.api_websocket
                     if api_websocket is None:
                         raise RuntimeError("Carrier API websocket client is not initialized")
+                    await coordinator.async_ensure_authenticated()
                     await api_websocket.listener()
                     _LOGGER.debug("websocket task ending")
                     coordinator.data_flush = True
@@ -135,7 +187,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntryCarrie
                     _LOGGER.debug("websocket task cancelled")
                     raise
                 except WEBSOCKET_RECOVERABLE_EXCEPTIONS as error:
-                    delay = compute_backoff_delay(WEBSOCKET_RETRY_POLICY, attempt)
+                    delay = _websocket_retry_delay(coordinator, attempt)
                     _LOGGER.debug(
                         "websocket task hit %s; requesting refresh and retrying in %.1f "
                         "seconds (attempt %d)",
@@ -148,7 +200,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntryCarrie
                     await asyncio.sleep(delay)
                     attempt += 1
                 except WEBSOCKET_DATA_UPDATE_EXCEPTIONS as error:
-                    delay = compute_backoff_delay(WEBSOCKET_RETRY_POLICY, attempt)
+                    delay = _websocket_retry_delay(coordinator, attempt)
                     _LOGGER.exception(
                         "websocket data update failed with %s; requesting refresh and "
                         "retrying in %.1f seconds (attempt %d)",
@@ -181,6 +233,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntryCarrie
             websocket_task.cancel()
 
         config_entry.async_on_unload(cancel_websocket_task)
+        coordinator.async_start_entry_level_polling()
+        config_entry.async_on_unload(coordinator.async_stop_entry_level_polling)
     except ConfigEntryAuthFailed:
         _LOGGER.exception("Carrier authentication failed during setup")
         raise
@@ -273,5 +327,15 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntryCarri
         websocket_task.cancel()
         await _async_await_websocket_task(websocket_task)
         config_entry.runtime_data.websocket_task = None
-
-    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    # Append whatever a running websocket recording has queued.
+    config_entry.runtime_data.websocket_recorder.stop()
+
+    unload_ok = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    if unload_ok:
+        # Each setup builds a new connection, so close this one's session
+        # rather than leaving it open across reloads.
+        try:
+            await config_entry.runtime_data.api_connection.cleanup()
+        except CarrierApiConnectionError:
+            _LOGGER.debug("closing the Carrier API session failed during unload", exc_info=True)
+    return unload_ok
@@ -1,17 +1,20 @@
 """Coordinate polling, websocket updates, and writes for Carrier systems."""
 
 import asyncio
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+import contextlib
 from datetime import UTC, datetime, timedelta
 import functools
 import logging
+import time
 from typing import Any, NoReturn
 
 from carrier_api import ApiConnectionGraphql, CarrierApiError, Energy, EntryLevelSystem, System
 from carrier_api.api_websocket_data_updater import WebsocketDataUpdater
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
 from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     REQUEST_REFRESH_DEFAULT_COOLDOWN,
     DataUpdateCoordinator,
@@ -21,32 +24,57 @@ from homeassistant.helpers.update_coordinator import (
 from .const import (
     DEFAULT_UPDATE_INTERVAL_MINUTES,
     DOMAIN,
+    ENTRY_LEVEL_ACTIVE_POLL_SECONDS,
+    ENTRY_LEVEL_CONFIRM_READ_DELAY_SECONDS,
+    ENTRY_LEVEL_IDLE_POLL_SECONDS,
+    ENTRY_LEVEL_POST_WRITE_FAST_POLL_MINUTES,
+    ENTRY_LEVEL_POST_WRITE_POLL_SECONDS,
     FULL_RECONCILE_INTERVAL_MINUTES,
     MAX_REFRESH_ATTEMPTS,
     MAX_WRITE_ATTEMPTS,
     POST_WRITE_INTERCEPT_WINDOW_MINUTES,
+    REFRESH_DEADLINE_SECONDS,
     REFRESH_RETRY_BASE_DELAY_SECONDS,
     REFRESH_RETRY_MAX_DELAY_SECONDS,
     RETRY_JITTER_FRACTION,
-    TO_REDACT_MAPPED,
     TRANSIENT_FAILURE_THRESHOLD,
     UNAUTHORIZED_RETRY_THRESHOLD,
+    WEBSOCKET_SLOW_CALLBACK_SECONDS,
+    WRITE_DEADLINE_SECONDS,
     WRITE_RETRY_BASE_DELAY_SECONDS,
     WRITE_RETRY_MAX_DELAY_SECONDS,
 )
-from .exceptions import CarrierUnauthorizedError
-from .resiliency import ResiliencyState, RetryPolicy, async_call_with_retry
+from .debug_snapshots import DebugSnapshotLogger
+from .exceptions import CarrierCircuitOpenError, CarrierUnauthorizedError
+from .journal import MessageJournal
+from .metrics import (
+    WEBSOCKET_STAGE_CARRIER_LAG,
+    WEBSOCKET_STAGE_LISTENER_FANOUT,
+    WEBSOCKET_STAGE_MESSAGE_HANDLER,
+    WEBSOCKET_STAGE_REASSERT_CONTROL,
+    WEBSOCKET_STAGE_TOTAL,
+    ApiMetrics,
+    EntityProfiler,
+)
+from .profiling import CycleProfiler
+from .rate_limiter import CarrierRateLimiter
+from .request_scheduler import CarrierRequestScheduler, RequestPriority
+from .resiliency import BreakerState, ResiliencyState, RetryPolicy, async_call_with_retry
+from .scheduler import CarrierScheduler
 from .util import (
     RECOVERABLE_REFRESH_EXCEPTIONS,
     RECOVERABLE_WRITE_COMMUNICATION_EXCEPTIONS,
-    async_redact_data,
+    carrier_message_timestamp,
     is_unauthorized_error,
+    parse_websocket_message,
 )
+from .websocket_trace import WebsocketTraceRecorder
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 FULL_RECONCILE_INTERVAL = timedelta(minutes=FULL_RECONCILE_INTERVAL_MINUTES)
 POST_WRITE_INTERCEPT_WINDOW = timedelta(minutes=POST_WRITE_INTERCEPT_WINDOW_MINUTES)
+ENTRY_LEVEL_POST_WRITE_FAST_POLL = timedelta(minutes=ENTRY_LEVEL_POST_WRITE_FAST_POLL_MINUTES)
 
 REFRESH_RETRY_POLICY = RetryPolicy(
     name="carrier-refresh",
@@ -79,19 +107,32 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         self,
         hass: HomeAssistant,
         api_connection: ApiConnectionGraphql,
+        scheduler: CarrierScheduler | None = None,
     ) -> None:
         """Initialize coordinator state and refresh scheduling.
 
         Args:
             hass: Home Assistant instance used for task scheduling and callbacks.
             api_connection: Authenticated Carrier API connection wrapper.
+            scheduler: Integration-wide scheduler that phases polls and caps
+                concurrent full refreshes across config entries, if any.
         """
         self.hass: HomeAssistant = hass
         self.api_connection: ApiConnectionGraphql = api_connection
+        self.scheduler: CarrierScheduler | None = scheduler
         self.resiliency = ResiliencyState(
             unauthorized_threshold=UNAUTHORIZED_RETRY_THRESHOLD,
             transient_threshold=TRANSIENT_FAILURE_THRESHOLD,
         )
+        self.rate_limiter = CarrierRateLimiter()
+        self.request_scheduler = CarrierRequestScheduler()
+        self.resiliency.on_breaker_change = self._async_breaker_changed
+        self.metrics = ApiMetrics(self.resiliency.latency)
+        self.entity_profiler = EntityProfiler()
+        self.cycle_profiler = CycleProfiler()
+        self.websocket_recorder = WebsocketTraceRecorder()
+        self.debug_snapshots = DebugSnapshotLogger(_LOGGER)
+        self.journal = MessageJournal()
         self.systems: list[System] = []
         self.entry_level_systems: list[EntryLevelSystem] = []
         self.websocket_data_updater: WebsocketDataUpdater | None = None
@@ -102,6 +143,10 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         self.timestamp_websocket: datetime | None = None
         self.timestamp_energy: datetime | None = None
         self._intercept_guards: dict[tuple[str, str | None], dict[str, Any]] = {}
+        self._entry_level_polling = False
+        self._entry_level_unsub: CALLBACK_TYPE | None = None
+        self._entry_level_fast_until: datetime | None = None
+        self._entry_level_write_generations: dict[str, int] = {}
 
         super().__init__(
             hass,
@@ -118,6 +163,16 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             ),
         )
 
+    @callback
+    def _async_breaker_changed(self, _breaker_state: BreakerState) -> None:
+        """Push a circuit breaker transition to entities.
+
+        Home Assistant only notifies listeners on the first failed refresh of
+        an outage, so without this the breaker sensor would keep showing the
+        position it had before the breaker tripped.
+        """
+        self.async_update_listeners()
+
     def _full_reconcile_due(self) -> bool:
         """Return True when websocket-maintained data is overdue for a full fetch.
 
@@ -135,6 +190,60 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             return True
         return datetime.now(UTC) - self.timestamp_all_data >= FULL_RECONCILE_INTERVAL
 
+    def _steady_update_interval(self) -> timedelta:
+        """Return the poll interval to use after a successful refresh.
+
+        When other Carrier entries share the scheduler, the interval is stretched
+        or shortened to land on this entry's own phase slot so polls from several
+        accounts never stay phase-locked.
+
+        Returns:
+            timedelta: Interval until the next scheduled poll.
+        """
+        interval = timedelta(minutes=DEFAULT_UPDATE_INTERVAL_MINUTES)
+        if self.scheduler is None or self.config_entry is None:
+            return interval
+        return self.scheduler.next_poll_interval(self.config_entry.entry_id, interval)
+
+    def _full_refresh_slot(self) -> asyncio.Semaphore | None:
+        """Return the shared limiter each full-refresh attempt must hold, if any."""
+        if self.scheduler is None:
+            return None
+        return self.scheduler.full_refresh_semaphore
+
+    def _login_slot(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        """Return the shared limiter a login or token refresh must hold."""
+        if self.scheduler is None:
+            return contextlib.nullcontext()
+        return self.scheduler.login_semaphore
+
+    async def async_ensure_authenticated(self) -> None:
+        """Log in or refresh the access token while holding a shared login slot.
+
+        The Carrier client logs in, or refreshes an expired token, lazily inside
+        whichever call first needs it. Checking here first, under the
+        integration-wide login slot, means accounts that start or expire together
+        take turns authenticating; the client's own check then finds a valid token.
+        """
+        async with self._login_slot():
+            await self.api_connection.check_auth_expiration()
+
+    def _authenticated[T](self, request: Callable[[], Awaitable[T]]) -> Callable[[], Awaitable[T]]:
+        """Wrap a Carrier call so each attempt authenticates under the login slot.
+
+        Args:
+            request: Awaitable callback that performs the Carrier API call.
+
+        Returns:
+            Callable[[], Awaitable[T]]: Callback for the retry helper.
+        """
+
+        async def _request() -> T:
+            await self.async_ensure_authenticated()
+            return await request()
+
+        return _request
+
     def begin_post_write_intercept(
         self, system_serial: str, zone_api_id: str | None = None
     ) -> None:
@@ -288,8 +397,9 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         Raises:
             ConfigEntryAuthFailed: Raised when 401 responses cross the
                 unauthorized threshold; HA prompts reauth.
-            UpdateFailed: Raised when transient failures escalate or refresh
-                cannot complete successfully for other reasons.
+            UpdateFailed: Raised when transient failures escalate, the circuit
+                breaker is open, or refresh cannot complete successfully for
+                other reasons.
         """
         if not self.data_flush and self._full_reconcile_due():
             _LOGGER.debug(
@@ -306,7 +416,7 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             refresh_operation = self._async_energy_refresh
 
         try:
-            await refresh_operation()
+            await self._async_run_refresh(refresh_context, refresh_operation)
             return [self.mapped_system_data(system) for system in self.systems]
         except CarrierUnauthorizedError as error:
             self.data_flush = True
@@ -320,6 +430,12 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             SystemExit,
         ):
             raise
+        except CarrierCircuitOpenError as error:
+            self.data_flush = True
+            self.update_interval = timedelta(minutes=1)
+            raise UpdateFailed(
+                f"Carrier is unavailable; {refresh_context} paused by the circuit breaker."
+            ) from error
         except RECOVERABLE_REFRESH_EXCEPTIONS as error:
             self.data_flush = True
             self.update_interval = timedelta(minutes=1)
@@ -336,76 +452,156 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
                 f"Unexpected error during Carrier {refresh_context}: {error}"
             ) from error
 
+    async def _async_run_refresh(
+        self, refresh_context: str, refresh_operation: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Run one refresh cycle and record its duration and outcome.
+
+        The outcome goes to the metrics and the message journal.
+
+        Args:
+            refresh_context: Refresh kind used as the metrics key.
+            refresh_operation: Full or energy refresh coroutine function.
+        """
+        started = time.monotonic()
+        try:
+            await refresh_operation()
+        except Exception as error:
+            elapsed = time.monotonic() - started
+            self.metrics.record_refresh(refresh_context, elapsed, error)
+            self.journal.record_refresh(refresh_context, elapsed, error)
+            raise
+        elapsed = time.monotonic() - started
+        self.metrics.record_refresh(refresh_context, elapsed)
+        self.journal.record_refresh(refresh_context, elapsed)
+
     async def _async_full_refresh(self) -> None:
         """Load all Carrier systems through the normal retry path.
 
-        A successful full refresh represents a healthy API round trip, so the
-        retry helper uses its default behavior and resets shared resiliency
-        counters. System objects are then updated in place so websocket callbacks
-        and entity references keep pointing at the live coordinator list.
+        A successful full refresh represents a healthy API round trip, so the retry
+        helper uses its default behavior and resets shared resiliency counters. The
+        entry-level (Smart Thermostat) fetch is independent of ``load_data``, so it runs
+        concurrently and only costs one round trip overall; it stays best-effort, is
+        bounded by the same deadline, and is cancelled, and awaited, if the Infinity
+        load fails. Each ``load_data`` attempt holds a cross-entry full-refresh slot,
+        released during backoff so a retrying account does not starve the others. System
+        objects are then updated in place so websocket callbacks and entity references
+        keep pointing at the live coordinator list.
 
         Raises:
             CarrierUnauthorizedError: When 401s escalate beyond the threshold.
             BaseException: Any transient error that escalates beyond the threshold.
         """
         _LOGGER.debug("fetching fresh all data")
-        fresh_systems: list[System] = await async_call_with_retry(
-            self.api_connection.load_data,
-            policy=REFRESH_RETRY_POLICY,
-            state=self.resiliency,
-            operation_name="full data refresh",
-            logger=_LOGGER,
+        deadline_at = asyncio.get_running_loop().time() + REFRESH_DEADLINE_SECONDS
+        entry_level_task = asyncio.create_task(self._async_fetch_entry_level_systems())
+        try:
+            fresh_systems: list[System] = await async_call_with_retry(
+                self._authenticated(self.api_connection.load_data),
+                policy=REFRESH_RETRY_POLICY,
+                state=self.resiliency,
+                operation_name="full data refresh",
+                logger=_LOGGER,
+                rate_limiter=self.rate_limiter,
+                request_scheduler=self.request_scheduler,
+                attempt_slot=self._full_refresh_slot(),
+                deadline=REFRESH_DEADLINE_SECONDS,
+                metrics=self.metrics,
+            )
+        except BaseException:
+            entry_level_task.cancel()
+            # Wait for the cancellation so the fetch never outlives the
+            # refresh; its own outcome must not mask the load failure.
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await entry_level_task
+            raise
+        fresh_entry_level_systems = await self._async_finish_entry_level_fetch(
+            entry_level_task, deadline_at
         )
-        if not self.systems:
-            self.systems.clear()
-            self.systems.extend(fresh_systems)
-        else:
-            existing_by_serial = {s.profile.serial: s for s in self.systems}
-            fresh_serials = {s.profile.serial for s in fresh_systems}
-
-            for fresh_system in fresh_systems:
-                existing = existing_by_serial.get(fresh_system.profile.serial)
-                if existing is None:
+        # Only the synchronous apply step is profiled; the round trip above
+        # would also capture whatever else the event loop ran meanwhile.
+        with self.cycle_profiler.capture():
+            if not self.systems:
+                self.systems.clear()
+                self.systems.extend(fresh_systems)
+            else:
+                existing_by_serial = {s.profile.serial: s for s in self.systems}
+                fresh_serials = {s.profile.serial for s in fresh_systems}
+
+                for fresh_system in fresh_systems:
+                    existing = existing_by_serial.get(fresh_system.profile.serial)
+                    if existing is None:
+                        _LOGGER.info(
+                            "new system discovered, adding serial %s",
+                            fresh_system.profile.serial,
+                        )
+                        self.systems.append(fresh_system)
+                    else:
+                        existing.profile = fresh_system.profile
+                        existing.status = fresh_system.status
+                        existing.config = fresh_system.config
+                        existing.energy = fresh_system.energy
+
+                stale = [s for s in self.systems if s.profile.serial not in fresh_serials]
+                for stale_system in stale:
                     _LOGGER.info(
-                        "new system discovered, adding serial %s",
-                        fresh_system.profile.serial,
+                        "system no longer present in Carrier account, removing serial %s",
+                        stale_system.profile.serial,
                     )
-                    self.systems.append(fresh_system)
-                else:
-                    existing.profile = fresh_system.profile
-                    existing.status = fresh_system.status
-                    existing.config = fresh_system.config
-                    existing.energy = fresh_system.energy
-
-            stale = [s for s in self.systems if s.profile.serial not in fresh_serials]
-            for stale_system in stale:
-                _LOGGER.info(
-                    "system no longer present in Carrier account, removing serial %s",
-                    stale_system.profile.serial,
-                )
-                self.systems.remove(stale_system)
-        await self._refresh_entry_level_systems()
-        if not self._websocket_initialized:
-            self.websocket_data_updater = WebsocketDataUpdater(systems=self.systems)
-            api_websocket = self.api_connection.api_websocket
-            if api_websocket is None:
-                raise RuntimeError("Carrier API websocket client is not initialized")
-            api_websocket.callback_add(self.websocket_data_updater.message_handler)
-            api_websocket.callback_add(self.updated_callback)
-            self._websocket_initialized = True
-        if _LOGGER.isEnabledFor(logging.DEBUG):
-            for system in self.systems:
-                _LOGGER.debug(
-                    "%s",
-                    async_redact_data(self.mapped_system_data(system), TO_REDACT_MAPPED),
-                )
-        self.timestamp_all_data = datetime.now(UTC)
-        self.timestamp_energy = self.timestamp_all_data
-        self.data_flush = False
-        self.update_interval = timedelta(minutes=DEFAULT_UPDATE_INTERVAL_MINUTES)
-        # A full read is authoritative; end every post-write guard so re-assert
-        # cannot fight freshly-read truth.
-        self._intercept_guards = {}
+                    self.systems.remove(stale_system)
+                    self.debug_snapshots.async_forget(stale_system.profile.serial)
+            if fresh_entry_level_systems is not None:
+                self.entry_level_systems = fresh_entry_level_systems
+                if self._entry_level_unsub is None:
+                    # Start the lane once entry-level systems first show up.
+                    self._async_schedule_entry_level_poll()
+            if not self._websocket_initialized:
+                self.websocket_data_updater = WebsocketDataUpdater(systems=self.systems)
+                api_websocket = self.api_connection.api_websocket
+                if api_websocket is None:
+                    raise RuntimeError("Carrier API websocket client is not initialized")
+                api_websocket.callback_add(self.async_handle_websocket_message)
+                self._websocket_initialized = True
+            if self.debug_snapshots.enabled:
+                self.debug_snapshots.async_log(self.hass, self.systems)
+            self.timestamp_all_data = datetime.now(UTC)
+            self.timestamp_energy = self.timestamp_all_data
+            self.data_flush = False
+            self.update_interval = self._steady_update_interval()
+            # A full read is authoritative; end every post-write guard so re-assert
+            # cannot fight freshly-read truth.
+            self._intercept_guards = {}
+
+    async def _async_finish_entry_level_fetch(
+        self,
+        entry_level_task: asyncio.Task[list[EntryLevelSystem] | None],
+        deadline_at: float,
+    ) -> list[EntryLevelSystem] | None:
+        """Wait for the concurrent entry-level fetch within the refresh deadline.
+
+        The fetch is best-effort, so a hung call must not hold the refresh open
+        past the deadline ``load_data`` was given. On timeout the fetch is
+        cancelled and awaited, and the previous entry-level systems are kept.
+
+        Args:
+            entry_level_task: Fetch started alongside ``load_data``.
+            deadline_at: Event-loop time the refresh deadline expires.
+
+        Returns:
+            list[EntryLevelSystem] | None: Fresh entry-level systems, or None when
+                the fetch failed, was skipped, or ran past the deadline.
+        """
+        try:
+            async with asyncio.timeout_at(deadline_at) as scope:
+                return await asyncio.shield(entry_level_task)
+        except TimeoutError:
+            if not scope.expired():
+                raise
+        _LOGGER.debug("entry-level refresh ran past the refresh deadline; keeping previous data")
+        entry_level_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await entry_level_task
+        return None
 
     async def _async_energy_refresh(self) -> None:
         """Refresh energy data while accounting for failures once per cycle.
@@ -429,13 +625,19 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         for system in self.systems:
             try:
                 energy_response = await async_call_with_retry(
-                    functools.partial(self.api_connection.get_energy, system.profile.serial),
+                    self._authenticated(
+                        functools.partial(self.api_connection.get_energy, system.profile.serial)
+                    ),
                     policy=REFRESH_RETRY_POLICY,
                     state=self.resiliency,
                     operation_name="energy refresh",
                     logger=_LOGGER,
                     manage_unauthorized_state=False,
                     reset_state_on_success=False,
+                    rate_limiter=self.rate_limiter,
+                    request_scheduler=self.request_scheduler,
+                    deadline=REFRESH_DEADLINE_SECONDS,
+                    metrics=self.metrics,
                 )
             except ENERGY_REFRESH_EXCEPTIONS as error:
                 if not is_unauthorized_error(error):
@@ -454,12 +656,13 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             self.resiliency.reset_unauthorized()
             self.resiliency.reset_transient()
             self.timestamp_energy = datetime.now(UTC)
-            self.update_interval = timedelta(minutes=DEFAULT_UPDATE_INTERVAL_MINUTES)
+            self.update_interval = self._steady_update_interval()
 
     async def _async_handle_failed_write(
         self,
         operation_name: str,
         error: CarrierUnauthorizedError,
+        entry_level_serial: str | None = None,
     ) -> NoReturn:
         """Recover from an exhausted unauthorized write and raise a HA error.
 
@@ -472,11 +675,13 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         Args:
             operation_name: Friendly name for the write operation that failed.
             error: Unauthorized error raised after retry handling.
+            entry_level_serial: Entry-level system written, if any; it is
+                reconciled with a scoped read instead of a full refresh.
 
         Raises:
             HomeAssistantError: Raised with a retry-later message.
         """
-        await self._async_reconcile_failed_write(operation_name, error)
+        await self._async_reconcile_failed_write(operation_name, error, entry_level_serial)
 
         # The write crossed the auth threshold, but reconciliation may have
         # already cleared stale counters. Reauth is left to a fresh failed
@@ -487,7 +692,10 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         ) from error
 
     async def _async_reconcile_failed_write(
-        self, operation_name: str, error: BaseException | None = None
+        self,
+        operation_name: str,
+        error: BaseException | None = None,
+        entry_level_serial: str | None = None,
     ) -> None:
         """Refresh coordinator state after a write may have partially applied.
 
@@ -497,10 +705,24 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         refresh owns its own retry accounting: success clears stale counters,
         while continued failures record fresh evidence.
 
+        Entry-level writes only touch one entry-level system, so they reconcile
+        with a scoped read of that system instead of an account-wide refresh;
+        the scheduled poll cycle still owns resiliency accounting.
+
         Args:
             operation_name: Friendly name for the write operation that failed.
             error: Exception raised by the failed write, if available.
+            entry_level_serial: Entry-level system written, if any.
         """
+        if entry_level_serial is not None:
+            if not await self.async_confirm_entry_level_system(entry_level_serial):
+                _LOGGER.debug(
+                    "scoped read after failed %s write could not confirm %s",
+                    operation_name,
+                    entry_level_serial,
+                )
+            return
+
         if error is not None and (
             is_unauthorized_error(error)
             or isinstance(error, RECOVERABLE_WRITE_COMMUNICATION_EXCEPTIONS)
@@ -528,6 +750,7 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         self,
         operation_name: str,
         request: Callable[[], Awaitable[Any]],
+        entry_level_serial: str | None = None,
     ) -> Any:
         """Execute a Carrier write call via the centralized retry helper.
 
@@ -535,24 +758,32 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             operation_name: Friendly name for the write operation, used in logs
                 and user-facing error messages.
             request: Awaitable callback that performs the Carrier API write.
+            entry_level_serial: Serial of the entry-level system being written,
+                so a failure reconciles only that system.
 
         Returns:
             Any: The result returned by the Carrier API request callback.
 
         Raises:
             HomeAssistantError: Raised after retry and refresh recovery are
-                exhausted for retryable failures or for non-retryable failures.
+                exhausted for retryable failures, for non-retryable failures,
+                or immediately while the circuit breaker is open.
         """
         try:
             return await async_call_with_retry(
-                request,
+                self._authenticated(request),
                 policy=WRITE_RETRY_POLICY,
                 state=self.resiliency,
                 operation_name=operation_name,
                 logger=_LOGGER,
+                rate_limiter=self.rate_limiter,
+                request_scheduler=self.request_scheduler,
+                priority=RequestPriority.INTERACTIVE,
+                metrics=self.metrics,
+                deadline=WRITE_DEADLINE_SECONDS,
             )
         except CarrierUnauthorizedError as error:
-            await self._async_handle_failed_write(operation_name, error)
+            await self._async_handle_failed_write(operation_name, error, entry_level_serial)
             raise AssertionError("unreachable after failed write handling") from error
         except (
             asyncio.CancelledError,
@@ -560,13 +791,17 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             SystemExit,
         ):
             raise
+        except CarrierCircuitOpenError as error:
+            raise HomeAssistantError(
+                "Carrier service is currently unavailable — try again in a few minutes."
+            ) from error
         except RECOVERABLE_WRITE_COMMUNICATION_EXCEPTIONS as error:
-            await self._async_reconcile_failed_write(operation_name, error)
+            await self._async_reconcile_failed_write(operation_name, error, entry_level_serial)
             raise HomeAssistantError(
                 "Failed to communicate with Carrier service — operation could not be completed."
             ) from error
         except CarrierApiError as error:
-            await self._async_reconcile_failed_write(operation_name, error)
+            await self._async_reconcile_failed_write(operation_name, error, entry_level_serial)
             raise HomeAssistantError(
                 "Carrier rejected the request. Check the requested setting and try again."
             ) from error
@@ -585,19 +820,249 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
                 return system
         return None
 
-    async def _refresh_entry_level_systems(self) -> None:
-        """Refresh entry-level (Smart Thermostat) systems as a best-effort step.
+    async def _async_fetch_entry_level_systems(
+        self, priority: RequestPriority = RequestPriority.BACKGROUND
+    ) -> list[EntryLevelSystem] | None:
+        """Fetch entry-level (Smart Thermostat) systems as a best-effort step.
 
         Entry-level data is independent of the Infinity systems and websocket
         path, so a failure here is logged and swallowed rather than failing the
-        whole refresh.
+        whole refresh. While the circuit breaker is not closed the fetch is
+        skipped so it does not compete with the breaker's single probe.
+
+        A system written while the fetch was in flight keeps its current local
+        copy: the response predates the write and would overwrite the
+        optimistic state with the old value.
+
+        Args:
+            priority: Request-scheduler lane; confirm-reads jump background polls.
+
+        Returns:
+            list[EntryLevelSystem] | None: Fresh entry-level systems, or None
+                when the fetch failed or was skipped and the previous data
+                should be kept.
         """
+        if self.resiliency.breaker_state is not BreakerState.CLOSED:
+            _LOGGER.debug("skipping entry-level refresh while the circuit breaker is open")
+            return None
+        generations = dict(self._entry_level_write_generations)
         try:
-            self.entry_level_systems = await self.api_connection.load_entry_level_data()
+            fresh_entry_level_systems = await self._async_load_entry_level_data(priority)
         except asyncio.CancelledError, KeyboardInterrupt, SystemExit:
             raise
         except (CarrierApiError, *RECOVERABLE_REFRESH_EXCEPTIONS) as error:
             _LOGGER.debug("Carrier entry-level refresh failed (non-fatal): %s", error)
+            return None
+        current = {system.serial: system for system in self.entry_level_systems}
+        return [
+            current[system.serial]
+            if system.serial in current
+            and self._entry_level_write_generations.get(system.serial, 0)
+            != generations.get(system.serial, 0)
+            else system
+            for system in fresh_entry_level_systems
+        ]
+
+    async def _async_load_entry_level_data(
+        self, priority: RequestPriority
+    ) -> list[EntryLevelSystem]:
+        """Call ``load_entry_level_data`` through the centralized retry helper.
+
+        The fetch is one part of a poll cycle rather than a cycle of its own, so
+        a success does not clear shared resiliency counters and 401s are left to
+        the Infinity refresh and writes to escalate.
+
+        Args:
+            priority: Request-scheduler lane for the call.
+
+        Returns:
+            list[EntryLevelSystem]: Entry-level systems returned by Carrier.
+        """
+        return await async_call_with_retry(
+            self._authenticated(self.api_connection.load_entry_level_data),
+            policy=REFRESH_RETRY_POLICY,
+            state=self.resiliency,
+            operation_name="entry-level refresh",
+            logger=_LOGGER,
+            manage_unauthorized_state=False,
+            reset_state_on_success=False,
+            rate_limiter=self.rate_limiter,
+            request_scheduler=self.request_scheduler,
+            priority=priority,
+            deadline=REFRESH_DEADLINE_SECONDS,
+            metrics=self.metrics,
+        )
+
+    def _entry_level_poll_delay(self) -> float:
+        """Return seconds until the next entry-level poll.
+
+        Polls are fast for a short window after a write so the written value is
+        confirmed quickly, moderate while any zone is actively heating or
+        cooling, and slow when every zone is idle.
+
+        Returns:
+            float: Delay in seconds before the next entry-level poll.
+        """
+        if (
+            self._entry_level_fast_until is not None
+            and datetime.now(UTC) < self._entry_level_fast_until
+        ):
+            return float(ENTRY_LEVEL_POST_WRITE_POLL_SECONDS)
+        for system in self.entry_level_systems:
+            for zone in system.zones:
+                stage = (zone.stage_status or "").lower()
+                if "heat" in stage or "cool" in stage:
+                    return float(ENTRY_LEVEL_ACTIVE_POLL_SECONDS)
+        return float(ENTRY_LEVEL_IDLE_POLL_SECONDS)
+
+    @callback
+    def async_start_entry_level_polling(self) -> None:
+        """Enable the entry-level poll lane.
+
+        Polls are scheduled only while the account has entry-level systems; a
+        full refresh that first finds some starts them.
+        """
+        self._entry_level_polling = True
+        self._async_schedule_entry_level_poll()
+
+    @callback
+    def async_stop_entry_level_polling(self) -> None:
+        """Stop the entry-level poll lane and cancel the pending poll."""
+        self._entry_level_polling = False
+        if self._entry_level_unsub is not None:
+            self._entry_level_unsub()
+            self._entry_level_unsub = None
+
+    @callback
+    def _async_schedule_entry_level_poll(self, delay: float | None = None) -> None:
+        """(Re)schedule the next entry-level poll.
+
+        Args:
+            delay: Seconds until the poll; defaults to the current cadence.
+        """
+        if self._entry_level_unsub is not None:
+            self._entry_level_unsub()
+            self._entry_level_unsub = None
+        if not self._entry_level_polling or not self.entry_level_systems:
+            return
+        self._entry_level_unsub = async_call_later(
+            self.hass,
+            self._entry_level_poll_delay() if delay is None else delay,
+            HassJob(self._async_entry_level_poll, cancel_on_shutdown=True),
+        )
+
+    async def _async_entry_level_poll(self, _now: datetime) -> None:
+        """Run one scheduled entry-level poll and schedule the next one.
+
+        Polls in the post-write window confirm the write, so they queue in the
+        confirm-read lane ahead of background refreshes.
+        """
+        self._entry_level_unsub = None
+        priority = (
+            RequestPriority.CONFIRM
+            if self._entry_level_fast_until is not None
+            and datetime.now(UTC) < self._entry_level_fast_until
+            else RequestPriority.BACKGROUND
+        )
+        try:
+            await self.async_refresh_entry_level_systems(priority)
+        finally:
+            self._async_schedule_entry_level_poll()
+
+    @callback
+    def begin_entry_level_fast_poll(self, first_delay: float | None = None) -> None:
+        """Switch the entry-level lane to its fast cadence after a write.
+
+        Args:
+            first_delay: Seconds until the first fast poll; defaults to the
+                fast cadence.
+        """
+        self._entry_level_fast_until = datetime.now(UTC) + ENTRY_LEVEL_POST_WRITE_FAST_POLL
+        self._async_schedule_entry_level_poll(first_delay)
+
+    @callback
+    def async_note_entry_level_write(self, serial: str) -> None:
+        """Protect an optimistic entry-level write and confirm it with the fast poll.
+
+        Bumping the system's write generation makes any read already in flight
+        keep the local copy of this system instead of its pre-write value. The
+        first fast poll then acts as the confirm-read, replacing the optimistic
+        state with what Carrier actually kept; a repeat write restarts its delay
+        so a burst of changes is confirmed by one read.
+
+        Args:
+            serial: Entry-level system that was just written.
+        """
+        self._entry_level_write_generations[serial] = (
+            self._entry_level_write_generations.get(serial, 0) + 1
+        )
+        self.begin_entry_level_fast_poll(ENTRY_LEVEL_CONFIRM_READ_DELAY_SECONDS)
+
+    async def async_refresh_entry_level_systems(
+        self, priority: RequestPriority = RequestPriority.BACKGROUND
+    ) -> bool:
+        """Refresh only entry-level systems and notify their entities.
+
+        Only ``load_entry_level_data`` is called; the Infinity payload is left
+        to websocket updates and the regular poll cycle.
+
+        Args:
+            priority: Request-scheduler lane for the read.
+
+        Returns:
+            bool: True when fresh entry-level data was applied.
+        """
+        fresh_entry_level_systems = await self._async_fetch_entry_level_systems(priority)
+        if fresh_entry_level_systems is None:
+            return False
+        self.entry_level_systems = fresh_entry_level_systems
+        self.async_update_entry_level_listeners()
+        return True
+
+    @callback
+    def async_update_entry_level_listeners(self) -> None:
+        """Notify only the entities of entry-level systems.
+
+        Entry-level entities register with their system serial as listener
+        context, so Infinity entities are not rewritten by entry-level polls.
+        """
+        serials = {system.serial for system in self.entry_level_systems}
+        with self.cycle_profiler.capture():
+            for update_callback, context in list(self._listeners.values()):
+                if context in serials:
+                    update_callback()
+            self.cycle_profiler.cycle_finished()
+
+    async def async_confirm_entry_level_system(self, serial: str) -> bool:
+        """Replace one entry-level system with Carrier's current copy.
+
+        Reconciles a failed write that Carrier may still have applied. Other
+        entry-level systems in the same response are left to the poll lane.
+
+        Args:
+            serial: Entry-level system to read back.
+
+        Returns:
+            bool: True when the system was found and its state replaced.
+        """
+        fresh_entry_level_systems = await self._async_fetch_entry_level_systems(
+            RequestPriority.CONFIRM
+        )
+        if fresh_entry_level_systems is None:
+            return False
+        confirmed = next(
+            (system for system in fresh_entry_level_systems if system.serial == serial), None
+        )
+        if confirmed is None:
+            return False
+        for index, system in enumerate(self.entry_level_systems):
+            if system.serial == serial:
+                self.entry_level_systems[index] = confirmed
+                break
+        else:
+            return False
+        self.async_update_entry_level_listeners()
+        return True
 
     def entry_level_system(self, serial: str) -> EntryLevelSystem | None:
         """Return the tracked entry-level system matching a serial.
@@ -632,27 +1097,125 @@ class CarrierDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
             raise TypeError("carrier_api System serializer returned a non-mapping payload")
         return dict(mapped_data)
 
-    async def updated_callback(self, _message: str) -> None:
+    async def async_handle_websocket_message(self, websocket_message: str) -> None:
+        """Apply one websocket message and publish it to Home Assistant.
+
+        This is the only callback registered on the websocket client, so the
+        merge and the fan-out of one message are timed together.
+
+        Args:
+            websocket_message: Raw websocket payload string.
+        """
+        started = time.monotonic()
+        message = parse_websocket_message(websocket_message)
+        await self.async_apply_websocket_message(websocket_message, message)
+        device_id = None if message is None else message.get("deviceId")
+        await self.updated_callback(
+            websocket_message,
+            started=started,
+            systems=(system for system in self.systems if system.profile.serial == device_id),
+        )
+
+    async def async_apply_websocket_message(
+        self, websocket_message: str, message: Mapping[str, Any] | None
+    ) -> None:
+        """Merge a websocket message into the systems and time the merge.
+
+        Wraps carrier_api's ``WebsocketDataUpdater.message_handler`` so the
+        merge and Carrier-to-apply lag are measured; `updated_callback` times
+        the rest of the message. The journal, the trace recorder, and the lag
+        measurement share ``message`` instead of parsing the text again.
+
+        Args:
+            websocket_message: Raw websocket payload string for carrier_api.
+            message: The same message parsed, or None when it is not a JSON
+                object.
+        """
+        if self.websocket_data_updater is None:
+            return
+        if self.websocket_recorder.active:
+            self.websocket_recorder.record(message)
+        self.journal.record_message(message)
+        merge_started = time.monotonic()
+        try:
+            # message_handler never awaits, so the capture covers only the merge.
+            with self.cycle_profiler.capture():
+                await self.websocket_data_updater.message_handler(websocket_message)
+        finally:
+            self.metrics.record_websocket_stage(
+                WEBSOCKET_STAGE_MESSAGE_HANDLER, time.monotonic() - merge_started
+            )
+        produced_at = None if message is None else carrier_message_timestamp(message)
+        if produced_at is not None:
+            self.metrics.record_websocket_stage(
+                WEBSOCKET_STAGE_CARRIER_LAG,
+                (datetime.now(UTC) - produced_at).total_seconds(),
+            )
+
+    def _record_websocket_message_cost(self, seconds: float) -> None:
+        """Record the total event-loop time one websocket message took.
+
+        Args:
+            seconds: Time from the start of the merge to the end of listener
+                fan-out.
+        """
+        self.metrics.record_websocket_stage(WEBSOCKET_STAGE_TOTAL, seconds)
+        if seconds > WEBSOCKET_SLOW_CALLBACK_SECONDS:
+            self.metrics.slow_websocket_messages += 1
+            _LOGGER.warning(
+                "handling a Carrier websocket message blocked the event loop for %.3f seconds",
+                seconds,
+            )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify entities; each fan-out ends one cycle for the cycle profiler."""
+        with self.cycle_profiler.capture():
+            super().async_update_listeners()
+            self.cycle_profiler.cycle_finished()
+
+    async def updated_callback(
+        self,
+        _message: str,
+        started: float | None = None,
+        systems: Iterable[System] | None = None,
+    ) -> None:
         """Handle websocket updates and notify Home Assistant listeners.
 
         Args:
             _message: Raw websocket payload string (unused after callback wiring).
+            started: Monotonic time the message started being handled, from
+                `async_handle_websocket_message`; defaults to now.
+            systems: Systems the message changed, whose debug snapshots are
+                logged; defaults to every system.
 
         Returns:
             None: Listener state is refreshed in-place.
         """
-        self.timestamp_websocket = datetime.now(UTC)
-        _LOGGER.debug("websocket updated system")
-        if _LOGGER.isEnabledFor(logging.DEBUG):
-            for system in self.systems:
-                _LOGGER.debug(
-                    "%s",
-                    async_redact_data(self.mapped_system_data(system), TO_REDACT_MAPPED),
+        with self.cycle_profiler.capture():
+            if started is None:
+                started = time.monotonic()
+            self.timestamp_websocket = datetime.now(UTC)
+            self.metrics.record_websocket_message()
+            _LOGGER.debug("websocket updated system")
+            if self.debug_snapshots.enabled:
+                self.debug_snapshots.async_log(
+                    self.hass, self.systems if systems is None else systems
                 )
-        if self._in_post_write_intercept():
-            # Re-assert any control field (mode / set point) the cloud reverted
-            # back to the intended post-write value. The message is still
-            # published normally below, so every other field and zone in the
-            # same websocket message reaches Home Assistant.
-            self._reassert_control()
-        self.async_update_listeners()
+            if self._in_post_write_intercept():
+                # Re-assert any control field (mode / set point) the cloud reverted
+                # back to the intended post-write value. The message is still
+                # published normally below, so every other field and zone in the
+                # same websocket message reaches Home Assistant.
+                reassert_started = time.monotonic()
+                self._reassert_control()
+                self.metrics.record_websocket_stage(
+                    WEBSOCKET_STAGE_REASSERT_CONTROL, time.monotonic() - reassert_started
+                )
+            fanout_started = time.monotonic()
+            self.async_update_listeners()
+            finished = time.monotonic()
+            self.metrics.record_websocket_stage(
+                WEBSOCKET_STAGE_LISTENER_FANOUT, finished - fanout_started
+            )
+            self._record_websocket_message_cost(finished - started)
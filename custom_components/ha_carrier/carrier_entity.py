@@ -1,6 +1,7 @@
 """Shared entity base for Carrier systems and zones."""
 
 import logging
+import time
 
 from carrier_api import ConfigZone, StatusZone, System
 from homeassistant.core import callback
@@ -64,7 +65,12 @@ class CarrierEntity(CoordinatorEntity[CarrierDataUpdateCoordinator]):
         ``KeyError``/``TypeError`` raised while reading them is treated as
         "data not ready yet" — the entity is flipped to unavailable instead of
         bubbling the error up into Home Assistant's update pipeline.
+
+        While the coordinator's entity profiler is enabled, each sync is timed
+        and charged to this entity's class and unique ID.
         """
+        profiler = self.coordinator.entity_profiler
+        started = time.perf_counter() if profiler.enabled else None
         try:
             self._update_entity_attrs()
         except (ValueError, AttributeError, KeyError, TypeError) as error:
@@ -75,6 +81,13 @@ class CarrierEntity(CoordinatorEntity[CarrierDataUpdateCoordinator]):
                 error,
             )
             self._attr_available = False
+        finally:
+            if started is not None:
+                profiler.record(
+                    type(self).__name__,
+                    str(self._attr_unique_id),
+                    time.perf_counter() - started,
+                )
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -13,9 +13,11 @@ import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 
 from .const import (
+    CONF_DIAGNOSTICS_SECTIONS,
     CONF_INFINITE_HOLDS,
     CONFIG_FLOW_VERSION,
     DEFAULT_INFINITE_HOLDS,
+    DIAGNOSTICS_SECTIONS,
     DOMAIN,
     ERROR_AUTH,
     ERROR_CANNOT_CONNECT,
@@ -328,6 +330,14 @@ class CarrierOptionsFlow(OptionsFlow):
                     CONF_INFINITE_HOLDS,
                     default=config_entry.options.get(CONF_INFINITE_HOLDS, DEFAULT_INFINITE_HOLDS),
                 ): cv.boolean,
+                vol.Optional(
+                    CONF_DIAGNOSTICS_SECTIONS,
+                    description={
+                        "suggested_value": config_entry.options.get(
+                            CONF_DIAGNOSTICS_SECTIONS, list(DIAGNOSTICS_SECTIONS)
+                        )
+                    },
+                ): cv.multi_select(list(DIAGNOSTICS_SECTIONS)),
             }
         )
 
@@ -18,6 +18,7 @@ PLATFORMS: list[Platform] = [
 
 CONF_INFINITE_HOLDS: str = "infinite_holds"
 DEFAULT_INFINITE_HOLDS: bool = True
+CONF_DIAGNOSTICS_SECTIONS: str = "diagnostics_sections"
 
 FAN_AUTO = "auto"
 
@@ -36,6 +37,8 @@ TO_REDACT_RAW: set[str] = {
     "href",
     "weatherPostalCode",
 }
+# Websocket messages name the system serial as deviceId.
+TO_REDACT_WEBSOCKET: set[str] = {*TO_REDACT_RAW, "deviceId"}
 TO_REDACT_DEVICE: set[str] = {"identifiers"}
 TO_REDACT_ENTITIES: set[str] = set()
 
@@ -57,6 +60,18 @@ FULL_RECONCILE_INTERVAL_MINUTES: int = DEFAULT_UPDATE_INTERVAL_MINUTES * 4
 # stale value. The stale replay is forward-timestamped, so it cannot be told
 # apart by content — the window is the only reliable discriminator.
 POST_WRITE_INTERCEPT_WINDOW_MINUTES: int = 5
+# Entry-level (Smart Thermostat) systems have no websocket path, so they get their
+# own cheap poll lane that only calls load_entry_level_data. It runs fast right
+# after a write, moderately while a zone is actively heating or cooling, and
+# slowly when idle; the full reconcile still refreshes them too.
+ENTRY_LEVEL_POST_WRITE_POLL_SECONDS: int = 20
+ENTRY_LEVEL_POST_WRITE_FAST_POLL_MINUTES: int = 2
+ENTRY_LEVEL_ACTIVE_POLL_SECONDS: int = 120
+ENTRY_LEVEL_IDLE_POLL_SECONDS: int = 600
+# The first fast poll after an entry-level write runs this long after it and
+# confirms the write, giving Carrier time to apply it before its value replaces
+# the optimistic one.
+ENTRY_LEVEL_CONFIRM_READ_DELAY_SECONDS: int = 10
 UNAUTHORIZED_RETRY_THRESHOLD: int = 3
 MAX_WRITE_ATTEMPTS: int = 2
 
@@ -65,6 +80,9 @@ WEBSOCKET_RETRY_MAX_DELAY_SECONDS: int = 30
 
 # Resiliency
 TRANSIENT_FAILURE_THRESHOLD: int = 5
+# Once transient failures escalate, the circuit breaker stops refreshes, writes,
+# and websocket reconnects for this long, then lets a single probe through.
+CIRCUIT_BREAKER_OPEN_SECONDS: int = 120
 RETRY_JITTER_FRACTION: float = 0.25
 WRITE_RETRY_BASE_DELAY_SECONDS: float = 1.0
 WRITE_RETRY_MAX_DELAY_SECONDS: float = 4.0
@@ -72,6 +90,98 @@ REFRESH_RETRY_BASE_DELAY_SECONDS: float = 1.0
 REFRESH_RETRY_MAX_DELAY_SECONDS: float = 4.0
 MAX_REFRESH_ATTEMPTS: int = 2
 
+# Retry budget
+# Retries across refresh, write, and websocket paths share one budget per
+# account: within the sliding window they may not exceed this fraction of
+# first attempts, plus a small floor so a quiet account can still retry.
+RETRY_BUDGET_WINDOW_SECONDS: float = 600.0
+RETRY_BUDGET_RATIO: float = 0.2
+RETRY_BUDGET_MIN_RETRIES: int = 3
+
+# Latency-aware timeouts
+# Each attempt in async_call_with_retry is capped at a multiple of the recent p95
+# latency of that operation (clamped to the bounds below). Until enough samples
+# exist the default applies. Callers also pass an end-to-end deadline that
+# retries, backoff, and rate-limit waits must all fit inside.
+LATENCY_WINDOW_SIZE: int = 50
+LATENCY_MIN_SAMPLES: int = 5
+LATENCY_TIMEOUT_PERCENTILE: float = 0.95
+LATENCY_TIMEOUT_MULTIPLIER: float = 3.0
+ATTEMPT_TIMEOUT_DEFAULT_SECONDS: float = 30.0
+ATTEMPT_TIMEOUT_MIN_SECONDS: float = 10.0
+ATTEMPT_TIMEOUT_MAX_SECONDS: float = 60.0
+REFRESH_DEADLINE_SECONDS: float = 90.0
+WRITE_DEADLINE_SECONDS: float = 30.0
+
+# Instrumentation
+# Recent refresh-cycle and websocket-stage latencies kept per name (API attempt
+# latency shares LATENCY_WINDOW_SIZE with the timeouts), and the window behind
+# the "last hour" call, error, and websocket message rates.
+METRICS_LATENCY_WINDOW_SIZE: int = 200
+METRICS_RATE_WINDOW_SECONDS: float = 3600.0
+# Websocket messages whose handling blocks the event loop longer than this are
+# logged as slow; HA's own asyncio debug mode uses the same 100 ms bar.
+WEBSOCKET_SLOW_CALLBACK_SECONDS: float = 0.1
+# Opt-in per-entity update cost profiling started by the profile_entities
+# service: default and longest window, and how many entities diagnostics list.
+ENTITY_PROFILE_DEFAULT_SECONDS: float = 300.0
+ENTITY_PROFILE_MAX_SECONDS: float = 3600.0
+ENTITY_PROFILE_TOP_N: int = 20
+# cProfile captures started by the profile service: default and largest cycle
+# count, how long to wait for those cycles before writing what was captured,
+# and how many functions the text summary lists.
+PROFILE_CAPTURE_DEFAULT_CYCLES: int = 10
+PROFILE_CAPTURE_MAX_CYCLES: int = 100
+PROFILE_CAPTURE_TIMEOUT_SECONDS: float = 1800.0
+PROFILE_SUMMARY_LINES: int = 60
+# Websocket trace recording started by the record_websocket service: default
+# and longest window, and the most messages kept before recording stops early.
+WEBSOCKET_TRACE_DEFAULT_SECONDS: float = 600.0
+WEBSOCKET_TRACE_MAX_SECONDS: float = 86400.0
+WEBSOCKET_TRACE_MAX_MESSAGES: int = 10000
+# Recorded messages are appended to the trace file in batches of at most this
+# many, or at least this often while messages keep arriving.
+WEBSOCKET_TRACE_FLUSH_MESSAGES: int = 100
+WEBSOCKET_TRACE_FLUSH_SECONDS: float = 30.0
+# With debug logging on, each system's full mapped payload is logged at most
+# this often; websocket messages in between log only the fields they changed.
+DEBUG_SNAPSHOT_INTERVAL_SECONDS: float = 300.0
+# Per-system diagnostics sections the options can leave out (all are included
+# by default), and the largest JSON size one section of one system may have
+# before diagnostics replace it with a note giving its size.
+DIAGNOSTICS_SECTIONS: tuple[str, ...] = ("mapped_data", "raw", "device")
+DIAGNOSTICS_MAX_SECTION_BYTES: int = 512 * 1024
+# Per-entry journal of recent websocket messages and refresh outcomes shown in
+# diagnostics: most entries kept, the cap on the total size of their text, and
+# the longest summary one websocket message is shortened to.
+JOURNAL_MAX_ENTRIES: int = 200
+JOURNAL_MAX_BYTES: int = 64 * 1024
+JOURNAL_MAX_ENTRY_CHARS: int = 1024
+
+# Per-account rate limiting
+# Token buckets in front of every Carrier API call. Reads (refreshes, entry-level
+# polls) and writes (user changes) draw from separate budgets, and queued writes
+# go ahead of queued reads. A 429 pauses both for Retry-After, or the default
+# below when Carrier does not say, capped so a bad header cannot stall the entry.
+RATE_LIMIT_READ_PER_MINUTE: float = 30.0
+RATE_LIMIT_READ_BURST: int = 10
+RATE_LIMIT_WRITE_PER_MINUTE: float = 30.0
+RATE_LIMIT_WRITE_BURST: int = 10
+RATE_LIMIT_THROTTLED_DEFAULT_SECONDS: float = 30.0
+RATE_LIMIT_THROTTLED_MAX_SECONDS: float = 300.0
+
+# Per-account request scheduling
+# Calls in flight at once per account. One slot is held back for interactive
+# writes so background refreshes can never occupy every slot.
+MAX_CONCURRENT_API_CALLS: int = 3
+RESERVED_INTERACTIVE_API_CALLS: int = 1
+
+# Cross-entry scheduling
+# Caps shared by every Carrier config entry so many accounts restarting together
+# do not all log in and pull full payloads at the same instant.
+MAX_CONCURRENT_LOGINS: int = 2
+MAX_CONCURRENT_FULL_REFRESHES: int = 2
+
 # Config flow error keys
 ERROR_AUTH: str = "invalid_auth"
 ERROR_CANNOT_CONNECT: str = "cannot_connect"
@@ -0,0 +1,198 @@
+"""Rate-limited debug logging of Carrier system state.
+
+Logging every system's full mapped payload on every websocket message
+serializes megabytes per minute on the event loop for a busy account.
+`DebugSnapshotLogger` logs a full redacted snapshot of a system at most once
+per ``DEBUG_SNAPSHOT_INTERVAL_SECONDS``. In between, it logs only the fields
+that changed since the previous call as one compact line:
+
+    system Home changed: status.zones.0.temperature=71.0, status.mode='gasheat'
+
+Callers pass only the systems that changed, such as the one a websocket
+message names. The event loop only copies each system's raw payloads to JSON
+bytes; mapping, flattening, comparing, redacting, and formatting run in an
+executor on that copy. Nothing is copied unless the logger is enabled for
+debug, so the snapshot logger costs nothing when debug logging is off.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+import itertools
+import logging
+import threading
+import time
+from typing import Any
+
+from carrier_api import System
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.json import json_loads
+
+from .const import DEBUG_SNAPSHOT_INTERVAL_SECONDS, TO_REDACT_MAPPED
+from .redaction import REDACTED, compile_redactor
+from .util import system_from_raw, system_raw_snapshot
+
+_REDACT_MAPPED = compile_redactor(frozenset(TO_REDACT_MAPPED))
+
+
+def flatten_mapping(data: Any, prefix: str = "") -> dict[str, Any]:
+    """Flatten nested mappings and lists into dotted paths.
+
+    Args:
+        data: Mapped system data, or any nested value inside it.
+        prefix: Path of ``data`` within the outer structure.
+
+    Returns:
+        dict[str, Any]: Leaf values keyed by paths such as
+            ``status.zones.0.temperature``, in depth-first order.
+    """
+    flat: dict[str, Any] = {}
+    # Containers being walked, with the iterator over their children.
+    stack: list[tuple[str, Iterator[tuple[Any, Any]]]] = []
+    path, value = prefix, data
+    while True:
+        if isinstance(value, Mapping):
+            stack.append((path, iter(value.items())))
+        elif isinstance(value, list):
+            stack.append((path, iter(enumerate(value))))
+        else:
+            flat[path] = value
+        while stack:
+            parent, children = stack[-1]
+            if (child := next(children, None)) is not None:
+                key, value = child
+                path = f"{parent}.{key}" if parent else str(key)
+                break
+            stack.pop()
+        else:
+            return flat
+
+
+def changed_fields(previous: Mapping[str, Any], current: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the flattened fields that differ between two snapshots.
+
+    Args:
+        previous: Flattened snapshot from the last call.
+        current: Flattened snapshot now.
+
+    Returns:
+        dict[str, Any]: Changed and added paths with their new values, and
+            removed paths mapped to None.
+    """
+    changes = {path: value for path, value in current.items() if previous.get(path) != value}
+    changes.update(dict.fromkeys(previous.keys() - current.keys()))
+    return changes
+
+
+def redact_paths(fields: Mapping[str, Any], to_redact: Iterable[str]) -> dict[str, Any]:
+    """Redact flattened fields whose path contains a redacted key.
+
+    Args:
+        fields: Flattened fields keyed by dotted path.
+        to_redact: Keys whose values must not be logged.
+
+    Returns:
+        dict[str, Any]: Fields with sensitive values replaced.
+    """
+    redact = set(to_redact)
+    return {
+        path: REDACTED if redact.intersection(path.split(".")) and value is not None else value
+        for path, value in fields.items()
+    }
+
+
+class DebugSnapshotLogger:
+    """Logs full system snapshots on an interval and field diffs in between."""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        interval: float = DEBUG_SNAPSHOT_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize a snapshot logger with no systems seen yet.
+
+        Args:
+            logger: Logger the snapshots and diffs are written to.
+            interval: Minimum seconds between full snapshots of one system.
+        """
+        self.logger = logger
+        self.interval = interval
+        self._sequence = itertools.count()
+        # Written by executor jobs, which may finish out of order.
+        self._lock = threading.Lock()
+        self._previous: dict[str, dict[str, Any]] = {}
+        self._last_full: dict[str, float] = {}
+        self._applied: dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the logger is enabled for debug."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    @callback
+    def async_log(self, hass: HomeAssistant, systems: Iterable[System]) -> None:
+        """Log a snapshot or a field diff for each of ``systems``.
+
+        Args:
+            hass: Home Assistant instance whose executor does the logging.
+            systems: Carrier systems that changed, in their current state.
+        """
+        if not self.enabled:
+            return
+        for system in systems:
+            hass.async_add_executor_job(
+                self._log_system,
+                system.profile.serial,
+                system.profile.name,
+                next(self._sequence),
+                system_raw_snapshot(system),
+            )
+
+    @callback
+    def async_forget(self, serial: str) -> None:
+        """Drop the state kept for a system that left the account.
+
+        Args:
+            serial: Serial of the removed system.
+        """
+        with self._lock:
+            self._previous.pop(serial, None)
+            self._last_full.pop(serial, None)
+            self._applied.pop(serial, None)
+
+    def _log_system(self, serial: str, name: str, sequence: int, snapshot: bytes) -> None:
+        """Log a snapshot or a field diff of one system; runs in an executor.
+
+        Args:
+            serial: Serial of the system.
+            name: System name used to label the log line.
+            sequence: Order in which the snapshot was taken; a job that
+                finishes after a newer one for the same system is dropped.
+            snapshot: Raw payloads copied on the event loop.
+        """
+        mapped = system_from_raw(json_loads(snapshot)).as_dict()
+        current = flatten_mapping(mapped)
+        now = time.monotonic()
+        with self._lock:
+            if sequence < self._applied.get(serial, -1):
+                return
+            self._applied[serial] = sequence
+            previous = self._previous.get(serial)
+            self._previous[serial] = current
+            last_full = self._last_full.get(serial)
+            full = previous is None or last_full is None or now - last_full >= self.interval
+            if full:
+                self._last_full[serial] = now
+        if full or previous is None:
+            self.logger.debug("system %s snapshot: %s", name, _REDACT_MAPPED.redact(mapped))
+            return
+        changes = changed_fields(previous, current)
+        if changes:
+            self.logger.debug(
+                "system %s changed: %s",
+                name,
+                ", ".join(
+                    f"{path}={value!r}"
+                    for path, value in redact_paths(changes, TO_REDACT_MAPPED).items()
+                ),
+            )
@@ -1,16 +1,37 @@
-"""Diagnostics payload builder for the Carrier integration."""
+"""Diagnostics payload builder for the Carrier integration.
+
+Only cheap reads happen on the event loop: each system's raw payloads are
+serialized to JSON bytes there, which is a fast snapshot that later websocket
+merges cannot change, and the device and entity registries are read. Parsing
+the snapshots, mapping them through carrier_api, redacting, and measuring
+section sizes run in an executor.
+
+The options choose which per-system sections (`DIAGNOSTICS_SECTIONS`) are
+included. A section whose JSON is larger than `DIAGNOSTICS_MAX_SECTION_BYTES`
+is replaced by a note with its size. The ``diagnostics`` section records the
+sections included, the ones omitted for size, and how long generation took.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 import logging
+import time
 from typing import Any
 
-from homeassistant.components.diagnostics import async_redact_data
-from homeassistant.core import HomeAssistant
+from carrier_api import System
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 
 from . import ConfigEntryCarrier
+from .carrier_data_update_coordinator import CarrierDataUpdateCoordinator
 from .const import (
+    CONF_DIAGNOSTICS_SECTIONS,
+    DIAGNOSTICS_MAX_SECTION_BYTES,
+    DIAGNOSTICS_SECTIONS,
     DOMAIN,
     TO_REDACT,
     TO_REDACT_DEVICE,
@@ -18,18 +39,192 @@ from .const import (
     TO_REDACT_MAPPED,
     TO_REDACT_RAW,
 )
+from .redaction import compile_redactor
+from .util import SYSTEM_RAW_PARTS, system_from_raw, system_raw_snapshot
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+_REDACT_ENTRY = compile_redactor(frozenset(TO_REDACT))
+_REDACT_MAPPED = compile_redactor(frozenset(TO_REDACT_MAPPED))
+_REDACT_RAW = compile_redactor(frozenset(TO_REDACT_RAW))
+_REDACT_DEVICE = compile_redactor(frozenset(TO_REDACT_DEVICE))
+_REDACT_ENTITIES = compile_redactor(frozenset(TO_REDACT_ENTITIES))
+
+
+@dataclass
+class _SystemSnapshot:
+    """State of one system captured on the event loop.
+
+    Attributes:
+        serial: Carrier system serial.
+        raw: JSON of the profile, status, config, and energy payloads, or None
+            when neither mapped nor raw data was requested.
+        device: Registry device as a dictionary, if the device exists.
+        entities: Registry entries and states keyed by entity ID.
+    """
+
+    serial: str
+    raw: bytes | None = None
+    device: Mapping[str, Any] | None = None
+    entities: dict[str, tuple[Mapping[str, Any], Mapping[str, Any] | None]] = field(
+        default_factory=dict
+    )
+
+
+def _diagnostics_sections(config_entry: ConfigEntryCarrier) -> tuple[str, ...]:
+    """Return the per-system sections the options include, in output order.
+
+    Args:
+        config_entry: Config entry whose diagnostics were requested.
+
+    Returns:
+        tuple[str, ...]: Selected names from `DIAGNOSTICS_SECTIONS`.
+    """
+    selected = config_entry.options.get(CONF_DIAGNOSTICS_SECTIONS, DIAGNOSTICS_SECTIONS)
+    return tuple(section for section in DIAGNOSTICS_SECTIONS if section in selected)
+
+
+@callback
+def _async_snapshot_system(
+    hass: HomeAssistant, carrier_system: System, sections: Iterable[str]
+) -> _SystemSnapshot:
+    """Capture what diagnostics need from one system on the event loop.
+
+    Args:
+        hass: Home Assistant instance.
+        carrier_system: Live Carrier system.
+        sections: Per-system sections to capture.
+
+    Returns:
+        _SystemSnapshot: Snapshot that stays valid while the system changes.
+    """
+    sections = set(sections)
+    snapshot = _SystemSnapshot(serial=str(carrier_system.profile.serial))
+    if sections & {"mapped_data", "raw"}:
+        snapshot.raw = system_raw_snapshot(carrier_system)
+    if "device" not in sections:
+        return snapshot
+
+    hass_device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, snapshot.serial)})
+    if hass_device is None:
+        return snapshot
+    snapshot.device = hass_device.dict_repr
+    for entity_entry in er.async_entries_for_device(
+        er.async_get(hass), device_id=hass_device.id, include_disabled_entities=True
+    ):
+        state = hass.states.get(entity_entry.entity_id)
+        snapshot.entities[entity_entry.entity_id] = (
+            entity_entry.as_partial_dict,
+            state.as_dict() if state else None,
+        )
+    return snapshot
+
+
+def _bounded(section: Any, label: str, omitted: list[str]) -> Any:
+    """Return ``section``, or a size note when its JSON exceeds the cap.
+
+    Args:
+        section: Redacted section data.
+        label: Name of the section recorded in ``omitted``.
+        omitted: Labels of sections replaced so far; appended to.
+
+    Returns:
+        Any: ``section`` itself or a note giving its size.
+    """
+    size = len(json_bytes(section))
+    if size <= DIAGNOSTICS_MAX_SECTION_BYTES:
+        return section
+    omitted.append(label)
+    return {
+        "omitted": f"larger than {DIAGNOSTICS_MAX_SECTION_BYTES} bytes",
+        "size_bytes": size,
+    }
+
+
+def _build_system_diagnostics(
+    snapshot: _SystemSnapshot, sections: Iterable[str], omitted: list[str]
+) -> dict[str, Any]:
+    """Build the redacted, size-bounded diagnostics of one system.
+
+    Runs in an executor; it only touches the snapshot.
+
+    Args:
+        snapshot: State captured on the event loop.
+        sections: Per-system sections to include.
+        omitted: Labels of sections replaced for size; appended to.
+
+    Returns:
+        dict[str, Any]: Diagnostics of the system.
+    """
+    sections = set(sections)
+    system_data: dict[str, Any] = {}
+    if snapshot.raw is not None:
+        raw = json_loads(snapshot.raw)
+        if "mapped_data" in sections:
+            system_data["mapped_data"] = _REDACT_MAPPED.redact(
+                CarrierDataUpdateCoordinator.mapped_system_data(system_from_raw(raw))
+            )
+        if "raw" in sections:
+            for part in SYSTEM_RAW_PARTS:
+                system_data[f"{part}_raw"] = _REDACT_RAW.redact(raw[part])
+
+    if snapshot.device is not None:
+        system_data["device"] = {
+            **_REDACT_DEVICE.redact(snapshot.device),
+            "entities": {},
+        }
+        for entity_id, (entity_dict, state) in snapshot.entities.items():
+            entity_data = dict(entity_dict)
+            entity_data.pop("entity_id", None)
+            state_dict = None
+            if state is not None:
+                state_dict = dict(state)
+                # The entity_id is already provided at root level.
+                state_dict.pop("entity_id", None)
+                # The context doesn't provide useful information in this case.
+                state_dict.pop("context", None)
+            system_data["device"]["entities"][entity_id] = {
+                **_REDACT_ENTITIES.redact(entity_data),
+                "state": state_dict,
+            }
+
+    return {
+        key: _bounded(value, f"{snapshot.serial}.{key}", omitted)
+        for key, value in system_data.items()
+    }
+
+
+def _build_systems_diagnostics(
+    snapshots: list[_SystemSnapshot], sections: tuple[str, ...]
+) -> tuple[dict[str, dict[str, Any]], list[str]]:
+    """Build the diagnostics of every system; runs in an executor.
+
+    Args:
+        snapshots: State of each system captured on the event loop.
+        sections: Per-system sections to include.
+
+    Returns:
+        tuple[dict[str, dict[str, Any]], list[str]]: Diagnostics keyed by
+            serial, and the labels of sections replaced for size.
+    """
+    omitted: list[str] = []
+    systems = {
+        snapshot.serial: _build_system_diagnostics(snapshot, sections, omitted)
+        for snapshot in snapshots
+    }
+    return systems, omitted
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: ConfigEntryCarrier
 ) -> dict[str, dict[str, Any]]:
     """Collect redacted integration diagnostics for a config entry.
 
-    The diagnostics include config entry data, mapped system snapshots, raw
-    Carrier payloads, and Home Assistant device/entity state linked to each
-    Carrier serial.
+    The diagnostics include config entry data, API resiliency state (circuit
+    breaker and retry budget usage), API call counts and latency, the journal
+    of recent websocket messages and refresh outcomes, and the selected
+    per-system sections: mapped system snapshots, raw Carrier payloads, and
+    Home Assistant device/entity state linked to each Carrier serial.
 
     Args:
         hass: Home Assistant instance.
@@ -39,54 +234,32 @@ async def async_get_config_entry_diagnostics(
         dict[str, dict[str, Any]]: Redacted diagnostics keyed by section name
         and system serial.
     """
+    started = time.perf_counter()
     updater = config_entry.runtime_data
-    data = {
-        "entry": async_redact_data(config_entry.as_dict(), TO_REDACT),
+    sections = _diagnostics_sections(config_entry)
+    data: dict[str, dict[str, Any]] = {
+        "entry": _REDACT_ENTRY.redact(config_entry.as_dict()),
+        "resiliency": {
+            "breaker_state": updater.resiliency.breaker_state,
+            "retry_budget": updater.resiliency.retry_budget.as_dict(),
+        },
+        "api_metrics": updater.metrics.as_dict(),
+        "entity_profile": updater.entity_profiler.as_dict(),
+        "journal": updater.journal.as_dict(),
+    }
+    snapshots = [
+        _async_snapshot_system(hass, carrier_system, sections) for carrier_system in updater.systems
+    ]
+    loop_seconds = time.perf_counter() - started
+    systems, omitted = await hass.async_add_executor_job(
+        _build_systems_diagnostics, snapshots, sections
+    )
+    data.update(systems)
+    data["diagnostics"] = {
+        "sections": list(sections),
+        "omitted_for_size": omitted,
+        "max_section_bytes": DIAGNOSTICS_MAX_SECTION_BYTES,
+        "event_loop_seconds": round(loop_seconds, 6),
+        "generation_seconds": round(time.perf_counter() - started, 6),
     }
-    for carrier_system in updater.systems:
-        system_data = {
-            "mapped_data": async_redact_data(
-                updater.mapped_system_data(carrier_system), TO_REDACT_MAPPED
-            ),
-            "profile_raw": async_redact_data(carrier_system.profile.raw, TO_REDACT_RAW),
-            "status_raw": async_redact_data(carrier_system.status.raw, TO_REDACT_RAW),
-            "config_raw": async_redact_data(carrier_system.config.raw, TO_REDACT_RAW),
-            "energy_raw": async_redact_data(carrier_system.energy.raw, TO_REDACT_RAW),
-        }
-        data[carrier_system.profile.serial] = system_data
-
-        device_registry = dr.async_get(hass)
-        entity_registry = er.async_get(hass)
-        hass_device = device_registry.async_get_device(
-            identifiers={(DOMAIN, str(carrier_system.profile.serial))}
-        )
-        if hass_device is not None:
-            system_data["device"] = {
-                **async_redact_data(hass_device.dict_repr, TO_REDACT_DEVICE),
-                "entities": {},
-            }
-
-            hass_entities = er.async_entries_for_device(
-                entity_registry,
-                device_id=hass_device.id,
-                include_disabled_entities=True,
-            )
-
-            for entity_entry in hass_entities:
-                state = hass.states.get(entity_entry.entity_id)
-                state_dict = None
-                entity_data = dict(entity_entry.as_partial_dict)
-                entity_data.pop("entity_id", None)
-                if state:
-                    state_dict = dict(state.as_dict())
-                    # The entity_id is already provided at root level.
-                    state_dict.pop("entity_id", None)
-                    # The context doesn't provide useful information in this case.
-                    state_dict.pop("context", None)
-
-                system_data["device"]["entities"][entity_entry.entity_id] = {
-                    **async_redact_data(entity_data, TO_REDACT_ENTITIES),
-                    "state": state_dict,
-                }
-
     return data
@@ -218,10 +218,12 @@ class EntryLevelThermostat(CoordinatorEntity[CarrierDataUpdateCoordinator], Clim
                 cool_set_point=cool_set_point,
                 heat_set_point=heat_set_point,
             ),
+            entry_level_serial=self._serial,
         )
         zone.cool_set_point = cool_set_point
         zone.heat_set_point = heat_set_point
         self.async_write_ha_state()
+        self.coordinator.async_note_entry_level_write(self._serial)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the HVAC mode.
@@ -243,11 +245,13 @@ class EntryLevelThermostat(CoordinatorEntity[CarrierDataUpdateCoordinator], Clim
                 self._index,
                 mode=mode,
             ),
+            entry_level_serial=self._serial,
         )
         zone = self._zone
         if zone is not None:
             zone.mode = mode
         self.async_write_ha_state()
+        self.coordinator.async_note_entry_level_write(self._serial)
 
     async def async_turn_off(self) -> None:
         """Turn the thermostat off."""
@@ -1,7 +1,16 @@
 """Carrier-specific exception types shared across integration modules."""
 
+from carrier_api import CarrierApiConnectionError
 from homeassistant.exceptions import HomeAssistantError
 
 
 class CarrierUnauthorizedError(HomeAssistantError):
     """Raised when 401 responses persist beyond the unauthorized threshold."""
+
+
+class CarrierCircuitOpenError(CarrierApiConnectionError):
+    """Raised instead of calling Carrier while the shared circuit breaker is open."""
+
+
+class CarrierDeadlineExceededError(CarrierApiConnectionError):
+    """Raised when a Carrier call cannot start or retry inside its caller's deadline."""
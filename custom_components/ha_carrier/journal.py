@@ -0,0 +1,159 @@
+"""Bounded journal of recent websocket messages and refresh outcomes.
+
+When an entity shows a surprising value, diagnostics should say which
+messages led up to it without debug logging having been on. `MessageJournal`
+keeps the last `JOURNAL_MAX_ENTRIES` events of one config entry in a ring
+buffer. A websocket message is already a partial update, so its entry is a
+compact, redacted one-line summary of the fields it set:
+
+    zones.0.rt=71.0, zones.0.rh=40, oat=30
+
+Summaries longer than `JOURNAL_MAX_ENTRY_CHARS` characters are shortened, and
+the oldest entries are dropped while the stored text exceeds `JOURNAL_MAX_BYTES`
+once UTF-8 encoded, so the journal's memory stays fixed however busy the
+account is.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from .const import (
+    JOURNAL_MAX_BYTES,
+    JOURNAL_MAX_ENTRIES,
+    JOURNAL_MAX_ENTRY_CHARS,
+    TO_REDACT_WEBSOCKET,
+)
+from .debug_snapshots import flatten_mapping, redact_paths
+
+JOURNAL_KIND_WEBSOCKET = "websocket"
+JOURNAL_KIND_REFRESH = "refresh"
+
+# Websocket fields that identify the message rather than change state.
+_MESSAGE_METADATA: frozenset[str] = frozenset({"messageType", "deviceId"})
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    """One journaled event.
+
+    Attributes:
+        at: Wall-clock time of the event as a POSIX timestamp.
+        kind: `JOURNAL_KIND_WEBSOCKET` or `JOURNAL_KIND_REFRESH`.
+        label: Websocket message type, or the refresh kind.
+        detail: Summary of the fields a message set, or the refresh outcome.
+    """
+
+    at: float
+    kind: str
+    label: str
+    detail: str
+
+    @property
+    def size(self) -> int:
+        """Return the UTF-8 bytes of text this entry holds."""
+        return len(self.label.encode()) + len(self.detail.encode())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly snapshot for diagnostics."""
+        return {
+            "at": datetime.fromtimestamp(self.at, UTC).isoformat(),
+            "kind": self.kind,
+            "label": self.label,
+            "detail": self.detail,
+        }
+
+
+def summarize_message(message: Mapping[str, Any]) -> str:
+    """Return the redacted one-line summary of a websocket message.
+
+    Args:
+        message: Parsed websocket message.
+
+    Returns:
+        str: ``path=value`` pairs for every field the message sets, shortened
+            to `JOURNAL_MAX_ENTRY_CHARS`.
+    """
+    fields = flatten_mapping(
+        {key: value for key, value in message.items() if key not in _MESSAGE_METADATA}
+    )
+    summary = ", ".join(
+        f"{path}={value!r}" for path, value in redact_paths(fields, TO_REDACT_WEBSOCKET).items()
+    )
+    if len(summary) > JOURNAL_MAX_ENTRY_CHARS:
+        summary = f"{summary[: JOURNAL_MAX_ENTRY_CHARS - 3]}..."
+    return summary
+
+
+class MessageJournal:
+    """Ring buffer of one entry's recent websocket messages and refreshes."""
+
+    def __init__(
+        self, max_entries: int = JOURNAL_MAX_ENTRIES, max_bytes: int = JOURNAL_MAX_BYTES
+    ) -> None:
+        """Initialize an empty journal.
+
+        Args:
+            max_entries: Most entries kept.
+            max_bytes: Cap on the UTF-8 bytes of text all kept entries hold together.
+        """
+        self.max_bytes = max_bytes
+        self.entries: deque[JournalEntry] = deque(maxlen=max_entries)
+        self.dropped = 0
+        self._size = 0
+
+    def record_message(self, message: Mapping[str, Any] | None) -> None:
+        """Journal one websocket message.
+
+        Args:
+            message: Parsed websocket message, or None when it was not a JSON
+                object.
+        """
+        if message is None:
+            self._append(JOURNAL_KIND_WEBSOCKET, "unknown", "not a JSON object")
+            return
+        self._append(
+            JOURNAL_KIND_WEBSOCKET,
+            str(message.get("messageType", "unknown")),
+            summarize_message(message),
+        )
+
+    def record_refresh(
+        self, refresh_context: str, seconds: float, error: BaseException | None = None
+    ) -> None:
+        """Journal the outcome of one refresh cycle.
+
+        Args:
+            refresh_context: Refresh kind, e.g. "full data refresh".
+            seconds: How long the refresh took.
+            error: Exception the refresh failed with, if any.
+        """
+        outcome = "ok" if error is None else f"failed: {type(error).__name__}"
+        self._append(JOURNAL_KIND_REFRESH, refresh_context, f"{outcome} in {seconds:.3f}s")
+
+    def _append(self, kind: str, label: str, detail: str) -> None:
+        """Add an entry, dropping the oldest ones past either cap."""
+        if len(self.entries) == self.entries.maxlen:
+            self._evict()
+        entry = JournalEntry(datetime.now(UTC).timestamp(), kind, label, detail)
+        self.entries.append(entry)
+        self._size += entry.size
+        while self._size > self.max_bytes and len(self.entries) > 1:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the oldest entry."""
+        self._size -= self.entries.popleft().size
+        self.dropped += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly snapshot for diagnostics, oldest entry first."""
+        return {
+            "entries": [entry.as_dict() for entry in self.entries],
+            "dropped": self.dropped,
+            "size_bytes": self._size,
+        }
@@ -0,0 +1,415 @@
+"""Call-count and latency instrumentation for one Carrier account.
+
+`async_call_with_retry`, the coordinator refresh, the entry-level fetch, and
+the websocket callback all report into the coordinator's `ApiMetrics`. Each
+websocket message also records how long each handling stage held the event
+loop and how far local apply trailed Carrier's own timestamp. While an
+`EntityProfiler` window is open, every entity attribute sync is timed too. The
+totals show up in config entry diagnostics. Rolling one-hour rates and latency
+back a few diagnostic sensors that are disabled by default. Together they
+show how many calls the integration really makes, and they let polling and
+performance changes be checked against production numbers.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from math import ceil
+import time
+from typing import Any
+
+from .const import (
+    ATTEMPT_TIMEOUT_DEFAULT_SECONDS,
+    ATTEMPT_TIMEOUT_MAX_SECONDS,
+    ATTEMPT_TIMEOUT_MIN_SECONDS,
+    ENTITY_PROFILE_TOP_N,
+    LATENCY_MIN_SAMPLES,
+    LATENCY_TIMEOUT_MULTIPLIER,
+    LATENCY_TIMEOUT_PERCENTILE,
+    LATENCY_WINDOW_SIZE,
+    METRICS_LATENCY_WINDOW_SIZE,
+    METRICS_RATE_WINDOW_SECONDS,
+)
+
+# Websocket handling stages recorded by the coordinator.
+WEBSOCKET_STAGE_MESSAGE_HANDLER = "message_handler"
+WEBSOCKET_STAGE_REASSERT_CONTROL = "reassert_control"
+WEBSOCKET_STAGE_LISTENER_FANOUT = "listener_fanout"
+WEBSOCKET_STAGE_TOTAL = "total"
+WEBSOCKET_STAGE_CARRIER_LAG = "carrier_lag"
+
+
+def _nearest_rank(ordered: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of already sorted samples."""
+    return ordered[max(ceil(fraction * len(ordered)) - 1, 0)]
+
+
+@dataclass
+class LatencyTracker:
+    """Rolling latency samples per name, shared by attempt timeouts and diagnostics.
+
+    The coordinator's `ResiliencyState` owns the tracker for Carrier API
+    operations and `ApiMetrics` reads the same samples, so the latency shown
+    in diagnostics is the latency attempt timeouts are sized from.
+
+    Attributes:
+        window: Number of recent samples kept per name.
+        samples: Recent durations in seconds, keyed by operation, refresh, or
+            websocket stage name.
+    """
+
+    window: int = LATENCY_WINDOW_SIZE
+    samples: dict[str, deque[float]] = field(default_factory=dict)
+
+    def record(self, operation_name: str, seconds: float) -> None:
+        """Add one duration.
+
+        Args:
+            operation_name: Operation the attempt belonged to.
+            seconds: How long the attempt took, or its time limit when it
+                timed out.
+        """
+        history = self.samples.get(operation_name)
+        if history is None:
+            history = self.samples[operation_name] = deque(maxlen=self.window)
+        history.append(seconds)
+
+    def percentile(self, operation_name: str | None, fraction: float) -> float | None:
+        """Return a nearest-rank percentile of recent latency.
+
+        Args:
+            operation_name: Operation to inspect, or None for every operation.
+            fraction: Percentile as a fraction, e.g. 0.95.
+
+        Returns:
+            float | None: Latency in seconds, or None with no samples.
+        """
+        if operation_name is None:
+            ordered = sorted(sample for history in self.samples.values() for sample in history)
+        else:
+            ordered = sorted(self.samples.get(operation_name, ()))
+        if not ordered:
+            return None
+        return _nearest_rank(ordered, fraction)
+
+    def summary(self, operation_name: str) -> dict[str, float | None]:
+        """Return p50, p95, and max of one name's recent samples.
+
+        Args:
+            operation_name: Operation to summarize.
+
+        Returns:
+            dict[str, float | None]: Nearest-rank percentiles and the maximum,
+                all None when there are no samples.
+        """
+        ordered = sorted(self.samples.get(operation_name, ()))
+        if not ordered:
+            return {"p50": None, "p95": None, "max": None}
+        return {
+            "p50": _nearest_rank(ordered, 0.5),
+            "p95": _nearest_rank(ordered, 0.95),
+            "max": ordered[-1],
+        }
+
+    def attempt_timeout(self, operation_name: str) -> float:
+        """Return the per-attempt timeout for an operation.
+
+        Args:
+            operation_name: Operation about to be attempted.
+
+        Returns:
+            float: A multiple of recent p95 latency clamped to the configured
+                bounds, or the default until enough samples exist.
+        """
+        history = self.samples.get(operation_name)
+        if history is None or len(history) < LATENCY_MIN_SAMPLES:
+            return ATTEMPT_TIMEOUT_DEFAULT_SECONDS
+        p95 = self.percentile(operation_name, LATENCY_TIMEOUT_PERCENTILE) or 0.0
+        return min(
+            max(p95 * LATENCY_TIMEOUT_MULTIPLIER, ATTEMPT_TIMEOUT_MIN_SECONDS),
+            ATTEMPT_TIMEOUT_MAX_SECONDS,
+        )
+
+
+@dataclass
+class OperationStats:
+    """Counters for one named Carrier operation or refresh cycle.
+
+    Latency lives in the owning `LatencyTracker` under the same name.
+
+    Attributes:
+        calls: Logical calls, counting each retry sequence once.
+        attempts: Requests actually sent, retries included.
+        retries: Attempts that were retries of an earlier failure.
+        errors: Failed attempts keyed by exception class name.
+    """
+
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+
+    def as_dict(self, latency: dict[str, float | None]) -> dict[str, Any]:
+        """Return a JSON-friendly snapshot for diagnostics.
+
+        Args:
+            latency: Latency summary for this operation from its tracker.
+        """
+        return {
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "errors": dict(self.errors),
+            "latency": latency,
+        }
+
+
+@dataclass
+class EntityUpdateCost:
+    """Accumulated attribute sync cost of one entity.
+
+    Attributes:
+        entity_class: Entity class name, e.g. "Thermostat".
+        unique_id: Entity unique ID.
+        calls: Attribute syncs measured.
+        total_seconds: Time spent across those syncs.
+        max_seconds: Slowest single sync.
+    """
+
+    entity_class: str
+    unique_id: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly snapshot for diagnostics."""
+        return {
+            "entity_class": self.entity_class,
+            "unique_id": self.unique_id,
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "max_seconds": self.max_seconds,
+        }
+
+
+class EntityProfiler:
+    """Opt-in, time-boxed accounting of per-entity attribute sync cost.
+
+    Profiling is off until `start` opens a window, so the normal update path
+    pays only for one comparison per entity.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a stopped profiler."""
+        self.active_until: float | None = None
+        self.costs: dict[str, EntityUpdateCost] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the current window is still open."""
+        return self.active_until is not None and time.monotonic() < self.active_until
+
+    def start(self, duration: float) -> None:
+        """Clear earlier results and profile for ``duration`` seconds.
+
+        Args:
+            duration: Length of the profiling window in seconds.
+        """
+        self.costs = {}
+        self.active_until = time.monotonic() + duration
+
+    def record(self, entity_class: str, unique_id: str, seconds: float) -> None:
+        """Add one measured attribute sync.
+
+        Args:
+            entity_class: Entity class name.
+            unique_id: Entity unique ID.
+            seconds: Time the sync took.
+        """
+        cost = self.costs.get(unique_id)
+        if cost is None:
+            cost = self.costs[unique_id] = EntityUpdateCost(entity_class, unique_id)
+        cost.calls += 1
+        cost.total_seconds += seconds
+        cost.max_seconds = max(cost.max_seconds, seconds)
+
+    def top(self, count: int = ENTITY_PROFILE_TOP_N) -> list[EntityUpdateCost]:
+        """Return the entities with the highest cumulative cost.
+
+        Args:
+            count: How many entities to return.
+
+        Returns:
+            list[EntityUpdateCost]: Costliest entities first.
+        """
+        return sorted(self.costs.values(), key=lambda cost: cost.total_seconds, reverse=True)[
+            :count
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly snapshot for diagnostics."""
+        by_class: Counter[str] = Counter()
+        for cost in self.costs.values():
+            by_class[cost.entity_class] += cost.total_seconds
+        return {
+            "enabled": self.enabled,
+            "seconds_remaining": max(self.active_until - time.monotonic(), 0.0)
+            if self.active_until is not None
+            else 0.0,
+            "entities_measured": len(self.costs),
+            "total_seconds_by_class": dict(by_class.most_common()),
+            "top_entities": [cost.as_dict() for cost in self.top()],
+        }
+
+
+class ApiMetrics:
+    """Per-account counters for Carrier API calls, refreshes, and websocket traffic."""
+
+    def __init__(self, latency: LatencyTracker | None = None) -> None:
+        """Initialize empty counters.
+
+        Args:
+            latency: Tracker the retry helper records attempt latency in,
+                normally the coordinator's ``ResiliencyState.latency``.
+        """
+        self.latency = latency if latency is not None else LatencyTracker()
+        self.operations: dict[str, OperationStats] = {}
+        self.refreshes: dict[str, OperationStats] = {}
+        self.refresh_latency = LatencyTracker(window=METRICS_LATENCY_WINDOW_SIZE)
+        self.websocket_messages = 0
+        self.slow_websocket_messages = 0
+        self.websocket_stages = LatencyTracker(window=METRICS_LATENCY_WINDOW_SIZE)
+        self._recent_attempts: deque[float] = deque()
+        self._recent_errors: deque[float] = deque()
+        self._recent_websocket_messages: deque[float] = deque()
+
+    def _operation(self, operation_name: str) -> OperationStats:
+        """Return the stats bucket for an operation, creating it on first use."""
+        return self.operations.setdefault(operation_name, OperationStats())
+
+    def _prune(self, now: float) -> None:
+        """Drop rate samples older than the rate window."""
+        cutoff = now - METRICS_RATE_WINDOW_SECONDS
+        for timestamps in (
+            self._recent_attempts,
+            self._recent_errors,
+            self._recent_websocket_messages,
+        ):
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
+
+    def record_call(self, operation_name: str) -> None:
+        """Count the start of one logical call.
+
+        Args:
+            operation_name: Operation being called.
+        """
+        self._operation(operation_name).calls += 1
+
+    def record_attempt(self, operation_name: str, error: BaseException | None = None) -> None:
+        """Record one request sent to Carrier.
+
+        Its duration is recorded by the retry helper in the shared tracker.
+
+        Args:
+            operation_name: Operation the request belonged to.
+            error: Exception the request failed with, if any.
+        """
+        stats = self._operation(operation_name)
+        stats.attempts += 1
+        now = time.monotonic()
+        self._prune(now)
+        self._recent_attempts.append(now)
+        if error is not None:
+            stats.errors[type(error).__name__] += 1
+            self._recent_errors.append(now)
+
+    def record_retry(self, operation_name: str) -> None:
+        """Count one retry about to be attempted.
+
+        Args:
+            operation_name: Operation being retried.
+        """
+        self._operation(operation_name).retries += 1
+
+    def record_refresh(
+        self, refresh_context: str, seconds: float, error: BaseException | None = None
+    ) -> None:
+        """Record one coordinator refresh cycle.
+
+        Args:
+            refresh_context: Refresh kind, e.g. "full data refresh".
+            seconds: How long the whole cycle took.
+            error: Exception the cycle failed with, if any.
+        """
+        stats = self.refreshes.setdefault(refresh_context, OperationStats())
+        stats.calls += 1
+        self.refresh_latency.record(refresh_context, seconds)
+        if error is not None:
+            stats.errors[type(error).__name__] += 1
+
+    def record_websocket_message(self) -> None:
+        """Count one websocket message handled by the coordinator."""
+        self.websocket_messages += 1
+        now = time.monotonic()
+        self._prune(now)
+        self._recent_websocket_messages.append(now)
+
+    def record_websocket_stage(self, stage: str, seconds: float) -> None:
+        """Record how long one websocket handling stage took.
+
+        Args:
+            stage: One of the ``WEBSOCKET_STAGE_*`` names.
+            seconds: Stage duration; for ``carrier_lag``, seconds between
+                Carrier's message timestamp and local apply.
+        """
+        self.websocket_stages.record(stage, seconds)
+
+    def _hourly(self, timestamps: deque[float]) -> int:
+        """Return how many samples fall inside the rate window."""
+        self._prune(time.monotonic())
+        return len(timestamps)
+
+    @property
+    def calls_last_hour(self) -> int:
+        """Return requests sent to Carrier during the rate window."""
+        return self._hourly(self._recent_attempts)
+
+    @property
+    def errors_last_hour(self) -> int:
+        """Return failed requests during the rate window."""
+        return self._hourly(self._recent_errors)
+
+    @property
+    def websocket_messages_last_hour(self) -> int:
+        """Return websocket messages handled during the rate window."""
+        return self._hourly(self._recent_websocket_messages)
+
+    def latency_p95(self) -> float | None:
+        """Return p95 latency over the recent samples of every operation."""
+        return self.latency.percentile(None, 0.95)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly snapshot for diagnostics."""
+        return {
+            "calls_last_hour": self.calls_last_hour,
+            "errors_last_hour": self.errors_last_hour,
+            "websocket_messages": self.websocket_messages,
+            "websocket_messages_last_hour": self.websocket_messages_last_hour,
+            "slow_websocket_messages": self.slow_websocket_messages,
+            "websocket_latency": {
+                stage: self.websocket_stages.summary(stage)
+                for stage in self.websocket_stages.samples
+            },
+            "operations": {
+                name: stats.as_dict(self.latency.summary(name))
+                for name, stats in self.operations.items()
+            },
+            "refreshes": {
+                name: stats.as_dict(self.refresh_latency.summary(name))
+                for name, stats in self.refreshes.items()
+            },
+        }
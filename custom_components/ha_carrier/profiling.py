@@ -0,0 +1,161 @@
+"""On-demand cProfile capture of coordinator refresh and websocket cycles.
+
+The ``ha_carrier.profile`` service arms a `CycleProfiler` for the next few
+cycles of one config entry. A cycle is one coordinator refresh or one
+websocket message, each ending in listener fan-out to the entities. The
+coordinator wraps only synchronous sections in `CycleProfiler.capture`: the
+apply step of a full refresh once Carrier has answered, the websocket merge,
+`updated_callback`, and `async_update_listeners`. None of them awaits, so a
+capture never records other event-loop work and captures of different entries
+never overlap. Time spent waiting on Carrier is not profiled; refresh
+durations are in the API metrics instead.
+
+Captures are deterministic (cProfile), so the numbers include profiler
+overhead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import contextlib
+import cProfile
+import io
+import logging
+from pathlib import Path
+import pstats
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import PROFILE_CAPTURE_TIMEOUT_SECONDS, PROFILE_SUMMARY_LINES
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+def write_profile(profile: cProfile.Profile, output_path: Path) -> None:
+    """Write raw stats and a cumulative-time text summary to disk.
+
+    Runs in an executor because it does blocking file I/O.
+
+    Args:
+        profile: Finished profiler.
+        output_path: ``.cprof`` path; the summary goes next to it as ``.txt``.
+    """
+    profile.dump_stats(output_path)
+    summary = io.StringIO()
+    pstats.Stats(profile, stream=summary).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+        PROFILE_SUMMARY_LINES
+    )
+    output_path.with_suffix(".txt").write_text(summary.getvalue(), encoding="utf-8")
+
+
+class CycleProfiler:
+    """Profile the next N coordinator cycles of one config entry."""
+
+    def __init__(self) -> None:
+        """Initialize an idle profiler."""
+        self.remaining = 0
+        self.output_path: Path | None = None
+        self._hass: HomeAssistant | None = None
+        self._profile: cProfile.Profile | None = None
+        self._depth = 0
+        self._cancel_timeout: CALLBACK_TYPE | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return whether a capture is armed."""
+        return self._profile is not None
+
+    @callback
+    def start(self, hass: HomeAssistant, cycles: int, output_path: Path) -> None:
+        """Arm the profiler for the next ``cycles`` cycles.
+
+        Args:
+            hass: Home Assistant instance used to write the result.
+            cycles: Refreshes and websocket messages to capture.
+            output_path: Where the ``.cprof`` file is written.
+        """
+        self._hass = hass
+        self._profile = cProfile.Profile()
+        self.remaining = cycles
+        self.output_path = output_path
+        self._cancel_timeout = async_call_later(
+            hass, PROFILE_CAPTURE_TIMEOUT_SECONDS, self._async_timed_out
+        )
+
+    @contextlib.contextmanager
+    def capture(self) -> Iterator[None]:
+        """Run the enclosed section under the profiler while a capture is armed.
+
+        The section must not await: cProfile hooks the whole thread, so an
+        ``await`` would record unrelated event-loop work. Nested sections share
+        one enable/disable pair, so a fan-out inside a websocket update is not
+        profiled twice.
+        """
+        profile = self._profile
+        if profile is None:
+            yield
+            return
+        if self._depth == 0 and not self._enable(profile):
+            yield
+            return
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                profile.disable()
+                if self.remaining <= 0:
+                    self._finish()
+
+    def _enable(self, profile: cProfile.Profile) -> bool:
+        """Start profiling, abandoning the capture if another profiler is active.
+
+        Args:
+            profile: Armed profiler.
+
+        Returns:
+            bool: Whether profiling started.
+        """
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (e.g. HA's profiler integration) owns the hook.
+            _LOGGER.warning("another profiler is running; abandoning Carrier profile capture")
+            self._reset()
+            return False
+        return True
+
+    def cycle_finished(self) -> None:
+        """Count one finished cycle; the capture is written when none remain."""
+        if self._profile is not None:
+            self.remaining -= 1
+
+    @callback
+    def _async_timed_out(self, _now: object) -> None:
+        """Write whatever was captured when the cycles never arrived."""
+        self._cancel_timeout = None
+        if self._profile is None:
+            return
+        _LOGGER.info("Carrier profile capture timed out with %d cycles left", self.remaining)
+        self.remaining = 0
+        if self._depth == 0:
+            self._finish()
+
+    def _finish(self) -> None:
+        """Write the capture in an executor and return to idle."""
+        profile, output_path, hass = self._profile, self.output_path, self._hass
+        self._reset()
+        if profile is None or output_path is None or hass is None:
+            return
+        _LOGGER.info("writing Carrier profile capture to %s", output_path)
+        hass.async_add_executor_job(write_profile, profile, output_path)
+
+    def _reset(self) -> None:
+        """Disarm the profiler and cancel its timeout."""
+        if self._cancel_timeout is not None:
+            self._cancel_timeout()
+            self._cancel_timeout = None
+        self._profile = None
+        self.remaining = 0
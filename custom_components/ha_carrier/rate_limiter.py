@@ -0,0 +1,141 @@
+"""Per-account token-bucket rate limiting for Carrier API calls.
+
+Automations, scenes, reconcile refreshes, and retries can all reach Carrier at
+the same moment. Each coordinator (and so each `ApiConnectionGraphql`) owns one
+`CarrierRateLimiter`, and every attempt made by `async_call_with_retry` takes a
+token from it first, so retries are budgeted too.
+
+Reads and writes draw from separate buckets so a burst of background refreshes
+cannot use up the budget a user's change needs. A write that is waiting for a
+token also holds back reads until it has gone out. When Carrier answers with
+HTTP 429 the limiter pauses both buckets for the Retry-After period.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from enum import StrEnum
+import logging
+import time
+
+from .const import (
+    RATE_LIMIT_READ_BURST,
+    RATE_LIMIT_READ_PER_MINUTE,
+    RATE_LIMIT_THROTTLED_MAX_SECONDS,
+    RATE_LIMIT_WRITE_BURST,
+    RATE_LIMIT_WRITE_PER_MINUTE,
+)
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class ApiCallKind(StrEnum):
+    """Budget a Carrier API call draws from."""
+
+    READ = "read"
+    WRITE = "write"
+
+
+@dataclass
+class TokenBucket:
+    """Refilling token bucket measured on the monotonic clock.
+
+    Attributes:
+        rate: Tokens added per second.
+        capacity: Maximum tokens held, i.e. the allowed burst.
+        tokens: Tokens currently available.
+        updated_at: Monotonic time ``tokens`` was last refilled.
+    """
+
+    rate: float
+    capacity: float
+    tokens: float = field(init=False)
+    updated_at: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Start with a full bucket."""
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def try_take(self, now: float) -> float:
+        """Take one token if available.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            float: Zero when a token was taken, otherwise seconds until one
+                will be available.
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class CarrierRateLimiter:
+    """Read and write token buckets for one Carrier account."""
+
+    def __init__(
+        self,
+        read_bucket: TokenBucket | None = None,
+        write_bucket: TokenBucket | None = None,
+    ) -> None:
+        """Initialize the per-account buckets.
+
+        Args:
+            read_bucket: Bucket for refreshes; defaults to the read budget.
+            write_bucket: Bucket for user writes; defaults to the write budget.
+        """
+        self.buckets: dict[ApiCallKind, TokenBucket] = {
+            ApiCallKind.READ: read_bucket
+            or TokenBucket(RATE_LIMIT_READ_PER_MINUTE / 60, RATE_LIMIT_READ_BURST),
+            ApiCallKind.WRITE: write_bucket
+            or TokenBucket(RATE_LIMIT_WRITE_PER_MINUTE / 60, RATE_LIMIT_WRITE_BURST),
+        }
+        self.throttled_until: float = 0.0
+        self._pending_writes = 0
+        self._writes_drained = asyncio.Event()
+        self._writes_drained.set()
+
+    async def async_acquire(self, kind: ApiCallKind) -> None:
+        """Wait until one call of ``kind`` may go out.
+
+        Args:
+            kind: Budget the call draws from.
+        """
+        if kind is ApiCallKind.WRITE:
+            self._pending_writes += 1
+            self._writes_drained.clear()
+        try:
+            while True:
+                if kind is ApiCallKind.READ and self._pending_writes:
+                    await self._writes_drained.wait()
+                    continue
+                now = time.monotonic()
+                wait = self.throttled_until - now
+                if wait <= 0:
+                    wait = self.buckets[kind].try_take(now)
+                    if wait <= 0:
+                        return
+                _LOGGER.debug("rate limiting Carrier %s for %.1f seconds", kind, wait)
+                await asyncio.sleep(wait)
+        finally:
+            if kind is ApiCallKind.WRITE:
+                self._pending_writes -= 1
+                if not self._pending_writes:
+                    self._writes_drained.set()
+
+    def note_throttled(self, retry_after: float) -> None:
+        """Pause all calls after Carrier answered with HTTP 429.
+
+        Args:
+            retry_after: Seconds Carrier asked us to wait; capped at
+                ``RATE_LIMIT_THROTTLED_MAX_SECONDS``.
+        """
+        delay = min(max(retry_after, 0.0), RATE_LIMIT_THROTTLED_MAX_SECONDS)
+        _LOGGER.info("Carrier throttled requests; pausing API calls for %.0f seconds", delay)
+        self.throttled_until = max(self.throttled_until, time.monotonic() + delay)
@@ -0,0 +1,108 @@
+"""Copy-on-write redaction of nested Carrier payloads.
+
+Diagnostics, websocket traces, and debug snapshots redact the same few key
+sets over large, mostly harmless payloads. `Redactor` compiles a key set once
+and walks a payload iteratively, so deep nesting cannot hit the recursion
+limit. It copies only the mappings and lists on a path to a redacted key. Every
+other subtree is shared with the input, and a payload with nothing to redact
+comes back as the very same object.
+
+Values that are None or an empty string are left as they are even under a
+redacted key, matching Home Assistant's diagnostics redactor.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+import functools
+from typing import Any
+
+REDACTED = "**REDACTED**"
+
+
+def _children(node: Mapping[Any, Any] | list[Any]) -> Iterator[tuple[Any, Any]]:
+    """Return an iterator over the keys or indexes of ``node`` with their values."""
+    return iter(node.items() if isinstance(node, Mapping) else enumerate(node))
+
+
+def _copy_with(node: Mapping[Any, Any] | list[Any], changes: dict[Any, Any]) -> Any:
+    """Return a shallow copy of ``node`` with the children in ``changes`` replaced."""
+    if isinstance(node, Mapping):
+        return {**node, **changes}
+    copied = list(node)
+    for index, value in changes.items():
+        copied[index] = value
+    return copied
+
+
+class Redactor:
+    """Redacts a fixed set of keys from nested mappings and lists."""
+
+    __slots__ = ("keys",)
+
+    def __init__(self, keys: Iterable[Any]) -> None:
+        """Compile the key set.
+
+        Args:
+            keys: Mapping keys whose values are replaced with `REDACTED`.
+        """
+        self.keys: frozenset[Any] = frozenset(keys)
+
+    def redact(self, data: Any) -> Any:
+        """Return ``data`` with every value under a redacted key replaced.
+
+        Args:
+            data: Payload to redact; anything other than a mapping or list is
+                returned unchanged.
+
+        Returns:
+            Any: ``data`` itself when nothing was redacted, otherwise a copy
+                that shares every subtree without redacted keys.
+        """
+        keys = self.keys
+        if not keys or not isinstance(data, Mapping | list):
+            return data
+        # Each frame is a container being walked: the container, the iterator
+        # over its children, the children replaced so far, and its key in the
+        # parent container.
+        stack: list[tuple[Any, Iterator[tuple[Any, Any]], dict[Any, Any] | None, Any]] = []
+        node: Any = data
+        children = _children(data)
+        changes: dict[Any, Any] | None = None
+        node_key: Any = None
+        while True:
+            in_mapping = isinstance(node, Mapping)
+            for key, value in children:
+                if in_mapping and key in keys:
+                    if value is None or (isinstance(value, str) and not value):
+                        continue
+                    if changes is None:
+                        changes = {}
+                    changes[key] = REDACTED
+                elif value and isinstance(value, Mapping | list):
+                    stack.append((node, children, changes, node_key))
+                    node, children, changes, node_key = value, _children(value), None, key
+                    break
+            else:
+                result = node if changes is None else _copy_with(node, changes)
+                if not stack:
+                    return result
+                child, child_key = node, node_key
+                node, children, changes, node_key = stack.pop()
+                if result is not child:
+                    if changes is None:
+                        changes = {}
+                    changes[child_key] = result
+
+
+@functools.lru_cache(maxsize=32)
+def compile_redactor(keys: frozenset[Any]) -> Redactor:
+    """Return a shared `Redactor` for ``keys``.
+
+    Args:
+        keys: Mapping keys to redact.
+
+    Returns:
+        Redactor: Compiled redactor, cached per key set.
+    """
+    return Redactor(keys)
@@ -0,0 +1,107 @@
+"""Per-account priority scheduling and concurrency caps for Carrier API calls.
+
+Energy refreshes, full reconciles, entry-level polls, confirm-reads, and user
+writes all share one Carrier account. Every attempt made through
+`async_call_with_retry`, plus the entry-level fetch, takes a slot from the
+coordinator's `CarrierRequestScheduler` before it goes out and gives it back
+as soon as Carrier answers.
+
+Slots are handed out by priority lane: interactive writes first, then
+confirm-reads, then background refreshes. Background work is deferred rather
+than interrupted. An in-flight ``load_data`` runs to completion, but no new
+background attempt starts while a higher lane is waiting. One slot is kept
+for interactive writes so a set point change never queues behind a full
+set of slow background calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from enum import IntEnum
+import heapq
+import itertools
+
+from .const import MAX_CONCURRENT_API_CALLS, RESERVED_INTERACTIVE_API_CALLS
+from .rate_limiter import ApiCallKind
+
+
+class RequestPriority(IntEnum):
+    """Priority lane for a Carrier call; lower values are served first."""
+
+    INTERACTIVE = 0
+    CONFIRM = 1
+    BACKGROUND = 2
+
+    @property
+    def call_kind(self) -> ApiCallKind:
+        """Return the rate-limit budget this lane draws from."""
+        return ApiCallKind.WRITE if self is RequestPriority.INTERACTIVE else ApiCallKind.READ
+
+
+class CarrierRequestScheduler:
+    """Priority queue in front of one Carrier account's concurrent calls."""
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_API_CALLS,
+        reserved_interactive: int = RESERVED_INTERACTIVE_API_CALLS,
+    ) -> None:
+        """Initialize the concurrency caps.
+
+        Args:
+            max_concurrent: Calls allowed in flight at once for this account.
+            reserved_interactive: Slots only interactive writes may use.
+        """
+        self.max_concurrent = max_concurrent
+        self.reserved_interactive = reserved_interactive
+        self.active = 0
+        self._waiters: list[tuple[RequestPriority, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        """Return how many calls are queued for a slot."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    def _can_start(self, priority: RequestPriority) -> bool:
+        """Return whether a call in ``priority`` fits under its lane's cap."""
+        capacity = self.max_concurrent
+        if priority is not RequestPriority.INTERACTIVE:
+            capacity -= self.reserved_interactive
+        return self.active < capacity
+
+    async def async_acquire(self, priority: RequestPriority) -> None:
+        """Wait for a slot in ``priority``'s lane.
+
+        Callers must call `release` once Carrier has answered.
+
+        Args:
+            priority: Lane the call is queued in.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._wake_waiters()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Return a slot and hand it to the highest-priority waiter."""
+        self.active -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Start queued calls in priority order while their lanes have room."""
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_start(priority):
+                return
+            heapq.heappop(self._waiters)
+            self.active += 1
+            future.set_result(None)
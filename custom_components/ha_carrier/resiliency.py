@@ -8,6 +8,32 @@ changing counters directly, so the refresh path remains the owner of outage
 accounting. A later successful API operation clears stale counters unless the
 caller is intentionally doing cycle-level accounting.
 
+When transient failures escalate, `ResiliencyState` also acts as a circuit
+breaker. While it is open, refreshes and writes fail fast with
+`CarrierCircuitOpenError` and the websocket loop holds off reconnecting. After
+`CIRCUIT_BREAKER_OPEN_SECONDS` the breaker goes half-open and lets exactly one
+probe through; any response from Carrier closes it again, while another
+transport failure re-opens it.
+
+Each attempt is bounded by a timeout derived from the recent latency of that
+operation, tracked per operation name in `LatencyTracker`. An attempt that
+times out counts as a sample at its limit, so a sustained slowdown widens the
+timeout up to `ATTEMPT_TIMEOUT_MAX_SECONDS` instead of cutting every attempt
+off at a limit sized for fast responses. Callers can also pass
+an end-to-end deadline that retries and backoff must fit inside, so the worst
+case a user waits on a write is predictable.
+
+Every retry, including websocket reconnects, also spends from a sliding-window
+`RetryBudget` shared by the account. Once retries exceed `RETRY_BUDGET_RATIO`
+of recent first attempts (plus a small floor), further retries are skipped and
+the failure is raised as-is, so a partial outage does not multiply traffic.
+
+Callers that pass a `CarrierRateLimiter` have every attempt, retries included,
+wait for a token from the matching read or write budget, and an HTTP 429 from
+Carrier pauses that limiter for the requested Retry-After. Callers that pass a
+`CarrierRequestScheduler` also queue each attempt in its priority lane, and
+backoff sleeps happen outside the slot.
+
 `async_call_with_retry` is the shared helper for bounded API calls. The websocket
 loop reuses `RetryPolicy` and `compute_backoff_delay` directly because it manages
 its own long-running listener and reconnect cycle.
@@ -16,14 +42,32 @@ its own long-running listener and reconnect cycle.
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import StrEnum
 import logging
 from math import ceil, log2
 import random
-
-from .exceptions import CarrierUnauthorizedError
-from .util import is_transient_transport_error, is_unauthorized_error
+import time
+
+from carrier_api import CarrierApiConnectionError
+
+from .const import (
+    CIRCUIT_BREAKER_OPEN_SECONDS,
+    RETRY_BUDGET_MIN_RETRIES,
+    RETRY_BUDGET_RATIO,
+    RETRY_BUDGET_WINDOW_SECONDS,
+)
+from .exceptions import (
+    CarrierCircuitOpenError,
+    CarrierDeadlineExceededError,
+    CarrierUnauthorizedError,
+)
+from .metrics import ApiMetrics, LatencyTracker
+from .rate_limiter import CarrierRateLimiter
+from .request_scheduler import CarrierRequestScheduler, RequestPriority
+from .util import is_transient_transport_error, is_unauthorized_error, throttle_retry_after
 
 
 @dataclass(frozen=True)
@@ -54,6 +98,77 @@ class RetryPolicy:
     retry_on_unauthorized: bool
 
 
+class BreakerState(StrEnum):
+    """Circuit breaker positions shared by refresh, write, and websocket paths."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class RetryBudget:
+    """Sliding-window cap on retries relative to first attempts.
+
+    Attributes:
+        window_seconds: How far back attempts and retries are counted.
+        ratio: Retries allowed per first attempt inside the window.
+        min_retries: Retries always allowed inside the window.
+        first_attempts: Monotonic times of recent first attempts.
+        retries: Monotonic times of recent retries.
+        denied: Retries refused since the integration started.
+    """
+
+    window_seconds: float = RETRY_BUDGET_WINDOW_SECONDS
+    ratio: float = RETRY_BUDGET_RATIO
+    min_retries: int = RETRY_BUDGET_MIN_RETRIES
+    first_attempts: deque[float] = field(default_factory=deque)
+    retries: deque[float] = field(default_factory=deque)
+    denied: int = 0
+
+    def _prune(self, now: float) -> None:
+        """Drop attempts and retries that fell out of the window."""
+        cutoff = now - self.window_seconds
+        for timestamps in (self.first_attempts, self.retries):
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
+
+    def limit(self) -> int:
+        """Return how many retries the current window allows."""
+        return self.min_retries + int(self.ratio * len(self.first_attempts))
+
+    def record_first_attempt(self) -> None:
+        """Count one new logical operation toward the budget."""
+        now = time.monotonic()
+        self._prune(now)
+        self.first_attempts.append(now)
+
+    def try_spend(self) -> bool:
+        """Spend one retry if the window still has budget.
+
+        Returns:
+            bool: True when the retry may go ahead.
+        """
+        now = time.monotonic()
+        self._prune(now)
+        if len(self.retries) >= self.limit():
+            self.denied += 1
+            return False
+        self.retries.append(now)
+        return True
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return current budget usage for diagnostics."""
+        self._prune(time.monotonic())
+        return {
+            "window_seconds": self.window_seconds,
+            "first_attempts": len(self.first_attempts),
+            "retries": len(self.retries),
+            "limit": self.limit(),
+            "denied": self.denied,
+        }
+
+
 @dataclass
 class ResiliencyState:
     """Cross-call escalation counters shared across coordinator surfaces.
@@ -81,6 +196,16 @@ class ResiliencyState:
             already emitted its first log message.
         transient_escalated_logged: Whether the current transient outage has
             already emitted its escalation log message.
+        breaker_open_seconds: How long the breaker stays open before allowing
+            a single half-open probe.
+        breaker_state: Current circuit breaker position.
+        breaker_opened_at: Monotonic time the breaker last opened.
+        breaker_probe_in_flight: Whether the half-open probe has been handed out.
+        latency: Recent per-operation latency used to size attempt timeouts.
+        retry_budget: Account-wide cap on retries across all request paths.
+        on_breaker_change: Called with the new position whenever the breaker
+            trips, goes half-open, or closes, so entities can show it even
+            though failed refreshes do not notify listeners.
     """
 
     unauthorized_threshold: int
@@ -91,11 +216,79 @@ class ResiliencyState:
     unauthorized_escalated_logged: bool = False
     transient_outage_logged: bool = False
     transient_escalated_logged: bool = False
+    breaker_open_seconds: float = CIRCUIT_BREAKER_OPEN_SECONDS
+    breaker_state: BreakerState = BreakerState.CLOSED
+    breaker_opened_at: float | None = None
+    breaker_probe_in_flight: bool = False
+    latency: LatencyTracker = field(default_factory=LatencyTracker)
+    retry_budget: RetryBudget = field(default_factory=RetryBudget)
+    on_breaker_change: Callable[[BreakerState], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def _set_breaker_state(self, breaker_state: BreakerState) -> None:
+        """Move the breaker and report the transition, if it is one."""
+        if breaker_state is self.breaker_state:
+            return
+        self.breaker_state = breaker_state
+        if self.on_breaker_change is not None:
+            self.on_breaker_change(breaker_state)
 
     def reset(self) -> None:
-        """Clear all retry counters and log flags after a normal success."""
+        """Clear all retry counters, log flags, and the breaker after a normal success."""
         self.reset_unauthorized()
         self.reset_transient()
+        self.close_breaker()
+
+    def close_breaker(self) -> None:
+        """Close the breaker because Carrier answered a request."""
+        self.breaker_opened_at = None
+        self.breaker_probe_in_flight = False
+        self._set_breaker_state(BreakerState.CLOSED)
+
+    def trip_breaker(self, logger: logging.Logger) -> None:
+        """Open (or re-open) the breaker after an escalated transport outage.
+
+        Args:
+            logger: Logger used for the state-change message.
+        """
+        if self.breaker_state is not BreakerState.OPEN:
+            logger.warning(
+                "Carrier circuit breaker opened; pausing Carrier requests for %s seconds.",
+                self.breaker_open_seconds,
+            )
+        self.breaker_opened_at = time.monotonic()
+        self.breaker_probe_in_flight = False
+        self._set_breaker_state(BreakerState.OPEN)
+
+    def breaker_retry_after(self) -> float:
+        """Return seconds until an open breaker will allow its half-open probe."""
+        if self.breaker_state is not BreakerState.OPEN or self.breaker_opened_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self.breaker_opened_at
+        return max(0.0, self.breaker_open_seconds - elapsed)
+
+    def breaker_allows_request(self) -> bool:
+        """Return whether one request may go out, reserving the probe if half-open.
+
+        Returns:
+            bool: True when the breaker is closed, or when this caller has just
+                been handed the single half-open probe.
+        """
+        if self.breaker_state is BreakerState.CLOSED:
+            return True
+        if self.breaker_state is BreakerState.OPEN:
+            if self.breaker_retry_after() > 0:
+                return False
+            self._set_breaker_state(BreakerState.HALF_OPEN)
+        if self.breaker_probe_in_flight:
+            return False
+        self.breaker_probe_in_flight = True
+        return True
+
+    def release_probe(self) -> None:
+        """Give the half-open probe back once its attempt has ended, however it ended."""
+        self.breaker_probe_in_flight = False
 
     def reset_unauthorized(self) -> None:
         """Clear only unauthorized counters and related log flags."""
@@ -171,6 +364,8 @@ class ResiliencyState:
                 operation_name,
             )
             self.transient_escalated_logged = True
+        if escalated or self.breaker_state is BreakerState.HALF_OPEN:
+            self.trip_breaker(logger)
         return escalated
 
 
@@ -201,6 +396,156 @@ def compute_backoff_delay(policy: RetryPolicy, attempt: int) -> float:
     return max(0.0, capped + random.uniform(-jitter, jitter))
 
 
+def _retry_allowed(
+    state: ResiliencyState,
+    deadline_at: float | None,
+    delay: float,
+    operation_name: str,
+    logger: logging.Logger,
+) -> bool:
+    """Return whether a retry fits the caller's deadline and the retry budget.
+
+    The deadline is checked first so a retry that could never run does not
+    spend budget.
+
+    Args:
+        state: Shared state holding the account's retry budget.
+        deadline_at: Event-loop time the caller's deadline expires, if any.
+        delay: Backoff delay about to be slept.
+        operation_name: Friendly name used in the budget log message.
+        logger: Logger used when the budget refuses a retry.
+
+    Returns:
+        bool: True when the retry may go ahead.
+    """
+    if not _retry_fits_deadline(deadline_at, delay):
+        return False
+    if not state.retry_budget.try_spend():
+        logger.debug("retry budget exhausted; not retrying %s", operation_name)
+        return False
+    return True
+
+
+def _retry_fits_deadline(deadline_at: float | None, delay: float) -> bool:
+    """Return whether sleeping ``delay`` still leaves time before the deadline.
+
+    Args:
+        deadline_at: Event-loop time the caller's deadline expires, if any.
+        delay: Backoff delay about to be slept.
+
+    Returns:
+        bool: True when there is no deadline or the retry would start before it.
+    """
+    return deadline_at is None or asyncio.get_running_loop().time() + delay < deadline_at
+
+
+async def _async_run_attempt[T](
+    operation: Callable[[], Awaitable[T]],
+    time_limit: float,
+    operation_name: str,
+    latency: LatencyTracker,
+) -> T:
+    """Run one attempt, turning its own timeout into a transient connection error.
+
+    A timed-out attempt took at least ``time_limit``, so it is recorded as a
+    sample at that limit; otherwise a slowdown after fast samples would keep
+    every attempt cut off at the old limit.
+
+    Args:
+        operation: Awaitable callable performing the underlying API call.
+        time_limit: Seconds the attempt may take.
+        operation_name: Friendly name used in the timeout message.
+        latency: Latency history the timed-out attempt is recorded in.
+
+    Returns:
+        T: The result returned by `operation`.
+
+    Raises:
+        CarrierApiConnectionError: When the attempt exceeded ``time_limit``.
+    """
+    try:
+        async with asyncio.timeout(time_limit) as scope:
+            return await operation()
+    except TimeoutError as error:
+        if not scope.expired():
+            raise
+        latency.record(operation_name, time_limit)
+        raise CarrierApiConnectionError(
+            f"Carrier {operation_name} timed out after {time_limit:.1f} seconds."
+        ) from error
+
+
+async def _async_admit_attempt(
+    state: ResiliencyState,
+    operation_name: str,
+    *,
+    rate_limiter: CarrierRateLimiter | None,
+    request_scheduler: CarrierRequestScheduler | None,
+    attempt_slot: asyncio.Semaphore | None,
+    priority: RequestPriority,
+    deadline_at: float | None,
+    holds_probe: bool,
+) -> float:
+    """Wait for a shared slot, a rate-limit token and a scheduler slot, then size the attempt.
+
+    On success the caller holds one `attempt_slot` and one `request_scheduler`
+    slot and must release both once the attempt finishes. On failure the slots
+    and, when ``holds_probe``, the half-open probe are given back before raising.
+
+    Args:
+        state: Shared state holding the breaker probe and latency history.
+        operation_name: Operation about to be attempted.
+        rate_limiter: Per-account limiter to take a token from, if any.
+        request_scheduler: Per-account scheduler to take a slot from, if any.
+        attempt_slot: Shared limiter to take a slot from, if any.
+        priority: Lane and rate-limit budget for the attempt.
+        deadline_at: Event-loop time the caller's deadline expires, if any.
+        holds_probe: Whether this caller was handed the half-open probe.
+
+    Returns:
+        float: Seconds the attempt may take.
+
+    Raises:
+        CarrierDeadlineExceededError: When the deadline expires before the
+            attempt could start.
+    """
+    loop = asyncio.get_running_loop()
+    slot_held = False
+    try:
+        async with asyncio.timeout_at(deadline_at):
+            if attempt_slot is not None:
+                await attempt_slot.acquire()
+                slot_held = True
+            if rate_limiter is not None:
+                await rate_limiter.async_acquire(priority.call_kind)
+            if request_scheduler is not None:
+                await request_scheduler.async_acquire(priority)
+    except BaseException as error:
+        if holds_probe:
+            state.release_probe()
+        if attempt_slot is not None and slot_held:
+            attempt_slot.release()
+        if isinstance(error, TimeoutError):
+            raise CarrierDeadlineExceededError(
+                f"Carrier {operation_name} could not start before its deadline."
+            ) from error
+        raise
+    attempt_timeout = state.latency.attempt_timeout(operation_name)
+    if deadline_at is not None:
+        attempt_timeout = min(attempt_timeout, deadline_at - loop.time())
+        if attempt_timeout <= 0:
+            if holds_probe:
+                state.release_probe()
+            if request_scheduler is not None:
+                request_scheduler.release()
+            if attempt_slot is not None:
+                attempt_slot.release()
+            raise CarrierDeadlineExceededError(
+                f"Carrier {operation_name} could not start before its deadline."
+            )
+    return attempt_timeout
+
+
 async def async_call_with_retry[T](
     operation: Callable[[], Awaitable[T]],
     *,
@@ -210,6 +555,12 @@ async def async_call_with_retry[T](
     logger: logging.Logger,
     manage_unauthorized_state: bool = True,
     reset_state_on_success: bool = True,
+    rate_limiter: CarrierRateLimiter | None = None,
+    request_scheduler: CarrierRequestScheduler | None = None,
+    attempt_slot: asyncio.Semaphore | None = None,
+    priority: RequestPriority = RequestPriority.BACKGROUND,
+    deadline: float | None = None,
+    metrics: ApiMetrics | None = None,
 ) -> T:
     """Run `operation` with classification-driven retry and shared escalation state.
 
@@ -225,6 +576,18 @@ async def async_call_with_retry[T](
     shared transient threshold escalates, in which case the original error is
     raised.
 
+    Every attempt first consults the shared circuit breaker. While it is open
+    the call fails fast with `CarrierCircuitOpenError` without reaching
+    Carrier; once half-open, only the caller holding the probe goes out. Any
+    answer from Carrier, including a non-transient error, closes the breaker.
+
+    Each attempt is capped by `LatencyTracker.attempt_timeout` for
+    `operation_name`; a timed-out attempt counts as a transient failure. With
+    a `deadline`, the attempt timeout, rate-limit waits, and backoff sleeps
+    are all clipped to it, and no retry starts once it would be exceeded. A
+    retry the account's `RetryBudget` refuses is skipped the same way, and the
+    last error is raised.
+
     A successful call normally resets all shared resiliency state. Callers set
     `reset_state_on_success=False` only when one logical operation is made from
     multiple helper calls and will record/reset state after the full cycle. Other
@@ -242,23 +605,80 @@ async def async_call_with_retry[T](
         reset_state_on_success: Whether a successful call should clear shared
             resiliency tracking. Set False only for cycle-scoped callers that
             finalize shared state outside the helper.
+        rate_limiter: Per-account limiter each attempt waits on, if any.
+        request_scheduler: Per-account scheduler each attempt takes a slot
+            from, if any. The slot is held only while the attempt is in flight.
+        attempt_slot: Shared limiter, such as the cross-entry full-refresh
+            semaphore, each attempt holds while in flight, if any. Backoff
+            sleeps between attempts do not hold it.
+        priority: Lane the attempts are queued in; also selects the read or
+            write rate-limit budget.
+        deadline: End-to-end budget in seconds for all attempts, if any.
+        metrics: Per-account instrumentation that records the call, each
+            attempt's latency and error class, and retries, if any.
 
     Returns:
         T: The result returned by `operation` on success.
 
     Raises:
+        CarrierCircuitOpenError: When the circuit breaker does not allow the call.
+        CarrierDeadlineExceededError: When the deadline expires before an
+            attempt could start.
         CarrierUnauthorizedError: When 401s escalate beyond the shared threshold
             or a retry-enabled unauthorized policy exhausts its attempts.
         BaseException: Any non-retryable error from `operation`, or the last
             transient error after attempts are exhausted or escalated.
     """
+    loop = asyncio.get_running_loop()
+    deadline_at = None if deadline is None else loop.time() + deadline
+    if metrics is not None:
+        metrics.record_call(operation_name)
     attempt = 0
+    state.retry_budget.record_first_attempt()
     while True:
+        if attempt and metrics is not None:
+            metrics.record_retry(operation_name)
+        if not state.breaker_allows_request():
+            raise CarrierCircuitOpenError(
+                f"Carrier circuit breaker is open; skipped {operation_name}."
+            )
+        # Only a half-open breaker hands out the probe, so this caller holds it
+        # exactly when the breaker is half-open right after admission.
+        holds_probe = state.breaker_state is BreakerState.HALF_OPEN
+        attempt_timeout = await _async_admit_attempt(
+            state,
+            operation_name,
+            rate_limiter=rate_limiter,
+            request_scheduler=request_scheduler,
+            attempt_slot=attempt_slot,
+            priority=priority,
+            deadline_at=deadline_at,
+            holds_probe=holds_probe,
+        )
+        started = loop.time()
         try:
-            result = await operation()
-        except asyncio.CancelledError, KeyboardInterrupt, SystemExit:
-            raise
+            try:
+                result = await _async_run_attempt(
+                    operation, attempt_timeout, operation_name, state.latency
+                )
+            finally:
+                if request_scheduler is not None:
+                    request_scheduler.release()
+                if attempt_slot is not None:
+                    attempt_slot.release()
+                # However the probe ends (answer, error, timeout, or
+                # cancellation), hand it back; the outcome handling below then
+                # closes or re-opens the breaker before anything else can run.
+                if holds_probe:
+                    state.release_probe()
         except Exception as error:
+            if metrics is not None:
+                metrics.record_attempt(operation_name, error)
+            retry_after = throttle_retry_after(error)
+            if rate_limiter is not None and retry_after is not None:
+                rate_limiter.note_throttled(retry_after)
+            if not is_transient_transport_error(error):
+                state.close_breaker()
             if is_unauthorized_error(error):
                 if manage_unauthorized_state:
                     escalated = state.record_unauthorized(logger, operation_name)
@@ -273,7 +693,10 @@ async def async_call_with_retry[T](
                         raise CarrierUnauthorizedError(
                             f"Carrier API rejected {operation_name} after {attempt + 1} retries."
                         ) from error
-                    await asyncio.sleep(compute_backoff_delay(policy, attempt))
+                    delay = compute_backoff_delay(policy, attempt)
+                    if not _retry_allowed(state, deadline_at, delay, operation_name, logger):
+                        raise
+                    await asyncio.sleep(delay)
                     attempt += 1
                     continue
                 raise
@@ -283,11 +706,19 @@ async def async_call_with_retry[T](
                     raise
                 if policy.max_attempts is not None and attempt + 1 >= policy.max_attempts:
                     raise
-                await asyncio.sleep(compute_backoff_delay(policy, attempt))
+                delay = compute_backoff_delay(policy, attempt)
+                if not _retry_allowed(state, deadline_at, delay, operation_name, logger):
+                    raise
+                await asyncio.sleep(delay)
                 attempt += 1
                 continue
             raise
         else:
+            elapsed = loop.time() - started
+            if metrics is not None:
+                metrics.record_attempt(operation_name)
+            state.latency.record(operation_name, elapsed)
+            state.close_breaker()
             if reset_state_on_success:
                 state.reset()
             return result
@@ -0,0 +1,112 @@
+"""Integration-wide scheduling shared by every Carrier config entry.
+
+Accounts configured side by side (one per property, for example) would all log
+in, run ``load_data``, and open websockets at the same instant after a Home
+Assistant restart, and their polls would stay phase-locked from then on. One
+`CarrierScheduler` lives in ``hass.data[DOMAIN]`` and gives each config entry a
+deterministic phase derived from its entry ID, so periodic polls, starting
+with the first one after setup, spread across the interval. Setup itself is
+never delayed; instead the scheduler caps how many logins, token refreshes and
+full refreshes run at once across all entries.
+
+With a single configured entry there is nothing to spread, so the poll interval
+is returned unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+import hashlib
+import logging
+from math import ceil
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, MAX_CONCURRENT_FULL_REFRESHES, MAX_CONCURRENT_LOGINS
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class CarrierScheduler:
+    """Stagger and throttle Carrier traffic across all config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize shared concurrency limits.
+
+        Args:
+            hass: Home Assistant instance whose Carrier config entries are scheduled.
+        """
+        self.hass: HomeAssistant = hass
+        self.login_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOGINS)
+        self.full_refresh_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FULL_REFRESHES)
+
+    @staticmethod
+    def phase_fraction(entry_id: str) -> float:
+        """Return a stable position in ``[0, 1)`` for one config entry.
+
+        A hash is used instead of setup order so the phase survives restarts and
+        does not depend on which entry Home Assistant happened to load first.
+
+        Args:
+            entry_id: Config entry ID to place.
+
+        Returns:
+            float: Fraction of an interval this entry is offset by.
+        """
+        digest = hashlib.sha256(entry_id.encode()).digest()
+        return int.from_bytes(digest[:8], "big") / 2**64
+
+    def _peer_count(self) -> int:
+        """Return how many enabled Carrier config entries share this scheduler."""
+        return len(self.hass.config_entries.async_entries(DOMAIN, include_disabled=False))
+
+    def next_poll_interval(
+        self, entry_id: str, interval: timedelta, now: datetime | None = None
+    ) -> timedelta:
+        """Return the wait until this entry's next phase-aligned poll slot.
+
+        Slots repeat every ``interval`` at ``phase_fraction(entry_id) * interval``
+        past the epoch, so entries that recover from a shared outage at the same
+        moment drift back to their own slots instead of staying in lockstep. A
+        slot closer than half an interval is skipped so the effective poll rate
+        never more than doubles.
+
+        Args:
+            entry_id: Config entry scheduling its next poll.
+            interval: Nominal poll interval.
+            now: Current time; defaults to the wall clock.
+
+        Returns:
+            timedelta: Interval to hand to the coordinator. Equal to ``interval``
+                when this is the only Carrier entry.
+        """
+        if self._peer_count() <= 1:
+            return interval
+        period = interval.total_seconds()
+        if period <= 0:
+            return interval
+        timestamp = (now or datetime.now(UTC)).timestamp()
+        phase = self.phase_fraction(entry_id) * period
+        next_slot = ceil((timestamp - phase) / period) * period + phase
+        wait = next_slot - timestamp
+        if wait < period / 2:
+            wait += period
+        return timedelta(seconds=wait)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> CarrierScheduler:
+    """Return the integration-wide scheduler, creating it on first use.
+
+    Args:
+        hass: Home Assistant instance.
+
+    Returns:
+        CarrierScheduler: Scheduler stored in ``hass.data[DOMAIN]``.
+    """
+    scheduler: CarrierScheduler | None = hass.data.get(DOMAIN)
+    if scheduler is None:
+        scheduler = CarrierScheduler(hass)
+        hass.data[DOMAIN] = scheduler
+    return scheduler
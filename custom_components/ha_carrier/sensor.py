@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import ClassVar
 
 from carrier_api import EnergyPeriod, EnergyUsageMetric, StatusUnit, TemperatureUnits
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
@@ -12,6 +13,7 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfPressure,
     UnitOfTemperature,
+    UnitOfTime,
     UnitOfVolume,
     UnitOfVolumeFlowRate,
 )
@@ -21,10 +23,18 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import ConfigEntryCarrier
 from .carrier_data_update_coordinator import CarrierDataUpdateCoordinator
 from .carrier_entity import CarrierEntity, CarrierZoneEntity
+from .resiliency import BreakerState
 from .util import TIMESTAMP_TYPES
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Rolling one-hour counters exposed by ApiMetricRateSensor.
+API_METRIC_RATE_TYPES: tuple[str, ...] = (
+    "calls_last_hour",
+    "errors_last_hour",
+    "websocket_messages_last_hour",
+)
+
 
 def _unit_status_attributes(unit: StatusUnit | None) -> dict[str, object]:
     """Return Home Assistant attributes for mapped Carrier unit status details.
@@ -86,6 +96,24 @@ async def async_setup_entry(
                 for timestamp_type in TIMESTAMP_TYPES
             ]
         )
+        entities.append(
+            CircuitBreakerSensor(
+                coordinator=coordinator, system_serial=carrier_system.profile.serial
+            )
+        )
+        entities.extend(
+            [
+                ApiMetricRateSensor(
+                    coordinator=coordinator,
+                    system_serial=carrier_system.profile.serial,
+                    metric_type=metric_type,
+                )
+                for metric_type in API_METRIC_RATE_TYPES
+            ]
+        )
+        entities.append(
+            ApiLatencySensor(coordinator=coordinator, system_serial=carrier_system.profile.serial)
+        )
 
         if carrier_system.profile.outdoor_unit_type in ["varcaphp", "varcapac"]:
             entities.append(
@@ -664,6 +692,108 @@ class TimestampSensor(CarrierSensor):
         self._attr_available = self._attr_native_value is not None
 
 
+class CircuitBreakerSensor(CarrierSensor):
+    """Diagnostic sensor reporting the shared Carrier API circuit breaker position."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options: ClassVar[list[str]] = [state.value for state in BreakerState]
+
+    def __init__(self, coordinator: CarrierDataUpdateCoordinator, system_serial: str) -> None:
+        """Initialize the circuit breaker sensor.
+
+        Args:
+            coordinator: Coordinator that owns the resiliency state.
+            system_serial: Carrier system serial for this entity.
+        """
+        super().__init__(
+            entity_name="API Circuit Breaker",
+            coordinator=coordinator,
+            system_serial=system_serial,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Stay available while refreshes fail so an open breaker is visible.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def _update_entity_attrs(self) -> None:
+        """Update breaker state from the coordinator resiliency state."""
+        self._attr_native_value = self.coordinator.resiliency.breaker_state.value
+        self._attr_available = True
+
+
+class ApiMetricRateSensor(CarrierSensor):
+    """Disabled-by-default diagnostic sensor for one rolling Carrier API rate."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self, coordinator: CarrierDataUpdateCoordinator, system_serial: str, metric_type: str
+    ) -> None:
+        """Initialize a rate sensor bound to one `ApiMetrics` counter.
+
+        Args:
+            coordinator: Coordinator that owns the API metrics.
+            system_serial: Carrier system serial for this entity.
+            metric_type: Counter name such as "calls_last_hour".
+        """
+        self.metric_type = metric_type
+        super().__init__(
+            entity_name=f"API {metric_type.replace('_', ' ').title()}",
+            coordinator=coordinator,
+            system_serial=system_serial,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Stay available while refreshes fail so failing calls are counted.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def _update_entity_attrs(self) -> None:
+        """Update the rate from coordinator metrics."""
+        self._attr_native_value = getattr(self.coordinator.metrics, self.metric_type)
+        self._attr_available = True
+
+
+class ApiLatencySensor(CarrierSensor):
+    """Disabled-by-default diagnostic sensor for recent p95 Carrier API latency."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+
+    def __init__(self, coordinator: CarrierDataUpdateCoordinator, system_serial: str) -> None:
+        """Initialize the API latency sensor.
+
+        Args:
+            coordinator: Coordinator that owns the API metrics.
+            system_serial: Carrier system serial for this entity.
+        """
+        super().__init__(
+            entity_name="API Latency p95",
+            coordinator=coordinator,
+            system_serial=system_serial,
+        )
+
+    def _update_entity_attrs(self) -> None:
+        """Update p95 latency from coordinator metrics."""
+        self._attr_native_value = self.coordinator.metrics.latency_p95()
+        self._attr_available = self._attr_native_value is not None
+
+
 class AirflowSensor(CarrierSensor):
     """Sensor entity that reports indoor airflow in CFM."""
 
@@ -0,0 +1,207 @@
+"""Home Assistant services for profiling and tracing a Carrier config entry."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+import voluptuous as vol
+
+from .carrier_data_update_coordinator import CarrierDataUpdateCoordinator
+from .const import (
+    DOMAIN,
+    ENTITY_PROFILE_DEFAULT_SECONDS,
+    ENTITY_PROFILE_MAX_SECONDS,
+    PROFILE_CAPTURE_DEFAULT_CYCLES,
+    PROFILE_CAPTURE_MAX_CYCLES,
+    WEBSOCKET_TRACE_DEFAULT_SECONDS,
+    WEBSOCKET_TRACE_MAX_SECONDS,
+)
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+SERVICE_PROFILE_ENTITIES = "profile_entities"
+SERVICE_RECORD_WEBSOCKET = "record_websocket"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_DURATION = "duration"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=PROFILE_CAPTURE_DEFAULT_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_CAPTURE_MAX_CYCLES)
+        ),
+    }
+)
+
+PROFILE_ENTITIES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=ENTITY_PROFILE_DEFAULT_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=ENTITY_PROFILE_MAX_SECONDS)
+        ),
+    }
+)
+
+RECORD_WEBSOCKET_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=WEBSOCKET_TRACE_DEFAULT_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=WEBSOCKET_TRACE_MAX_SECONDS)
+        ),
+    }
+)
+
+
+def _output_path(hass: HomeAssistant, call: ServiceCall, kind: str, suffix: str) -> Path:
+    """Return a timestamped file path in the Home Assistant config directory.
+
+    Args:
+        hass: Home Assistant instance.
+        call: Service call carrying ``config_entry_id``.
+        kind: File kind, e.g. "profile".
+        suffix: File extension including the dot.
+
+    Returns:
+        Path: Path that does not collide with earlier captures.
+    """
+    stamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    return Path(hass.config.path(f"{DOMAIN}_{kind}_{entry_id}_{stamp}{suffix}"))
+
+
+def _loaded_coordinator(hass: HomeAssistant, call: ServiceCall) -> CarrierDataUpdateCoordinator:
+    """Return the coordinator of the loaded config entry a service call targets.
+
+    Args:
+        hass: Home Assistant instance.
+        call: Service call carrying ``config_entry_id``.
+
+    Returns:
+        CarrierDataUpdateCoordinator: Coordinator owned by that entry.
+
+    Raises:
+        ServiceValidationError: Raised when the entry is unknown, belongs to
+            another integration, or is not loaded.
+    """
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(f"No Carrier config entry with ID {entry_id}.")
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"Carrier config entry {entry.title} is not loaded.")
+    return entry.runtime_data
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services.
+
+    Args:
+        hass: Home Assistant instance.
+    """
+
+    @callback
+    def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the next refresh and websocket cycles of one config entry.
+
+        Args:
+            call: Service call with the target entry and cycle count.
+
+        Returns:
+            ServiceResponse: Path the ``.cprof`` file will be written to.
+
+        Raises:
+            ServiceValidationError: Raised when a capture is already running
+                for the entry.
+        """
+        coordinator = _loaded_coordinator(hass, call)
+        if coordinator.cycle_profiler.active:
+            raise ServiceValidationError("A Carrier profile capture is already running.")
+        output_path = _output_path(hass, call, "profile", ".cprof")
+        coordinator.cycle_profiler.start(hass, call.data[ATTR_CYCLES], output_path)
+        _LOGGER.info(
+            "profiling the next %d Carrier cycles into %s", call.data[ATTR_CYCLES], output_path
+        )
+        return {"path": str(output_path)}
+
+    @callback
+    def async_profile_entities(call: ServiceCall) -> None:
+        """Start a bounded per-entity update cost profiling window.
+
+        Args:
+            call: Service call with the target entry and window length.
+        """
+        coordinator = _loaded_coordinator(hass, call)
+        duration = call.data[ATTR_DURATION]
+        coordinator.entity_profiler.start(duration)
+        _LOGGER.info(
+            "profiling Carrier entity updates for %.0f seconds; results are in diagnostics",
+            duration,
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    @callback
+    def async_record_websocket(call: ServiceCall) -> ServiceResponse:
+        """Record one config entry's websocket messages to a replayable trace.
+
+        Args:
+            call: Service call with the target entry and window length.
+
+        Returns:
+            ServiceResponse: Path the trace will be written to.
+
+        Raises:
+            ServiceValidationError: Raised when a recording is already running
+                for the entry.
+        """
+        coordinator = _loaded_coordinator(hass, call)
+        if coordinator.websocket_recorder.active:
+            raise ServiceValidationError("A Carrier websocket recording is already running.")
+        output_path = _output_path(hass, call, "websocket", ".jsonl.gz")
+        coordinator.websocket_recorder.start(
+            hass,
+            call.data[ATTR_DURATION],
+            output_path,
+            [system.profile.serial for system in coordinator.systems],
+        )
+        _LOGGER.info(
+            "recording Carrier websocket messages for %.0f seconds into %s",
+            call.data[ATTR_DURATION],
+            output_path,
+        )
+        return {"path": str(output_path)}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECORD_WEBSOCKET,
+        async_record_websocket,
+        schema=RECORD_WEBSOCKET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_ENTITIES,
+        async_profile_entities,
+        schema=PROFILE_ENTITIES_SCHEMA,
+    )
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+import json
 import logging
 from typing import Any, overload
 
@@ -13,13 +16,20 @@ from carrier_api import (
     CarrierApiError,
     CarrierApiTokenRefreshError,
     CarrierApiWebsocketError,
+    Config,
+    Energy,
+    Profile,
+    Status,
+    System,
 )
 from homeassistant.core import callback
+from homeassistant.helpers.json import json_bytes
 
+from .const import RATE_LIMIT_THROTTLED_DEFAULT_SECONDS
 from .exceptions import CarrierUnauthorizedError
+from .redaction import compile_redactor
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
-REDACTED = "**REDACTED**"
 
 TIMESTAMP_TYPES: tuple[str, ...] = ("all_data", "websocket", "energy")
 
@@ -107,36 +117,19 @@ def async_redact_data[T](data: T, to_redact: Iterable[Any]) -> T: ...
 
 @callback
 def async_redact_data(data: Any, to_redact: Iterable[Any]) -> Any:
-    """Recursively redact selected keys from mapping and list structures.
+    """Redact selected keys from mapping and list structures.
+
+    Only the mappings and lists on a path to a redacted key are copied; see
+    `Redactor` for the sharing rules.
 
     Args:
         data: Original value that may contain nested mappings or lists.
         to_redact: Iterable of keys that should be replaced with a redaction marker.
 
     Returns:
-        Any: Copy of the original data with sensitive values redacted.
+        Any: ``data`` with sensitive values redacted, sharing unchanged subtrees.
     """
-    if not isinstance(data, Mapping | list):
-        return data
-
-    if isinstance(data, list):
-        return [async_redact_data(val, to_redact) for val in data]
-
-    redacted = {**data}
-
-    for key, value in redacted.items():
-        if value is None:
-            continue
-        if isinstance(value, str) and not value:
-            continue
-        if key in to_redact:
-            redacted[key] = REDACTED
-        elif isinstance(value, Mapping):
-            redacted[key] = async_redact_data(value, to_redact)
-        elif isinstance(value, list):
-            redacted[key] = [async_redact_data(item, to_redact) for item in value]
-
-    return redacted
+    return compile_redactor(frozenset(to_redact)).redact(data)
 
 
 def _iter_exception_chain(error: BaseException) -> Iterable[BaseException]:
@@ -190,3 +183,138 @@ def is_transient_transport_error(error: BaseException) -> bool:
         isinstance(current, TRANSIENT_TRANSPORT_EXCEPTIONS)
         for current in _iter_exception_chain(error)
     )
+
+
+def _parse_retry_after(value: object) -> float | None:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date.
+
+    Args:
+        value: Raw header value.
+
+    Returns:
+        float | None: Non-negative seconds to wait, or None when unparseable.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+# Raw payload attribute of each carrier_api model, in output order.
+SYSTEM_RAW_PARTS: tuple[str, ...] = ("profile", "status", "config", "energy")
+
+
+def system_raw_snapshot(system: System) -> bytes:
+    """Copy a system's raw payloads to JSON bytes.
+
+    The copy is cheap enough for the event loop and cannot be changed by later
+    websocket merges, so executor jobs can work on it safely.
+
+    Args:
+        system: Carrier system to copy.
+
+    Returns:
+        bytes: JSON object of the raw payloads keyed by `SYSTEM_RAW_PARTS`.
+    """
+    return json_bytes({part: getattr(system, part).raw for part in SYSTEM_RAW_PARTS})
+
+
+def system_from_raw(raw: Mapping[str, Any]) -> System:
+    """Rebuild a carrier_api system from its raw payloads.
+
+    Args:
+        raw: Parsed `system_raw_snapshot` output.
+
+    Returns:
+        System: System detached from the coordinator's live systems.
+    """
+    return System(
+        profile=Profile(raw=raw["profile"]),
+        status=Status(raw=raw["status"]),
+        config=Config(raw=raw["config"]),
+        energy=Energy(raw=raw["energy"]),
+    )
+
+
+def parse_websocket_message(websocket_message: str) -> dict[str, Any] | None:
+    """Parse a raw websocket message once for the integration's own consumers.
+
+    carrier_api parses each message again when it merges it; everything else
+    that reads the message shares this parse.
+
+    Args:
+        websocket_message: Raw websocket message text.
+
+    Returns:
+        dict[str, Any] | None: Message object, or None when the text is not a
+            JSON object.
+    """
+    try:
+        payload = json.loads(websocket_message)
+    except TypeError, ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def carrier_message_timestamp(payload: Mapping[str, Any]) -> datetime | None:
+    """Return when Carrier says a websocket message was produced.
+
+    Carrier stamps messages with ``timestamp`` (falling back to
+    ``updatedTime``) as either an ISO 8601 string or epoch seconds or
+    milliseconds.
+
+    Args:
+        payload: Parsed websocket message.
+
+    Returns:
+        datetime | None: Aware UTC timestamp, or None when the message has no
+            usable timestamp.
+    """
+    value = payload.get("timestamp") or payload.get("updatedTime")
+    try:
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            # Epoch milliseconds pass 1e11 in 1973; epoch seconds will not until 5138.
+            return datetime.fromtimestamp(value / 1000 if value > 1e11 else value, UTC)
+        if isinstance(value, str) and value:
+            stamp = datetime.fromisoformat(value)
+            return stamp if stamp.tzinfo is not None else stamp.replace(tzinfo=UTC)
+    except OverflowError, OSError, ValueError:
+        return None
+    return None
+
+
+def throttle_retry_after(error: BaseException) -> float | None:
+    """Return Carrier's requested back-off when the error chain holds an HTTP 429.
+
+    carrier_api wraps transport failures, so the 429 is found on the aiohttp
+    ``ClientResponseError`` (``status``) or gql ``TransportServerError``
+    (``code``) somewhere in the cause chain.
+
+    Args:
+        error: Exception raised by the Carrier client or transport.
+
+    Returns:
+        float | None: Seconds from ``Retry-After`` when present,
+            ``RATE_LIMIT_THROTTLED_DEFAULT_SECONDS`` for a 429 without a usable
+            header, or None when Carrier did not throttle.
+    """
+    for current in _iter_exception_chain(error):
+        status = getattr(current, "status", None) or getattr(current, "code", None)
+        if status != 429:
+            continue
+        headers = getattr(current, "headers", None)
+        if isinstance(headers, Mapping):
+            retry_after = _parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        return RATE_LIMIT_THROTTLED_DEFAULT_SECONDS
+    return None
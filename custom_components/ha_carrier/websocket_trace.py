@@ -0,0 +1,260 @@
+"""Record Carrier websocket traffic to a trace file and replay it offline.
+
+The ``ha_carrier.record_websocket`` service arms the coordinator's
+`WebsocketTraceRecorder`. While it is armed, every raw websocket message is
+recorded with its offset from the start of the recording. Keys in
+``TO_REDACT_RAW`` are redacted, and the ``deviceId`` serial is replaced with a
+stable pseudonym per system: ``system-1``, ``system-2``, and so on, numbered in
+the coordinator's system order. Entries are appended in batches from an
+executor as gzip-compressed JSON lines, so a crash or unload loses at most the
+last batch:
+
+    {"offset": 12.503, "message": {"messageType": "InfinityStatus", ...}}
+
+`async_replay_trace` feeds a trace back through the same callback the live
+websocket uses, `CarrierDataUpdateCoordinator.async_handle_websocket_message`,
+which merges each message through ``WebsocketDataUpdater.message_handler`` and
+then notifies listeners. Pseudonyms map back onto the coordinator's systems in
+order. It replays at recorded speed or as fast as possible, which gives
+benchmarks and regression tests realistic load without a Carrier account.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping, Sequence
+import gzip
+import json
+import logging
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    TO_REDACT_WEBSOCKET,
+    WEBSOCKET_TRACE_FLUSH_MESSAGES,
+    WEBSOCKET_TRACE_FLUSH_SECONDS,
+    WEBSOCKET_TRACE_MAX_MESSAGES,
+)
+from .redaction import REDACTED, compile_redactor
+
+if TYPE_CHECKING:
+    from .carrier_data_update_coordinator import CarrierDataUpdateCoordinator
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+_REDACT_WEBSOCKET = compile_redactor(frozenset(TO_REDACT_WEBSOCKET))
+PSEUDONYM_PREFIX = "system-"
+
+
+def append_trace(output_path: Path, lines: list[str]) -> None:
+    """Append trace lines to a gzip-compressed JSONL file.
+
+    Each call adds one gzip member, which `gzip` reads back as a single
+    stream. Runs in an executor because it does blocking file I/O.
+
+    Args:
+        output_path: ``.jsonl.gz`` file to create or extend.
+        lines: Serialized trace entries, one per message.
+    """
+    with gzip.open(output_path, "at", encoding="utf-8") as trace:
+        trace.writelines(f"{line}\n" for line in lines)
+
+
+def read_trace(trace_path: Path) -> list[dict[str, Any]]:
+    """Read a recorded websocket trace.
+
+    Blocking; call from an executor inside Home Assistant.
+
+    Args:
+        trace_path: ``.jsonl.gz`` file written by `WebsocketTraceRecorder`.
+
+    Returns:
+        list[dict[str, Any]]: Entries with ``offset`` seconds and ``message``.
+    """
+    with gzip.open(trace_path, "rt", encoding="utf-8") as trace:
+        return [json.loads(line) for line in trace if line.strip()]
+
+
+class WebsocketTraceRecorder:
+    """Opt-in, time-boxed recorder of one entry's raw websocket messages."""
+
+    def __init__(self) -> None:
+        """Initialize an idle recorder."""
+        self.output_path: Path | None = None
+        self._hass: HomeAssistant | None = None
+        self._batch: list[str] = []
+        self._recorded = 0
+        self._pseudonyms: dict[str, str] = {}
+        self._started = 0.0
+        self._flushed = 0.0
+        self._write: asyncio.Task[None] | None = None
+        self._cancel_timeout: CALLBACK_TYPE | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return whether messages are being recorded."""
+        return self.output_path is not None
+
+    @callback
+    def start(
+        self,
+        hass: HomeAssistant,
+        duration: float,
+        output_path: Path,
+        serials: Sequence[str] = (),
+    ) -> None:
+        """Record messages for ``duration`` seconds into ``output_path``.
+
+        Args:
+            hass: Home Assistant instance used to write the trace.
+            duration: Recording window in seconds.
+            output_path: ``.jsonl.gz`` file the trace is written to.
+            serials: The coordinator's system serials in order; they become
+                ``system-1``, ``system-2``, and so on. Serials first seen in
+                a message are numbered after them.
+        """
+        self._hass = hass
+        self._batch = []
+        self._recorded = 0
+        self._pseudonyms = {
+            serial: f"{PSEUDONYM_PREFIX}{index}" for index, serial in enumerate(serials, 1)
+        }
+        self._started = self._flushed = time.monotonic()
+        self.output_path = output_path
+        self._cancel_timeout = async_call_later(hass, duration, self._async_window_closed)
+
+    def _pseudonym(self, serial: str) -> str:
+        """Return the stable pseudonym for one system serial."""
+        if (pseudonym := self._pseudonyms.get(serial)) is None:
+            pseudonym = f"{PSEUDONYM_PREFIX}{len(self._pseudonyms) + 1}"
+            self._pseudonyms[serial] = pseudonym
+        return pseudonym
+
+    def record(self, message: Mapping[str, Any] | None) -> None:
+        """Redact one websocket message and queue it for the trace.
+
+        Args:
+            message: Parsed websocket message, or None when it was not a JSON
+                object.
+        """
+        if self.output_path is None:
+            return
+        if message is None:
+            _LOGGER.debug("skipping non-JSON websocket message in trace")
+            return
+        redacted = _REDACT_WEBSOCKET.redact(message)
+        if isinstance(serial := message.get("deviceId"), str) and serial:
+            redacted = {**redacted, "deviceId": self._pseudonym(serial)}
+        now = time.monotonic()
+        self._batch.append(
+            json.dumps({"offset": round(now - self._started, 6), "message": redacted})
+        )
+        self._recorded += 1
+        if self._recorded >= WEBSOCKET_TRACE_MAX_MESSAGES:
+            _LOGGER.info("websocket trace reached %d messages", WEBSOCKET_TRACE_MAX_MESSAGES)
+            self.stop()
+        elif (
+            len(self._batch) >= WEBSOCKET_TRACE_FLUSH_MESSAGES
+            or now - self._flushed >= WEBSOCKET_TRACE_FLUSH_SECONDS
+        ):
+            self._flush()
+
+    @callback
+    def _flush(self) -> None:
+        """Append the queued lines to the trace in an executor."""
+        output_path, hass = self.output_path, self._hass
+        if output_path is None or hass is None:
+            return
+        lines, self._batch = self._batch, []
+        self._flushed = time.monotonic()
+        # Each write waits for the previous one so batches stay in order.
+        self._write = hass.async_create_task(
+            self._async_append(hass, self._write, output_path, lines),
+            "ha_carrier websocket trace write",
+        )
+
+    @staticmethod
+    async def _async_append(
+        hass: HomeAssistant,
+        previous: asyncio.Task[None] | None,
+        output_path: Path,
+        lines: list[str],
+    ) -> None:
+        """Append one batch once the previous batch has been written."""
+        if previous is not None:
+            await asyncio.wait([previous])
+        try:
+            await hass.async_add_executor_job(append_trace, output_path, lines)
+        except OSError:
+            _LOGGER.warning("writing the websocket trace to %s failed", output_path, exc_info=True)
+
+    @callback
+    def _async_window_closed(self, _now: object) -> None:
+        """Stop recording when the window ends."""
+        self._cancel_timeout = None
+        self.stop()
+
+    @callback
+    def stop(self) -> None:
+        """Stop recording and append the remaining lines in an executor."""
+        if self._cancel_timeout is not None:
+            self._cancel_timeout()
+            self._cancel_timeout = None
+        if self.output_path is None:
+            return
+        _LOGGER.info("writing %d websocket messages to %s", self._recorded, self.output_path)
+        self._flush()
+        self.output_path = None
+        self._pseudonyms = {}
+
+
+async def async_replay_trace(
+    coordinator: CarrierDataUpdateCoordinator,
+    entries: Iterable[Mapping[str, Any]],
+    *,
+    realtime: bool = False,
+    serial: str | None = None,
+) -> int:
+    """Feed recorded messages through the coordinator's websocket callback.
+
+    A ``system-N`` pseudonym is sent to the coordinator's Nth system, wrapping
+    around when the trace has more systems than the coordinator.
+
+    Args:
+        coordinator: Coordinator with loaded systems to apply messages to.
+        entries: Trace entries from `read_trace`.
+        realtime: Keep the recorded gaps between messages instead of
+            replaying as fast as possible.
+        serial: System that ``deviceId`` values without a pseudonym, such as
+            the fully redacted ids of older traces, are sent to; defaults to
+            the coordinator's first system.
+
+    Returns:
+        int: Number of messages replayed.
+    """
+    serials = [system.profile.serial for system in coordinator.systems]
+    target_serial = serial or serials[0]
+    started = time.monotonic()
+    replayed = 0
+    for entry in entries:
+        if realtime:
+            delay = entry["offset"] - (time.monotonic() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        message = dict(entry["message"])
+        device_id = message.get("deviceId")
+        if device_id == REDACTED:
+            message["deviceId"] = target_serial
+        elif isinstance(device_id, str) and device_id.startswith(PSEUDONYM_PREFIX):
+            index = device_id.removeprefix(PSEUDONYM_PREFIX)
+            message["deviceId"] = (
+                serials[(int(index) - 1) % len(serials)] if index.isdigit() else target_serial
+            )
+        websocket_message = json.dumps(message)
+        await coordinator.async_handle_websocket_message(websocket_message)
+        replayed += 1
+    return replayed
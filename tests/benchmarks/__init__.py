@@ -0,0 +1 @@
+"""Opt-in performance benchmarks for the Carrier integration."""
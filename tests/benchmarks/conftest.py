@@ -0,0 +1,155 @@
+"""Fixtures and result recording for the opt-in Carrier benchmarks.
+
+Benchmarks are skipped unless ``CARRIER_BENCHMARK`` is set. Results for the
+whole session are written as JSON to ``CARRIER_BENCHMARK_OUTPUT`` (default
+``benchmark-results.json``) so runs from different releases can be diffed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import UTC, datetime
+from importlib.metadata import version
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from custom_components.ha_carrier.const import VERSION
+from tests.conftest import FakeCarrierApiConnection, build_scaled_systems
+
+BENCHMARK_ENV = "CARRIER_BENCHMARK"
+BENCHMARK_OUTPUT_ENV = "CARRIER_BENCHMARK_OUTPUT"
+BENCHMARK_ROUNDS = 20
+
+# Grid of account sizes every benchmark runs at.
+SYSTEM_COUNTS: tuple[int, ...] = (1, 5, 10)
+ZONE_COUNTS: tuple[int, ...] = (1, 4, 8)
+
+requires_benchmark = pytest.mark.skipif(
+    not os.environ.get(BENCHMARK_ENV), reason=f"set {BENCHMARK_ENV}=1 to run benchmarks"
+)
+
+
+class BenchmarkRecorder:
+    """Collect benchmark timings for one session."""
+
+    def __init__(self) -> None:
+        """Initialize an empty result set."""
+        self.results: list[dict[str, Any]] = []
+
+    async def async_measure(
+        self,
+        name: str,
+        operation: Callable[[], Awaitable[Any]],
+        *,
+        params: dict[str, Any],
+        units: int = 1,
+        rounds: int = BENCHMARK_ROUNDS,
+    ) -> dict[str, Any]:
+        """Time ``operation`` over ``rounds`` runs and record the summary.
+
+        The untimed warm-up run is traced with ``tracemalloc`` to record how
+        much memory one run allocates at its peak.
+
+        Args:
+            name: Benchmark name.
+            operation: Coroutine function to time.
+            params: Parameters identifying the case, e.g. system and zone counts.
+            units: Work items per round (messages, entities) for throughput.
+            rounds: Timed runs after one untimed warm-up run.
+
+        Returns:
+            dict[str, Any]: Recorded result.
+        """
+        peak_memory_bytes = await _async_peak_memory(operation)
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            await operation()
+            samples.append(time.perf_counter() - started)
+        median = statistics.median(samples)
+        result = {
+            "name": name,
+            "params": params,
+            "rounds": rounds,
+            "units": units,
+            "min_seconds": min(samples),
+            "median_seconds": median,
+            "mean_seconds": statistics.fmean(samples),
+            "max_seconds": max(samples),
+            "units_per_second": units / median if median else None,
+            "peak_memory_bytes": peak_memory_bytes,
+        }
+        self.results.append(result)
+        return result
+
+    def write(self, output_path: Path) -> None:
+        """Write the session's results with environment metadata.
+
+        Args:
+            output_path: JSON file to write.
+        """
+        payload = {
+            "created_at": datetime.now(UTC).isoformat(),
+            "integration_version": VERSION,
+            "carrier_api_version": version("carrier-api"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": self.results,
+        }
+        output_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+async def _async_peak_memory(operation: Callable[[], Awaitable[Any]]) -> int:
+    """Run ``operation`` once and return the peak memory it allocated.
+
+    Args:
+        operation: Coroutine function to run.
+
+    Returns:
+        int: Peak traced bytes above what was allocated before the run.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if already_tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    try:
+        baseline, _peak = tracemalloc.get_traced_memory()
+        await operation()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return max(peak - baseline, 0)
+
+
+@pytest.fixture(scope="session")
+def benchmark_recorder() -> Iterator[BenchmarkRecorder]:
+    """Return the session recorder and write its results at session end."""
+    recorder = BenchmarkRecorder()
+    yield recorder
+    if recorder.results:
+        recorder.write(Path(os.environ.get(BENCHMARK_OUTPUT_ENV, "benchmark-results.json")))
+
+
+@pytest.fixture(
+    params=[(systems, zones) for systems in SYSTEM_COUNTS for zones in ZONE_COUNTS],
+    ids=lambda size: f"{size[0]}sys-{size[1]}zones",
+)
+def account_size(request: pytest.FixtureRequest) -> tuple[int, int]:
+    """Return the (systems, zones per system) case being benchmarked."""
+    return request.param
+
+
+@pytest.fixture
+def carrier_api(account_size: tuple[int, int]) -> FakeCarrierApiConnection:
+    """Return a fake Carrier account sized for the current benchmark case."""
+    return FakeCarrierApiConnection(systems=build_scaled_systems(*account_size))
@@ -0,0 +1,222 @@
+"""Benchmarks for websocket fan-out and refresh cost as accounts grow.
+
+Run with ``scripts/benchmark``; every case is parameterized over the
+``SYSTEM_COUNTS`` x ``ZONE_COUNTS`` grid from the benchmark conftest.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import functools
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data as ha_redact_data
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.ha_carrier.carrier_data_update_coordinator import (
+    CarrierDataUpdateCoordinator,
+)
+from custom_components.ha_carrier.const import TO_REDACT_RAW
+from custom_components.ha_carrier.rate_limiter import CarrierRateLimiter, TokenBucket
+from custom_components.ha_carrier.redaction import compile_redactor
+from custom_components.ha_carrier.websocket_trace import async_replay_trace, read_trace
+from tests.conftest import FakeCarrierApiConnection, build_scaled_systems
+from tests.loop_blocking import allow_loop_blocking
+
+from .conftest import BenchmarkRecorder, requires_benchmark
+
+# Debug mode slows every callback and would skew the timings.
+pytestmark = [requires_benchmark, allow_loop_blocking]
+
+# Simulated Carrier round trip for each energy request.
+ENERGY_LATENCY_SECONDS = 0.02
+ENERGY_ROUNDS = 5
+# Recorded websocket trace (from ha_carrier.record_websocket) to replay.
+TRACE_ENV = "CARRIER_BENCHMARK_TRACE"
+
+
+async def _async_setup_coordinator(
+    setup_integration: Callable[..., Any],
+) -> CarrierDataUpdateCoordinator:
+    """Set up the integration and lift the rate limits for repeated calls."""
+    config_entry = await setup_integration()
+    coordinator: CarrierDataUpdateCoordinator = config_entry.runtime_data
+    unlimited = 1_000_000.0
+    coordinator.rate_limiter = CarrierRateLimiter(
+        read_bucket=TokenBucket(rate=unlimited, capacity=unlimited),
+        write_bucket=TokenBucket(rate=unlimited, capacity=unlimited),
+    )
+    return coordinator
+
+
+def _params(account_size: tuple[int, int]) -> dict[str, int]:
+    """Return the JSON parameters for one account size."""
+    return {"systems": account_size[0], "zones": account_size[1]}
+
+
+@pytest.mark.asyncio
+async def test_benchmark_websocket_message_throughput(
+    setup_integration: Callable[..., Any],
+    account_size: tuple[int, int],
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """Measure merge and listener fan-out for one zone status message."""
+    coordinator = await _async_setup_coordinator(setup_integration)
+    message = json.dumps(
+        {
+            "messageType": "InfinityStatus",
+            "deviceId": "SYS000",
+            "zones": [{"id": "1", "rt": 71.0}],
+        }
+    )
+
+    result = await benchmark_recorder.async_measure(
+        "websocket_message",
+        functools.partial(coordinator.async_handle_websocket_message, message),
+        params=_params(account_size),
+    )
+    assert result["units_per_second"]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_full_refresh_merge(
+    setup_integration: Callable[..., Any],
+    carrier_api: FakeCarrierApiConnection,
+    account_size: tuple[int, int],
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """Measure a full refresh that merges freshly loaded systems in place."""
+    coordinator = await _async_setup_coordinator(setup_integration)
+    fresh_loads = [build_scaled_systems(*account_size) for _ in range(25)]
+
+    async def full_refresh() -> None:
+        """Serve a new load_data payload and merge it."""
+        carrier_api.systems = fresh_loads.pop()
+        await coordinator._async_full_refresh()
+
+    await benchmark_recorder.async_measure(
+        "full_refresh_merge", full_refresh, params=_params(account_size), units=account_size[0]
+    )
+    assert len(coordinator.systems) == account_size[0]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_energy_refresh_wall_time(
+    setup_integration: Callable[..., Any],
+    carrier_api: FakeCarrierApiConnection,
+    account_size: tuple[int, int],
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """Measure an energy cycle when each Carrier request has network latency."""
+    coordinator = await _async_setup_coordinator(setup_integration)
+    get_energy = carrier_api.get_energy
+
+    async def slow_get_energy(system_serial: str) -> dict[str, Any]:
+        """Answer after the simulated round trip."""
+        await asyncio.sleep(ENERGY_LATENCY_SECONDS)
+        return await get_energy(system_serial)
+
+    carrier_api.get_energy = slow_get_energy
+
+    await benchmark_recorder.async_measure(
+        "energy_refresh",
+        coordinator._async_energy_refresh,
+        params={**_params(account_size), "latency_seconds": ENERGY_LATENCY_SECONDS},
+        units=account_size[0],
+        rounds=ENERGY_ROUNDS,
+    )
+
+
+@pytest.mark.asyncio
+async def test_benchmark_entity_fan_out(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+    account_size: tuple[int, int],
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """Measure one listener fan-out across every subscribed entity."""
+    coordinator = await _async_setup_coordinator(setup_integration)
+    entity_count = len(coordinator._listeners)
+
+    async def fan_out() -> None:
+        """Notify every entity of new coordinator data."""
+        coordinator.async_update_listeners()
+
+    result = await benchmark_recorder.async_measure(
+        "entity_fan_out",
+        fan_out,
+        params={**_params(account_size), "entities": entity_count},
+        units=entity_count,
+    )
+    await hass.async_block_till_done()
+    assert result["units"] > 0
+
+
+@pytest.mark.asyncio
+async def test_benchmark_raw_payload_redaction(
+    account_size: tuple[int, int],
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """Measure diagnostics redaction of every raw payload against HA's redactor."""
+    payloads = [
+        payload
+        for system in build_scaled_systems(*account_size)
+        for payload in (
+            system.profile.raw,
+            system.status.raw,
+            system.config.raw,
+            system.energy.raw,
+        )
+    ]
+    redactor = compile_redactor(frozenset(TO_REDACT_RAW))
+
+    async def redact() -> None:
+        """Redact each raw payload with the compiled redactor."""
+        for payload in payloads:
+            redactor.redact(payload)
+
+    async def redact_with_home_assistant() -> None:
+        """Redact each raw payload with Home Assistant's diagnostics helper."""
+        for payload in payloads:
+            ha_redact_data(payload, TO_REDACT_RAW)
+
+    result = await benchmark_recorder.async_measure(
+        "redact_raw", redact, params=_params(account_size), units=len(payloads)
+    )
+    baseline = await benchmark_recorder.async_measure(
+        "redact_raw_home_assistant",
+        redact_with_home_assistant,
+        params=_params(account_size),
+        units=len(payloads),
+    )
+    assert result["units_per_second"]
+    assert baseline["units_per_second"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.environ.get(TRACE_ENV), reason=f"set {TRACE_ENV} to a recorded trace")
+async def test_benchmark_recorded_trace_replay(
+    setup_integration: Callable[..., Any],
+    account_size: tuple[int, int],
+    benchmark_recorder: BenchmarkRecorder,
+) -> None:
+    """Replay a recorded websocket trace as fast as possible."""
+    coordinator = await _async_setup_coordinator(setup_integration)
+    trace = read_trace(Path(os.environ[TRACE_ENV]))
+
+    async def replay() -> None:
+        """Feed the whole trace through the websocket callback."""
+        await async_replay_trace(coordinator, trace)
+
+    await benchmark_recorder.async_measure(
+        "trace_replay",
+        replay,
+        params={**_params(account_size), "trace": Path(os.environ[TRACE_ENV]).name},
+        units=len(trace),
+        rounds=5,
+    )
@@ -19,6 +19,11 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 import custom_components
 from custom_components.ha_carrier.const import DOMAIN
+from tests.loop_blocking import (
+    ALLOW_LOOP_BLOCKING_MARKER,
+    LoopBlockingDetector,
+    slow_callback_threshold,
+)
 
 USERNAME = "user@example.com"
 PASSWORD = "password"
@@ -26,13 +31,19 @@ IDENTITY_ID = "identity-123"
 
 
 class FakeCarrierWebsocket:
-    """Small websocket fake that records callbacks and blocks until cancelled."""
+    """Small websocket fake that records callbacks and blocks until cancelled or dropped."""
 
     def __init__(self) -> None:
         """Initialize websocket callback storage."""
         self.callbacks: list[Callable[[str], Any]] = []
         self.listener_errors: list[BaseException] = []
         self.listener_calls = 0
+        self._disconnected: asyncio.Event | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Return whether a listener is currently connected."""
+        return self._disconnected is not None and not self._disconnected.is_set()
 
     def callback_add(self, callback: Callable[[str], Any]) -> None:
         """Store a websocket callback registered by the coordinator.
@@ -43,11 +54,26 @@ class FakeCarrierWebsocket:
         self.callbacks.append(callback)
 
     async def listener(self) -> None:
-        """Block until Home Assistant cancels the websocket task."""
+        """Block until Home Assistant cancels the websocket task or `disconnect` is called."""
         self.listener_calls += 1
         if self.listener_errors:
             raise self.listener_errors.pop(0)
-        await asyncio.Event().wait()
+        self._disconnected = asyncio.Event()
+        await self._disconnected.wait()
+
+    def disconnect(self) -> None:
+        """End the current listener the way a server-side close would."""
+        if self._disconnected is not None:
+            self._disconnected.set()
+
+    async def deliver(self, message: str) -> None:
+        """Run every registered callback with ``message``, as the listener does.
+
+        Args:
+            message: Raw websocket message text.
+        """
+        for callback in self.callbacks:
+            await callback(message)
 
 
 class FakeCarrierApiConnection:
@@ -80,7 +106,14 @@ class FakeCarrierApiConnection:
         self.api_websocket = FakeCarrierWebsocket()
         self.calls: list[tuple[str, dict[str, Any]]] = []
         self.load_data_error: BaseException | None = None
+        self.load_entry_level_data_error: BaseException | None = None
+        self.update_entry_level_zone_error: BaseException | None = None
         self.cleanup_calls = 0
+        self.auth_checks = 0
+
+    async def check_auth_expiration(self) -> None:
+        """Count token checks; the fake never needs to log in."""
+        self.auth_checks += 1
 
     async def load_data(self) -> list[System]:
         """Return configured systems or raise a configured load error."""
@@ -90,15 +123,19 @@ class FakeCarrierApiConnection:
         return self.systems
 
     async def load_entry_level_data(self) -> list[EntryLevelSystem]:
-        """Return configured entry-level systems."""
+        """Return configured entry-level systems or raise a configured error."""
         self.calls.append(("load_entry_level_data", {}))
+        if self.load_entry_level_data_error is not None:
+            raise self.load_entry_level_data_error
         return self.entry_level_systems
 
     async def update_entry_level_zone(
         self, serial: str, index: int = 0, **kwargs: Any
     ) -> dict[str, Any]:
-        """Record an entry-level zone write."""
+        """Record an entry-level zone write or raise a configured error."""
         self.calls.append(("update_entry_level_zone", {"serial": serial, "index": index, **kwargs}))
+        if self.update_entry_level_zone_error is not None:
+            raise self.update_entry_level_zone_error
         return {"updateEntryLevelZone": {"success": True}}
 
     async def cleanup(self) -> None:
@@ -284,6 +321,7 @@ def build_entry_level_system(
     serial: str = "EL123",
     name: str = "Basement",
     mode: str = "cool",
+    stage_status: str = "Idle",
 ) -> EntryLevelSystem:
     """Build an entry-level (Smart Thermostat) system for tests.
 
@@ -291,6 +329,7 @@ def build_entry_level_system(
         serial: Serial number for the entry-level system.
         name: Display name for the system.
         mode: Zone HVAC mode string reported by Carrier.
+        stage_status: Conditioning stage reported for the zone.
 
     Returns:
         EntryLevelSystem: A single-zone entry-level system model.
@@ -316,7 +355,7 @@ def build_entry_level_system(
                     "schedule_enabled": True,
                     "hold_end_time": 0,
                     "hold_countdown": 30,
-                    "stage_status": "Idle",
+                    "stage_status": stage_status,
                     "outside_temp": 90,
                 }
             ],
@@ -454,6 +493,31 @@ def build_carrier_system(
     return System(profile=profile, status=status, config=config, energy=energy)
 
 
+def build_scaled_systems(system_count: int, zone_count: int) -> list[System]:
+    """Build ``system_count`` systems with ``zone_count`` zones each.
+
+    Args:
+        system_count: Number of Carrier systems on the account.
+        zone_count: Zones per system.
+
+    Returns:
+        list[System]: Systems with unique serials and zone IDs ``1..zone_count``.
+    """
+    systems = []
+    for system_index in range(system_count):
+        system = build_carrier_system(
+            serial=f"SYS{system_index:03d}", name=f"Home {system_index}", zone_name="Zone 1"
+        )
+        for zone_index in range(2, zone_count + 1):
+            zone_id, zone_name = str(zone_index), f"Zone {zone_index}"
+            system.config.raw["zones"].append(_zone_raw(zone_id=zone_id, name=zone_name))
+            system.status.raw["zones"].append(_status_zone_raw(zone_id=zone_id, name=zone_name))
+        system.config = Config(system.config.raw)
+        system.status = Status(system.status.raw)
+        systems.append(system)
+    return systems
+
+
 def entity_id_for_unique_id(hass: HomeAssistant, domain: str, unique_id: str) -> str:
     """Return the entity ID registered for an integration unique ID.
 
@@ -473,6 +537,34 @@ def entity_id_for_unique_id(hass: HomeAssistant, domain: str, unique_id: str) ->
     return entity_id
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the markers used by the Carrier test suite."""
+    config.addinivalue_line(
+        "markers",
+        f"{ALLOW_LOOP_BLOCKING_MARKER}: do not fail the test when integration callbacks "
+        "block the event loop",
+    )
+
+
+@pytest.fixture
+async def loop_blocking_detector(
+    request: pytest.FixtureRequest,
+) -> AsyncIterator[LoopBlockingDetector | None]:
+    """Fail the test when an integration callback blocks the event loop too long.
+
+    Yields:
+        LoopBlockingDetector | None: Active detector, or None when the test is
+            marked ``allow_loop_blocking``.
+    """
+    if request.node.get_closest_marker(ALLOW_LOOP_BLOCKING_MARKER):
+        yield None
+        return
+    with LoopBlockingDetector(asyncio.get_running_loop(), slow_callback_threshold()) as detector:
+        yield detector
+    if detector.offenders:
+        pytest.fail(detector.failure_message(), pytrace=False)
+
+
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(
     enable_custom_integrations: None,
@@ -520,8 +612,13 @@ def patch_carrier_api(
 async def setup_integration(
     hass: HomeAssistant,
     patch_carrier_api: FakeCarrierApiConnection,
+    loop_blocking_detector: LoopBlockingDetector | None,
 ) -> AsyncIterator[Callable[..., Any]]:
-    """Return a helper that sets up a Carrier config entry through Home Assistant."""
+    """Return a helper that sets up a Carrier config entry through Home Assistant.
+
+    Tests using it fail when an integration callback blocks the event loop;
+    see `loop_blocking_detector`.
+    """
     entries: list[ConfigEntry] = []
 
     async def _setup(
@@ -0,0 +1 @@
+"""Fault-injection scenarios that measure how the integration recovers."""
@@ -0,0 +1,53 @@
+"""Fixtures for outage scenarios and their recovery report.
+
+Every scenario adds its `OutageReport` to a session list. When
+``CARRIER_FAULT_REPORT`` names a file, the list is written there as JSON so
+recovery times and API call counts can be compared between changes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.core import HomeAssistant
+import pytest
+
+from tests.conftest import FakeCarrierApiConnection, entity_id_for_unique_id
+from tests.faults.harness import OutageHarness, OutageReport
+
+FAULT_REPORT_ENV = "CARRIER_FAULT_REPORT"
+
+
+@pytest.fixture(scope="session")
+def outage_reports() -> Iterator[list[OutageReport]]:
+    """Return the session's outage reports and write them at session end."""
+    reports: list[OutageReport] = []
+    yield reports
+    output = os.environ.get(FAULT_REPORT_ENV)
+    if output and reports:
+        payload = [report.as_dict() for report in reports]
+        Path(output).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+async def outage_harness(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    carrier_api: FakeCarrierApiConnection,
+    setup_integration: Callable[..., Any],
+) -> OutageHarness:
+    """Return a harness for a loaded entry, watching its zone thermostat."""
+    config_entry = await setup_integration()
+    return OutageHarness(
+        hass,
+        freezer,
+        carrier_api,
+        config_entry.runtime_data,
+        entity_id_for_unique_id(hass, CLIMATE_DOMAIN, "abc123_zone_1_thermostat"),
+    )
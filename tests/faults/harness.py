@@ -0,0 +1,312 @@
+"""Scripted outages against the fake Carrier API and websocket.
+
+`FaultInjector` wraps a `FakeCarrierApiConnection` so its API calls and
+websocket listener fail the way Carrier does during an `Outage`: transient
+connection errors, bursts of 401s, responses slower than the attempt timeout,
+or a half-open websocket that stays connected but delivers nothing.
+`OutageHarness` steps Home Assistant through the outage on frozen time and
+returns an `OutageReport` with how long fresh data took to come back, how
+many API calls the integration made meanwhile, and how long the user saw the
+entity unavailable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum
+import json
+from typing import Any
+
+from carrier_api import CarrierApiAuthError, CarrierApiConnectionError, CarrierApiWebsocketError
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.ha_carrier.carrier_data_update_coordinator import (
+    CarrierDataUpdateCoordinator,
+)
+from tests.conftest import FakeCarrierApiConnection
+
+# Fake API methods that reach Carrier and therefore fail during an outage.
+API_METHODS: tuple[str, ...] = (
+    "load_data",
+    "load_entry_level_data",
+    "get_energy",
+    "get_user_info",
+    "set_config_mode",
+    "set_config_heat_humidity",
+    "resume_schedule",
+    "set_config_hold",
+    "update_fan",
+    "set_config_manual_activity",
+    "set_heat_source",
+    "update_entry_level_zone",
+)
+
+# Passes through the event loop after each time step so woken tasks can finish.
+SETTLE_PASSES = 20
+
+
+class FaultKind(StrEnum):
+    """How Carrier misbehaves during an outage."""
+
+    TRANSIENT = "transient"
+    """API calls raise connection errors and the websocket cannot reconnect."""
+
+    UNAUTHORIZED = "unauthorized"
+    """API calls and websocket reconnects are rejected with 401s."""
+
+    SLOW = "slow"
+    """API calls answer only after ``Outage.latency`` seconds."""
+
+    HALF_OPEN = "half_open"
+    """The websocket stays connected but no messages arrive."""
+
+
+@dataclass(frozen=True)
+class Outage:
+    """One scripted outage.
+
+    Attributes:
+        kind: Failure mode.
+        duration: Seconds the outage lasts.
+        start: Seconds of normal operation before the outage begins.
+        latency: Response delay for `FaultKind.SLOW` outages.
+    """
+
+    kind: FaultKind
+    duration: float
+    start: float = 10.0
+    latency: float = 45.0
+
+    @property
+    def end(self) -> float:
+        """Return the harness time the outage ends at."""
+        return self.start + self.duration
+
+
+@dataclass
+class OutageReport:
+    """Recovery metrics for one outage.
+
+    Attributes:
+        kind: Failure mode of the outage.
+        outage_seconds: How long the outage lasted.
+        recovery_seconds: Seconds from the end of the outage until a refresh
+            succeeded or a websocket message was applied with the entry
+            healthy; None when that did not happen before the horizon.
+        api_calls: API calls from the start of the outage until recovery.
+        api_calls_by_method: ``api_calls`` split by fake API method.
+        unavailable_seconds: Seconds the watched entity showed unavailable.
+    """
+
+    kind: FaultKind
+    outage_seconds: float
+    recovery_seconds: float | None
+    api_calls: int
+    api_calls_by_method: dict[str, int] = field(default_factory=dict)
+    unavailable_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the report as JSON-serializable data."""
+        return {**asdict(self), "kind": str(self.kind)}
+
+
+class FaultInjector:
+    """Makes a fake Carrier connection fail while an outage is active."""
+
+    def __init__(self, carrier_api: FakeCarrierApiConnection, clock: Callable[[], float]) -> None:
+        """Wrap ``carrier_api``'s API methods and websocket listener in place.
+
+        Args:
+            carrier_api: Fake connection the integration uses.
+            clock: Returns the harness time that calls are recorded at.
+        """
+        self.outage: Outage | None = None
+        self.calls: list[tuple[float, str]] = []
+        self._clock = clock
+        for name in API_METHODS:
+            setattr(carrier_api, name, self._wrap(name, getattr(carrier_api, name)))
+        websocket = carrier_api.api_websocket
+        listener = websocket.listener
+
+        async def faulty_listener() -> None:
+            """Refuse reconnects while the outage keeps Carrier unreachable."""
+            if self.outage is not None and self.outage.kind is FaultKind.TRANSIENT:
+                websocket.listener_calls += 1
+                raise CarrierApiWebsocketError("injected websocket outage")
+            if self.outage is not None and self.outage.kind is FaultKind.UNAUTHORIZED:
+                websocket.listener_calls += 1
+                raise CarrierApiAuthError("injected websocket 401")
+            await listener()
+
+        websocket.listener = faulty_listener
+
+    @property
+    def delivers_messages(self) -> bool:
+        """Return whether websocket messages currently reach the integration."""
+        return self.outage is None or self.outage.kind is not FaultKind.HALF_OPEN
+
+    def calls_between(self, start: float, end: float) -> Counter[str]:
+        """Return API calls made from ``start`` up to and including ``end``.
+
+        Args:
+            start: Harness time to count from.
+            end: Harness time to count to.
+
+        Returns:
+            Counter[str]: Calls per fake API method.
+        """
+        return Counter(name for at, name in self.calls if start <= at <= end)
+
+    def _wrap(
+        self, name: str, method: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Return ``method`` behind the active outage's failure mode."""
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            """Record the call, then fail, stall, or pass it through."""
+            self.calls.append((self._clock(), name))
+            outage = self.outage
+            if outage is not None:
+                if outage.kind is FaultKind.TRANSIENT:
+                    raise CarrierApiConnectionError(f"injected {name} outage")
+                if outage.kind is FaultKind.UNAUTHORIZED:
+                    raise CarrierApiAuthError(f"injected {name} 401")
+                if outage.kind is FaultKind.SLOW:
+                    await asyncio.sleep(outage.latency)
+            return await method(*args, **kwargs)
+
+        return call
+
+
+class OutageHarness:
+    """Steps Home Assistant through an outage on frozen time."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        freezer: FrozenDateTimeFactory,
+        carrier_api: FakeCarrierApiConnection,
+        coordinator: CarrierDataUpdateCoordinator,
+        entity_id: str,
+        *,
+        step_seconds: float = 1.0,
+        message_interval: float = 30.0,
+    ) -> None:
+        """Prepare a harness for a loaded config entry.
+
+        Args:
+            hass: Home Assistant instance running the entry.
+            freezer: Frozen clock from the ``freezer`` fixture.
+            carrier_api: Fake connection the entry uses.
+            coordinator: Coordinator of the loaded entry.
+            entity_id: Entity whose availability is reported.
+            step_seconds: Frozen-clock seconds per step.
+            message_interval: Seconds between websocket status messages.
+        """
+        self.hass = hass
+        self.freezer = freezer
+        self.carrier_api = carrier_api
+        self.coordinator = coordinator
+        self.entity_id = entity_id
+        self.step_seconds = step_seconds
+        self.message_interval = message_interval
+        self.elapsed = 0.0
+        self.injector = FaultInjector(carrier_api, lambda: self.elapsed)
+        self._fresh_at: list[float] = []
+        self._outdoor_temperature = 40
+
+    async def async_run(self, outage: Outage, *, horizon: float = 900.0) -> OutageReport:
+        """Run ``outage`` and measure how the integration recovers.
+
+        The run stops once fresh data is back and the entity is available, or
+        ``horizon`` seconds after the outage ends.
+
+        Args:
+            outage: Outage to script.
+            horizon: Seconds after the outage to wait for recovery.
+
+        Returns:
+            OutageReport: Recovery metrics for the outage.
+        """
+        remove_listener = self.coordinator.async_add_listener(self._listener_updated)
+        websocket = self.carrier_api.api_websocket
+        next_message = self.message_interval
+        unavailable = 0.0
+        recovered_at: float | None = None
+        started = ended = False
+        try:
+            while self.elapsed < outage.end + horizon:
+                if not started and self.elapsed >= outage.start:
+                    started = True
+                    self.injector.outage = outage
+                    if outage.kind is not FaultKind.HALF_OPEN:
+                        websocket.disconnect()
+                elif started and not ended and self.elapsed >= outage.end:
+                    ended = True
+                    self.injector.outage = None
+                    if outage.kind is FaultKind.HALF_OPEN:
+                        # The heartbeat notices the dead socket and closes it.
+                        websocket.disconnect()
+                if self.elapsed >= next_message:
+                    next_message += self.message_interval
+                    if websocket.connected and self.injector.delivers_messages:
+                        await websocket.deliver(self._status_message())
+                await self._async_step()
+                if self._entity_unavailable():
+                    unavailable += self.step_seconds
+                if recovered_at is None:
+                    recovered_at = next((at for at in self._fresh_at if at > outage.end), None)
+                if recovered_at is not None and not self._entity_unavailable():
+                    break
+        finally:
+            remove_listener()
+            self.injector.outage = None
+        calls = self.injector.calls_between(
+            outage.start, self.elapsed if recovered_at is None else recovered_at
+        )
+        return OutageReport(
+            kind=outage.kind,
+            outage_seconds=outage.duration,
+            recovery_seconds=None if recovered_at is None else recovered_at - outage.end,
+            api_calls=calls.total(),
+            api_calls_by_method=dict(calls),
+            unavailable_seconds=unavailable,
+        )
+
+    async def _async_step(self) -> None:
+        """Advance the frozen clock one step and let woken tasks run."""
+        self.elapsed += self.step_seconds
+        self.freezer.tick(self.step_seconds)
+        async_fire_time_changed(self.hass)
+        for _ in range(SETTLE_PASSES):
+            await asyncio.sleep(0)
+
+    def _listener_updated(self) -> None:
+        """Record when the coordinator publishes data while healthy."""
+        if self.coordinator.last_update_success:
+            self._fresh_at.append(self.elapsed)
+
+    def _entity_unavailable(self) -> bool:
+        """Return whether the watched entity currently shows unavailable."""
+        state = self.hass.states.get(self.entity_id)
+        return state is None or state.state == STATE_UNAVAILABLE
+
+    def _status_message(self) -> str:
+        """Return a small ``InfinityStatus`` update for the first fake system."""
+        self._outdoor_temperature += 1
+        system = self.carrier_api.systems[0]
+        return json.dumps(
+            {
+                "messageType": "InfinityStatus",
+                "deviceId": system.profile.serial,
+                "timestamp": datetime.now(UTC).isoformat(),
+                "oat": self._outdoor_temperature,
+            }
+        )
@@ -0,0 +1,66 @@
+"""Scripted Carrier outages and how quickly the integration recovers from them."""
+
+from __future__ import annotations
+
+from homeassistant.config_entries import SOURCE_REAUTH
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.ha_carrier.const import DOMAIN
+from tests.faults.harness import FaultKind, Outage, OutageHarness, OutageReport
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "outage",
+    [
+        Outage(FaultKind.TRANSIENT, duration=120),
+        Outage(FaultKind.SLOW, duration=120, latency=45),
+    ],
+    ids=lambda outage: str(outage.kind),
+)
+async def test_integration_recovers_after_failing_api(
+    outage_harness: OutageHarness,
+    outage_reports: list[OutageReport],
+    outage: Outage,
+) -> None:
+    """Bring fresh data back after the API fails or stalls, without hammering it."""
+    report = await outage_harness.async_run(outage)
+    outage_reports.append(report)
+
+    assert report.recovery_seconds is not None, report
+    assert 0 < report.api_calls <= outage.duration, report
+    assert report.unavailable_seconds > 0, report
+
+
+@pytest.mark.asyncio
+async def test_half_open_websocket_recovers_without_going_unavailable(
+    outage_harness: OutageHarness,
+    outage_reports: list[OutageReport],
+) -> None:
+    """Reconcile over the API once a silent websocket is closed, staying available."""
+    report = await outage_harness.async_run(Outage(FaultKind.HALF_OPEN, duration=300))
+    outage_reports.append(report)
+
+    assert report.recovery_seconds is not None, report
+    assert report.api_calls_by_method.get("load_data", 0) >= 1, report
+    assert report.unavailable_seconds == 0, report
+
+
+@pytest.mark.asyncio
+async def test_unauthorized_burst_recovers_or_asks_for_reauth(
+    hass: HomeAssistant,
+    outage_harness: OutageHarness,
+    outage_reports: list[OutageReport],
+) -> None:
+    """End a burst of 401s either recovered or in a reauth flow, never stuck silently."""
+    report = await outage_harness.async_run(Outage(FaultKind.UNAUTHORIZED, duration=60))
+    outage_reports.append(report)
+
+    reauth_flows = [
+        flow
+        for flow in hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+        if flow["context"].get("source") == SOURCE_REAUTH
+    ]
+    assert report.recovery_seconds is not None or reauth_flows, report
+    assert 0 < report.api_calls <= 60, report
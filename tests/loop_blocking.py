@@ -0,0 +1,93 @@
+"""Detect Carrier callbacks that block the Home Assistant event loop.
+
+asyncio's debug mode logs every callback that runs longer than
+``loop.slow_callback_duration``, naming the task or handle and the line it was
+running at. `LoopBlockingDetector` turns that on with a tight threshold and
+keeps the warnings that point into the integration's own source files, so a
+slow ``updated_callback``, diagnostics dump, or migration fails the test that
+triggered it instead of going unnoticed.
+
+The threshold defaults to `SLOW_CALLBACK_DEFAULT_SECONDS`; set
+``CARRIER_SLOW_CALLBACK_SECONDS`` to loosen it on a slow machine. Tests that
+block on purpose, or that measure timing themselves, opt out with
+`allow_loop_blocking`. Frozen time hides blocking: asyncio measures callbacks
+with the loop clock, which ``freezer`` stops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+import pytest
+
+SLOW_CALLBACK_ENV = "CARRIER_SLOW_CALLBACK_SECONDS"
+SLOW_CALLBACK_DEFAULT_SECONDS = 0.05
+ALLOW_LOOP_BLOCKING_MARKER = "allow_loop_blocking"
+
+# Path fragment every frame in the integration's source contains.
+INTEGRATION_SOURCE = f"{Path('custom_components', 'ha_carrier')}{os.sep}"
+
+allow_loop_blocking = pytest.mark.allow_loop_blocking
+
+
+def slow_callback_threshold() -> float:
+    """Return how long one callback may run before the test fails."""
+    return float(os.environ.get(SLOW_CALLBACK_ENV, SLOW_CALLBACK_DEFAULT_SECONDS))
+
+
+class LoopBlockingDetector(logging.Handler):
+    """Collects asyncio slow-callback warnings raised by integration code."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold: float) -> None:
+        """Prepare a detector for ``loop``; use it as a context manager.
+
+        Args:
+            loop: Event loop running Home Assistant.
+            threshold: Seconds a single callback may run.
+        """
+        super().__init__(logging.WARNING)
+        self.loop = loop
+        self.threshold = threshold
+        self.offenders: list[str] = []
+        self._debug = loop.get_debug()
+        self._slow_callback_duration = loop.slow_callback_duration
+
+    def __enter__(self) -> Self:
+        """Turn on slow-callback logging and start collecting warnings."""
+        self.loop.set_debug(True)
+        self.loop.slow_callback_duration = self.threshold
+        logging.getLogger("asyncio").addHandler(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop collecting and restore the loop's debug settings."""
+        logging.getLogger("asyncio").removeHandler(self)
+        self.loop.slow_callback_duration = self._slow_callback_duration
+        self.loop.set_debug(self._debug)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Keep slow-callback warnings whose handle points into the integration.
+
+        Args:
+            record: Record logged by asyncio.
+        """
+        message = record.getMessage()
+        if message.startswith("Executing ") and INTEGRATION_SOURCE in message:
+            self.offenders.append(message)
+
+    def failure_message(self) -> str:
+        """Return a test failure message listing every offending callback."""
+        return (
+            f"{len(self.offenders)} ha_carrier callback(s) blocked the event loop for more "
+            f"than {self.threshold:.3f} seconds:\n" + "\n".join(self.offenders)
+        )
@@ -0,0 +1 @@
+"""Local stand-in for the Carrier cloud used by load and soak tests."""
@@ -0,0 +1,89 @@
+"""Fixtures that run the integration against the local Carrier stand-in."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ha_carrier.const import DOMAIN
+from tests.conftest import PASSWORD, USERNAME, build_carrier_system
+from tests.loop_blocking import LoopBlockingDetector
+from tests.standin.server import CarrierStandIn, redirect_carrier_hosts
+
+
+async def async_wait_for(condition: Callable[[], bool], seconds: float = 5.0) -> None:
+    """Wait until ``condition`` holds for traffic that arrives over the network.
+
+    ``hass.async_block_till_done`` cannot see websocket frames still in
+    flight, so stand-in tests poll instead.
+
+    Args:
+        condition: Check that returns True once the expected state is reached.
+        seconds: How long to wait before failing.
+
+    Raises:
+        TimeoutError: Raised when ``condition`` still fails after ``seconds``.
+    """
+    async with asyncio.timeout(seconds):
+        while True:
+            if condition():
+                return
+            await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def carrier_standin() -> CarrierStandIn:
+    """Return a stand-in account with one single-zone system."""
+    return CarrierStandIn([build_carrier_system()])
+
+
+@pytest.fixture
+async def setup_standin_integration(
+    hass: HomeAssistant,
+    carrier_standin: CarrierStandIn,
+    loop_blocking_detector: LoopBlockingDetector | None,
+) -> AsyncIterator[Callable[..., Any]]:
+    """Return a helper that sets up a Carrier entry against the running stand-in.
+
+    The real Carrier client is used; only its hosts are redirected.
+    """
+    base_url = await carrier_standin.start()
+    entries: list[ConfigEntry] = []
+
+    async def _setup(*, options: dict[str, Any] | None = None) -> ConfigEntry:
+        """Set up one Carrier config entry and wait for its websocket.
+
+        Args:
+            options: Config entry options.
+
+        Returns:
+            ConfigEntry: Config entry loaded by Home Assistant.
+        """
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=USERNAME,
+            unique_id=USERNAME,
+            data={CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD},
+            options=options or {},
+            version=2,
+        )
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        entries.append(config_entry)
+        await async_wait_for(lambda: bool(carrier_standin.websockets))
+        return config_entry
+
+    with redirect_carrier_hosts(base_url):
+        yield _setup
+        for config_entry in entries:
+            await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+    await carrier_standin.stop()
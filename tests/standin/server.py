@@ -0,0 +1,500 @@
+"""Local HTTP and websocket server that speaks Carrier's cloud protocol.
+
+`CarrierStandIn` serves the GraphQL, OAuth token, and realtime websocket
+endpoints that ``carrier_api`` talks to, backed by in-memory copies of
+``carrier_api`` model payloads. Mutations change that state and are echoed
+back over the websocket the way Carrier does, so the real
+`ApiConnectionGraphql`, gql transport, retries, and websocket listener all run
+unchanged against it.
+
+``carrier_api`` hardcodes Carrier's hosts, so `redirect_carrier_hosts`
+rewrites requests for those hosts to the stand-in at the aiohttp session
+level. The redirect only exists in tests; the integration code has no
+override.
+
+`StandInFaults` adds latency, HTTP 500/401/429 answers, and websocket
+disconnects from a seeded random source so load and soak runs are
+repeatable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import itertools
+import json
+import random
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import ClientSession, WSMsgType, web
+from aiohttp.test_utils import TestServer
+from carrier_api import EntryLevelSystem, System
+from yarl import URL
+
+from tests.conftest import IDENTITY_ID, PASSWORD, USERNAME
+
+# Carrier host -> path prefix the stand-in serves it under.
+CARRIER_HOST_PREFIXES: dict[str, str] = {
+    "dataservice.infinity.iot.carrier.com": "/dataservice",
+    "sso.carrier.com": "/sso",
+    "realtime.infinity.iot.carrier.com": "/realtime",
+}
+_INSECURE_SCHEMES = {"https": "http", "wss": "ws"}
+
+TOKEN_LIFETIME_SECONDS = 3600
+
+
+@dataclass
+class StandInFaults:
+    """Faults the stand-in injects into GraphQL and websocket traffic.
+
+    Rates are probabilities per GraphQL request and are drawn from the
+    stand-in's seeded random source.
+
+    Attributes:
+        latency_seconds: Fixed delay added before every GraphQL answer.
+        latency_jitter_seconds: Extra uniformly random delay on top of it.
+        error_rate: Share of requests answered with HTTP 500.
+        unauthorized_rate: Share of requests answered with HTTP 401.
+        throttle_rate: Share of requests answered with HTTP 429.
+        throttle_retry_after_seconds: Retry-After sent with HTTP 429.
+        websocket_disconnect_after: Close each websocket after sending this
+            many messages; None keeps it open.
+    """
+
+    latency_seconds: float = 0.0
+    latency_jitter_seconds: float = 0.0
+    error_rate: float = 0.0
+    unauthorized_rate: float = 0.0
+    throttle_rate: float = 0.0
+    throttle_retry_after_seconds: float = 1.0
+    websocket_disconnect_after: int | None = None
+
+
+def redirected_url(url: URL, base_url: URL) -> URL:
+    """Return ``url`` pointed at the stand-in when it targets a Carrier host.
+
+    Args:
+        url: URL a client session is about to request.
+        base_url: Root URL of the running stand-in.
+
+    Returns:
+        URL: The stand-in URL, or ``url`` unchanged for any other host.
+    """
+    prefix = CARRIER_HOST_PREFIXES.get(url.host or "")
+    if prefix is None:
+        return url
+    return URL.build(
+        scheme=_INSECURE_SCHEMES.get(url.scheme, url.scheme),
+        host=base_url.host,
+        port=base_url.port,
+        path=prefix + url.path,
+        query_string=url.query_string,
+    )
+
+
+@contextmanager
+def redirect_carrier_hosts(base_url: URL) -> Iterator[None]:
+    """Send every aiohttp request for a Carrier host to the stand-in instead.
+
+    Args:
+        base_url: Root URL of the running stand-in.
+
+    Yields:
+        None: Requests are redirected until the context exits.
+    """
+    original_request = ClientSession._request
+
+    async def _request(session: ClientSession, method: str, str_or_url: Any, **kwargs: Any) -> Any:
+        """Rewrite the target URL, then make the request as usual."""
+        return await original_request(
+            session, method, redirected_url(URL(str(str_or_url)), base_url), **kwargs
+        )
+
+    with patch.object(ClientSession, "_request", _request):
+        yield
+
+
+def system_payloads(systems: list[System]) -> dict[str, dict[str, Any]]:
+    """Return deep copies of the raw payloads of ``systems``, keyed by serial.
+
+    Args:
+        systems: Infinity systems to copy.
+
+    Returns:
+        dict[str, dict[str, Any]]: ``profile``, ``status``, ``config``, and
+            ``energy`` raw dictionaries for each system.
+    """
+    return {
+        system.profile.serial: {
+            "profile": deepcopy(system.profile.raw),
+            "status": deepcopy(system.status.raw),
+            "config": deepcopy(system.config.raw),
+            "energy": deepcopy(system.energy.raw),
+        }
+        for system in systems
+    }
+
+
+def _merge(target: dict[str, Any], changes: dict[str, Any]) -> None:
+    """Merge ``changes`` into ``target``, recursing into nested objects."""
+    for key, value in changes.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = deepcopy(value)
+
+
+def _find_by_id(items: list[dict[str, Any]], item_id: str) -> dict[str, Any]:
+    """Return the Carrier object in ``items`` whose ``id`` is ``item_id``."""
+    for item in items:
+        if item["id"] == item_id:
+            return item
+    raise web.HTTPBadRequest(text=f"unknown id {item_id}")
+
+
+class CarrierStandIn:
+    """In-memory Carrier cloud served on a local port.
+
+    Attributes:
+        systems: Infinity payloads keyed by serial, each with ``profile``,
+            ``status``, ``config``, and ``energy`` raw dictionaries.
+        entry_level_systems: Entry-level payloads keyed by serial.
+        faults: Faults injected into traffic; may be changed while running.
+        operations: GraphQL requests received, keyed by operation name.
+        client_frames: Frames received from websocket clients.
+        connections: Websocket connections accepted so far.
+    """
+
+    def __init__(
+        self,
+        systems: list[System] | None = None,
+        entry_level_systems: list[EntryLevelSystem] | None = None,
+        *,
+        faults: StandInFaults | None = None,
+        seed: int = 0,
+        username: str = USERNAME,
+        password: str = PASSWORD,
+        identity_id: str = IDENTITY_ID,
+    ) -> None:
+        """Copy the starting account state.
+
+        Args:
+            systems: Infinity systems on the account.
+            entry_level_systems: Entry-level systems on the account.
+            faults: Faults to inject; defaults to none.
+            seed: Seed for the fault random source.
+            username: Username the stand-in accepts.
+            password: Password the stand-in accepts.
+            identity_id: Carrier identity ID returned for the account.
+        """
+        self.systems = system_payloads(systems or [])
+        self.entry_level_systems: dict[str, dict[str, Any]] = {
+            system.serial: deepcopy(system.raw) for system in entry_level_systems or []
+        }
+        self.faults = faults or StandInFaults()
+        self.username = username
+        self.password = password
+        self.identity_id = identity_id
+        self.operations: Counter[str] = Counter()
+        self.client_frames: list[dict[str, Any]] = []
+        self.websockets: set[web.WebSocketResponse] = set()
+        self.connections = 0
+        self._random = random.Random(seed)
+        self._tokens = itertools.count(1)
+        self._access_tokens: set[str] = set()
+        self._refresh_tokens: set[str] = set()
+        self._etags = itertools.count(1)
+        self._sent: dict[web.WebSocketResponse, int] = {}
+        self._server: TestServer | None = None
+
+    @property
+    def base_url(self) -> URL:
+        """Return the root URL of the running stand-in."""
+        if self._server is None:
+            raise RuntimeError("Carrier stand-in is not running")
+        return self._server.make_url("/")
+
+    def build_app(self) -> web.Application:
+        """Return the aiohttp application serving Carrier's endpoints."""
+        app = web.Application()
+        app.router.add_post("/dataservice/graphql-no-auth", self._handle_graphql)
+        app.router.add_post("/dataservice/graphql", self._handle_graphql)
+        app.router.add_post("/sso/oauth2/default/v1/token", self._handle_token)
+        app.router.add_get("/realtime/", self._handle_realtime)
+        return app
+
+    async def start(self) -> URL:
+        """Start serving on a free localhost port.
+
+        Returns:
+            URL: Root URL of the stand-in.
+        """
+        self._server = TestServer(self.build_app(), host="127.0.0.1")
+        await self._server.start_server()
+        return self.base_url
+
+    async def disconnect(self) -> None:
+        """Close every open websocket, as a Carrier-side drop would."""
+        for websocket in list(self.websockets):
+            await websocket.close()
+
+    async def stop(self) -> None:
+        """Close open websockets and stop serving."""
+        await self.disconnect()
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    def revoke_tokens(self) -> None:
+        """Invalidate every issued access token, forcing clients to refresh."""
+        self._access_tokens.clear()
+
+    async def push(self, message: dict[str, Any]) -> int:
+        """Send one realtime message to every connected websocket.
+
+        Args:
+            message: Carrier message body; ``timestamp`` is added when absent.
+
+        Returns:
+            int: Number of websockets the message was sent to.
+        """
+        payload = json.dumps({"timestamp": datetime.now(UTC).isoformat(), **message})
+        sent = 0
+        for websocket in list(self.websockets):
+            if websocket.closed:
+                continue
+            await websocket.send_str(payload)
+            sent += 1
+            self._sent[websocket] += 1
+            disconnect_after = self.faults.websocket_disconnect_after
+            if disconnect_after is not None and self._sent[websocket] >= disconnect_after:
+                await websocket.close()
+        return sent
+
+    async def push_status(self, serial: str, changes: dict[str, Any]) -> int:
+        """Apply a status change and announce it as an ``InfinityStatus`` message.
+
+        Args:
+            serial: System whose status changed.
+            changes: Status fields to merge; ``zones`` entries are matched by id.
+
+        Returns:
+            int: Number of websockets the message was sent to.
+        """
+        status = self.systems[serial]["status"]
+        changes = deepcopy(changes)
+        for zone in changes.get("zones", []):
+            _merge(_find_by_id(status["zones"], zone["id"]), zone)
+        _merge(status, {key: value for key, value in changes.items() if key != "zones"})
+        return await self.push({"messageType": "InfinityStatus", "deviceId": serial, **changes})
+
+    async def _inject_faults(self) -> web.Response | None:
+        """Delay the request and return a fault response when one is drawn."""
+        faults = self.faults
+        delay = faults.latency_seconds + self._random.uniform(0, faults.latency_jitter_seconds)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        draw = self._random.random()
+        if draw < faults.error_rate:
+            return web.Response(status=500, text="injected server error")
+        draw -= faults.error_rate
+        if draw < faults.unauthorized_rate:
+            return web.Response(status=401, text="injected unauthorized")
+        draw -= faults.unauthorized_rate
+        if draw < faults.throttle_rate:
+            return web.Response(
+                status=429,
+                text="injected throttle",
+                headers={"Retry-After": str(faults.throttle_retry_after_seconds)},
+            )
+        return None
+
+    def _issue_tokens(self) -> dict[str, Any]:
+        """Return a fresh OAuth token payload."""
+        number = next(self._tokens)
+        access_token = f"standin-access-{number}"
+        refresh_token = f"standin-refresh-{number}"
+        self._access_tokens.add(access_token)
+        self._refresh_tokens.add(refresh_token)
+        return {
+            "token_type": "Bearer",
+            "expires_in": TOKEN_LIFETIME_SECONDS,
+            "access_token": access_token,
+            "scope": "offline_access",
+            "refresh_token": refresh_token,
+        }
+
+    async def _handle_token(self, request: web.Request) -> web.Response:
+        """Exchange a refresh token for a new access token."""
+        form = await request.post()
+        if form.get("refresh_token") not in self._refresh_tokens:
+            return web.json_response({"error": "invalid_grant"}, status=400)
+        return web.json_response(self._issue_tokens())
+
+    async def _handle_graphql(self, request: web.Request) -> web.Response:
+        """Answer one GraphQL request by its operation name."""
+        body = await request.json()
+        operation_name = body.get("operationName") or ""
+        self.operations[operation_name] += 1
+        if (fault := await self._inject_faults()) is not None:
+            return fault
+        if request.path.endswith("/graphql"):
+            token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+            if token not in self._access_tokens:
+                return web.Response(status=401, text="unknown access token")
+        handler = getattr(self, f"_op_{operation_name}", None)
+        if handler is None:
+            return web.json_response(
+                {"data": None, "errors": [{"message": f"unknown operation {operation_name}"}]}
+            )
+        data = await handler(body.get("variables") or {})
+        return web.json_response({"data": data})
+
+    async def _handle_realtime(self, request: web.Request) -> web.StreamResponse:
+        """Serve one realtime websocket until either side closes it."""
+        if request.query.get("Token") not in self._access_tokens:
+            return web.Response(status=401, text="unknown access token")
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        self.connections += 1
+        self.websockets.add(websocket)
+        self._sent[websocket] = 0
+        try:
+            async for message in websocket:
+                if message.type is not WSMsgType.TEXT:
+                    continue
+                frame = json.loads(message.data)
+                self.client_frames.append(frame)
+                if frame.get("action") == "reconcile":
+                    for serial, system in self.systems.items():
+                        await self.push(
+                            {
+                                "messageType": "InfinityStatus",
+                                "deviceId": serial,
+                                **deepcopy(system["status"]),
+                            }
+                        )
+        finally:
+            self.websockets.discard(websocket)
+            self._sent.pop(websocket, None)
+        return websocket
+
+    async def _op_assistedLogin(self, variables: dict[str, Any]) -> dict[str, Any]:  # noqa: N802
+        """Log in with the account's username and password."""
+        credentials = variables["input"]
+        if credentials != {"username": self.username, "password": self.password}:
+            return {
+                "assistedLogin": {
+                    "success": False,
+                    "status": 401,
+                    "errorMessage": "Invalid credentials",
+                    "data": None,
+                }
+            }
+        return {
+            "assistedLogin": {
+                "success": True,
+                "status": 200,
+                "errorMessage": None,
+                "data": self._issue_tokens(),
+            }
+        }
+
+    async def _op_getUser(self, variables: dict[str, Any]) -> dict[str, Any]:  # noqa: N802
+        """Return the account identity."""
+        return {
+            "user": {
+                "username": self.username,
+                "identityId": self.identity_id,
+                "email": self.username,
+                "locations": [],
+            }
+        }
+
+    async def _op_getInfinitySystems(self, variables: dict[str, Any]) -> dict[str, Any]:  # noqa: N802
+        """Return every Infinity system's profile, status, and config."""
+        return {
+            "infinitySystems": [
+                {
+                    "profile": deepcopy(system["profile"]),
+                    "status": deepcopy(system["status"]),
+                    "config": deepcopy(system["config"]),
+                }
+                for system in self.systems.values()
+            ]
+        }
+
+    async def _op_getInfinityEnergy(self, variables: dict[str, Any]) -> dict[str, Any]:  # noqa: N802
+        """Return one system's energy payload."""
+        return {"infinityEnergy": deepcopy(self.systems[variables["serial"]]["energy"])}
+
+    async def _op_getEntryLevelSystems(self, variables: dict[str, Any]) -> dict[str, Any]:  # noqa: N802
+        """Return every entry-level system."""
+        return {"entryLevelSystems": deepcopy(list(self.entry_level_systems.values()))}
+
+    def _next_etag(self, serial: str) -> str:
+        """Stamp a new config etag on ``serial`` and return it."""
+        etag = f"standin-etag-{next(self._etags)}"
+        self.systems[serial]["config"]["etag"] = etag
+        return etag
+
+    async def _push_config(self, serial: str, changes: dict[str, Any]) -> None:
+        """Announce a config change as an ``InfinityConfig`` message."""
+        await self.push({"messageType": "InfinityConfig", "deviceId": serial, **changes})
+
+    async def _op_updateInfinityConfig(self, variables: dict[str, Any]) -> dict[str, Any]:  # noqa: N802
+        """Apply a system-level config change."""
+        changes = dict(variables["input"])
+        serial = changes.pop("serial")
+        _merge(self.systems[serial]["config"], changes)
+        etag = self._next_etag(serial)
+        await self._push_config(serial, {**changes, "etag": etag})
+        return {"updateInfinityConfig": {"etag": etag}}
+
+    async def _op_updateInfinityZoneActivity(self, variables: dict[str, Any]) -> dict[str, Any]:  # noqa: N802
+        """Apply a fan or set point change to one zone activity."""
+        changes = dict(variables["input"])
+        serial = changes.pop("serial")
+        zone_id = changes.pop("zoneId")
+        activity_type = changes.pop("activityType")
+        zone = _find_by_id(self.systems[serial]["config"]["zones"], zone_id)
+        activity = next(
+            (activity for activity in zone["activities"] if activity["type"] == activity_type),
+            None,
+        )
+        if activity is None:
+            raise web.HTTPBadRequest(text=f"unknown activity {activity_type}")
+        _merge(activity, changes)
+        etag = self._next_etag(serial)
+        await self._push_config(
+            serial,
+            {"etag": etag, "zones": [{"id": zone_id, "activities": [deepcopy(activity)]}]},
+        )
+        return {"updateInfinityZoneActivity": {"etag": etag}}
+
+    async def _op_updateInfinityZoneConfig(self, variables: dict[str, Any]) -> dict[str, Any]:  # noqa: N802
+        """Apply a hold or resume to one zone."""
+        changes = dict(variables["input"])
+        serial = changes.pop("serial")
+        zone_id = changes.pop("zoneId")
+        zone = _find_by_id(self.systems[serial]["config"]["zones"], zone_id)
+        _merge(zone, changes)
+        etag = self._next_etag(serial)
+        await self._push_config(serial, {"etag": etag, "zones": [{"id": zone_id, **changes}]})
+        return {"updateInfinityZoneConfig": {"etag": etag}}
+
+    async def _op_updateEntryLevelZone(self, variables: dict[str, Any]) -> dict[str, Any]:  # noqa: N802
+        """Apply a change to one entry-level zone."""
+        changes = dict(variables["input"])
+        system = self.entry_level_systems[changes.pop("serial")]
+        index = changes.pop("index")
+        zone = next(zone for zone in system["zones"] if zone["index"] == index)
+        _merge(zone, changes)
+        return {"updateEntryLevelZone": {"success": True}}
@@ -0,0 +1,345 @@
+"""Synthetic HVAC activity that looks like a real Carrier fleet.
+
+`HvacSimulator` evolves zone temperature and humidity, zone conditioning,
+blower RPM, outdoor unit output, and schedule transitions over simulated time.
+Each step yields Carrier-shaped ``InfinityStatus`` deltas that carry only the
+fields that changed, and `snapshot` returns matching ``load_data`` systems, so
+websocket traffic and full refreshes always agree.
+
+The simulator works on the same payload dictionaries as `CarrierStandIn`.
+Pass ``standin.systems`` to drive the stand-in over its websocket, or use
+`async_drive_coordinator` to feed a coordinator directly. Simulated time and
+message rate are independent: a test can replay a day of activity in a few
+seconds or hold a steady number of messages per second.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from copy import deepcopy
+from datetime import UTC, datetime, timedelta
+import json
+import math
+import random
+from typing import Any
+
+from carrier_api import Config, Energy, Profile, Status, System
+
+from custom_components.ha_carrier.carrier_data_update_coordinator import (
+    CarrierDataUpdateCoordinator,
+)
+from tests.conftest import build_scaled_systems
+from tests.standin.server import system_payloads
+
+SIMULATION_START = datetime(2026, 1, 5, 5, 0, tzinfo=UTC)
+
+# Degrees Fahrenheit per simulated minute.
+HEATING_RATE = 0.15
+COOLING_RATE = 0.12
+# Share of the indoor/outdoor difference lost per simulated minute.
+ENVELOPE_LOSS = 0.002
+# Degrees past the set point before a zone calls or stops calling.
+DEADBAND = 0.5
+
+IDLE_BLOWER_RPM = 0
+FAN_BLOWER_RPM = 400
+ACTIVE_BLOWER_RPM = 650
+
+
+def _scheduled_activity(zone: dict[str, Any], now: datetime) -> str:
+    """Return the activity ``zone``'s program selects at ``now``.
+
+    Args:
+        zone: Raw Carrier config zone.
+        now: Simulated local time.
+
+    Returns:
+        str: Activity type of the latest enabled period that has started,
+            falling back to the last one from the day before.
+    """
+    days = zone["program"]["day"]
+    sunday_0_today = (now.weekday() + 1) % 7
+
+    def enabled(day: int) -> list[dict[str, Any]]:
+        """Return the enabled periods of schedule day ``day``."""
+        return [period for period in days[day % 7]["period"] if period["enabled"] == "on"]
+
+    current_time = now.strftime("%H:%M")
+    started = [period for period in enabled(sunday_0_today) if period["time"] <= current_time]
+    if started:
+        return started[-1]["activity"]
+    yesterday = enabled(sunday_0_today - 1)
+    return yesterday[-1]["activity"] if yesterday else zone["holdActivity"]
+
+
+def status_delta(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of a status payload that changed.
+
+    Args:
+        before: Status payload before the step.
+        after: Status payload after the step.
+
+    Returns:
+        dict[str, Any]: Changed top-level fields, changed ``idu``/``odu``
+            fields, and changed zones with their ``id``.
+    """
+    delta: dict[str, Any] = {}
+    for key, value in after.items():
+        if key == "zones":
+            zones = []
+            for old_zone, new_zone in zip(before["zones"], value, strict=True):
+                changed = {
+                    field: field_value
+                    for field, field_value in new_zone.items()
+                    if old_zone.get(field) != field_value
+                }
+                if changed:
+                    zones.append({"id": new_zone["id"], **changed})
+            if zones:
+                delta["zones"] = zones
+        elif isinstance(value, dict):
+            changed = {
+                field: field_value
+                for field, field_value in value.items()
+                if before.get(key, {}).get(field) != field_value
+            }
+            if changed:
+                delta[key] = changed
+        elif before.get(key) != value:
+            delta[key] = value
+    return delta
+
+
+class HvacSimulator:
+    """Evolves Carrier system payloads over simulated time."""
+
+    def __init__(
+        self,
+        systems: dict[str, dict[str, Any]],
+        *,
+        seed: int = 0,
+        start: datetime = SIMULATION_START,
+        mean_outdoor_temperature: float = 40.0,
+    ) -> None:
+        """Take over payloads that the simulator will change in place.
+
+        Args:
+            systems: Payloads keyed by serial, shaped like
+                ``CarrierStandIn.systems``.
+            seed: Seed for weather and humidity noise.
+            start: Simulated time of the first step.
+            mean_outdoor_temperature: Daily mean outdoor temperature.
+        """
+        self.systems = systems
+        self.now = start
+        self.mean_outdoor_temperature = mean_outdoor_temperature
+        self._random = random.Random(seed)
+        # Unrounded zone readings; Carrier reports whole numbers.
+        self._temperatures: dict[tuple[str, str], float] = {}
+        self._humidity: dict[tuple[str, str], float] = {}
+        for serial, system in systems.items():
+            for zone in system["status"]["zones"]:
+                self._temperatures[serial, zone["id"]] = float(zone["rt"])
+                self._humidity[serial, zone["id"]] = float(zone["rh"])
+
+    @classmethod
+    def for_account(cls, system_count: int, zone_count: int, **kwargs: Any) -> HvacSimulator:
+        """Return a simulator for a fresh account of the given size.
+
+        Args:
+            system_count: Number of Carrier systems on the account.
+            zone_count: Zones per system.
+            **kwargs: Passed on to the constructor.
+
+        Returns:
+            HvacSimulator: Simulator owning new payloads.
+        """
+        return cls(system_payloads(build_scaled_systems(system_count, zone_count)), **kwargs)
+
+    def snapshot(self) -> list[System]:
+        """Return the current state as ``load_data`` would."""
+        return [
+            System(
+                profile=Profile(deepcopy(system["profile"])),
+                status=Status({**deepcopy(system["status"]), "utcTime": self.now.isoformat()}),
+                config=Config(deepcopy(system["config"])),
+                energy=Energy(deepcopy(system["energy"])),
+            )
+            for system in self.systems.values()
+        ]
+
+    def outdoor_temperature(self) -> float:
+        """Return the outdoor temperature at the simulated time."""
+        hour = self.now.hour + self.now.minute / 60
+        return self.mean_outdoor_temperature + 10 * math.sin((hour - 9) / 24 * 2 * math.pi)
+
+    def step(self, seconds: float = 60.0) -> list[dict[str, Any]]:
+        """Advance simulated time and return the websocket messages it causes.
+
+        Args:
+            seconds: Simulated seconds to advance.
+
+        Returns:
+            list[dict[str, Any]]: One ``InfinityStatus`` delta per system whose
+                reported status changed.
+        """
+        self.now += timedelta(seconds=seconds)
+        outdoor = self.outdoor_temperature() + self._random.uniform(-0.5, 0.5)
+        messages = []
+        for serial, system in self.systems.items():
+            before = deepcopy(system["status"])
+            self._step_system(serial, system, outdoor, seconds / 60)
+            delta = status_delta(before, system["status"])
+            if delta:
+                messages.append({"messageType": "InfinityStatus", "deviceId": serial, **delta})
+        return messages
+
+    def _step_system(
+        self, serial: str, system: dict[str, Any], outdoor: float, minutes: float
+    ) -> None:
+        """Advance one system's status payload by ``minutes``."""
+        status = system["status"]
+        config = system["config"]
+        mode = config["mode"]
+        heating = cooling = fan_running = 0
+        for zone_status in status["zones"]:
+            zone_config = next(zone for zone in config["zones"] if zone["id"] == zone_status["id"])
+            activity_type = (
+                zone_config["holdActivity"]
+                if zone_config["hold"] == "on"
+                else _scheduled_activity(zone_config, self.now)
+            )
+            activity = next(
+                activity
+                for activity in zone_config["activities"]
+                if activity["type"] == activity_type
+            )
+            key = serial, zone_status["id"]
+            temperature = self._temperatures[key]
+            conditioning = zone_status["zoneconditioning"]
+            if mode in {"heat", "auto"} and (
+                temperature < activity["htsp"] - DEADBAND
+                or (conditioning == "active_heat" and temperature < activity["htsp"] + DEADBAND)
+            ):
+                conditioning = "active_heat"
+                temperature += HEATING_RATE * minutes
+                heating += 1
+            elif mode in {"cool", "auto"} and (
+                temperature > activity["clsp"] + DEADBAND
+                or (conditioning == "active_cool" and temperature > activity["clsp"] - DEADBAND)
+            ):
+                conditioning = "active_cool"
+                temperature -= COOLING_RATE * minutes
+                cooling += 1
+            else:
+                conditioning = "idle"
+            temperature += (outdoor - temperature) * ENVELOPE_LOSS * minutes
+            self._temperatures[key] = temperature
+            humidity = self._humidity[key] + self._random.uniform(-0.3, 0.3) * minutes
+            if conditioning == "active_cool":
+                humidity -= 0.05 * minutes
+            self._humidity[key] = min(max(humidity, 25.0), 65.0)
+            if activity["fan"] != "off":
+                fan_running += 1
+            zone_status.update(
+                {
+                    "currentActivity": activity_type,
+                    "rt": float(round(temperature)),
+                    "rh": round(self._humidity[key]),
+                    "htsp": activity["htsp"],
+                    "clsp": activity["clsp"],
+                    "fan": activity["fan"],
+                    "hold": zone_config["hold"],
+                    "otmr": zone_config["otmr"],
+                    "zoneconditioning": conditioning,
+                    "damperposition": 100 if conditioning != "idle" else 15,
+                }
+            )
+        self._step_equipment(system, outdoor, heating, cooling, fan_running)
+
+    def _step_equipment(
+        self, system: dict[str, Any], outdoor: float, heating: int, cooling: int, fan_running: int
+    ) -> None:
+        """Set system mode, blower, and outdoor unit output from zone demand."""
+        status = system["status"]
+        heat_pump = system["profile"]["odutype"] in {"varcaphp", "hp"}
+        zone_count = len(status["zones"])
+        demand = heating + cooling
+        if heating:
+            status["mode"] = "hpheat" if heat_pump and outdoor > 30 else "gasheat"
+        elif cooling:
+            status["mode"] = "cool"
+        else:
+            status["mode"] = "off"
+        if demand:
+            rpm = ACTIVE_BLOWER_RPM + 350 * demand // zone_count
+        elif fan_running:
+            rpm = FAN_BLOWER_RPM
+        else:
+            rpm = IDLE_BLOWER_RPM
+        status["idu"]["blwrpm"] = rpm
+        status["idu"]["cfm"] = rpm * 2
+        status["idu"]["opstat"] = "on" if demand else "idle"
+        outdoor_unit_running = cooling or (heating and status["mode"] == "hpheat")
+        # Variable-speed outdoor units report their output percentage as text.
+        status["odu"]["opstat"] = (
+            str(min(100, 25 + 75 * demand // zone_count)) if outdoor_unit_running else "off"
+        )
+        status["oat"] = round(outdoor)
+
+    async def async_run(
+        self,
+        emit: Callable[[dict[str, Any]], Awaitable[Any]],
+        *,
+        messages: int,
+        messages_per_second: float | None = None,
+        step_seconds: float = 60.0,
+    ) -> int:
+        """Step the simulation and hand its messages to ``emit``.
+
+        Args:
+            emit: Coroutine function called with each message, e.g.
+                ``CarrierStandIn.push``.
+            messages: Number of messages to emit.
+            messages_per_second: Wall-clock rate to hold; None emits as fast
+                as possible.
+            step_seconds: Simulated seconds per step.
+
+        Returns:
+            int: Number of messages emitted.
+        """
+        loop = asyncio.get_running_loop()
+        interval = 1 / messages_per_second if messages_per_second else 0.0
+        next_at = loop.time()
+        sent = 0
+        while sent < messages:
+            for message in self.step(step_seconds):
+                if sent == messages:
+                    break
+                if interval:
+                    next_at += interval
+                    await asyncio.sleep(max(next_at - loop.time(), 0.0))
+                await emit(message)
+                sent += 1
+        return sent
+
+    async def async_drive_coordinator(
+        self, coordinator: CarrierDataUpdateCoordinator, **kwargs: Any
+    ) -> int:
+        """Feed simulated messages through the coordinator's websocket callback.
+
+        Args:
+            coordinator: Coordinator loaded with this simulator's systems.
+            **kwargs: Passed on to `async_run`.
+
+        Returns:
+            int: Number of messages applied.
+        """
+
+        async def emit(message: dict[str, Any]) -> None:
+            """Apply one message the way the websocket listener would."""
+            websocket_message = json.dumps({"timestamp": datetime.now(UTC).isoformat(), **message})
+            await coordinator.async_handle_websocket_message(websocket_message)
+
+        return await self.async_run(emit, **kwargs)
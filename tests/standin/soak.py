@@ -0,0 +1,145 @@
+"""Memory, task, and event loop sampling for the opt-in soak test.
+
+The soak test is skipped unless ``CARRIER_SOAK`` is set. ``CARRIER_SOAK_ROUNDS``
+lengthens or shortens the run; the budgets below decide when it fails.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+import gc
+import os
+import tracemalloc
+
+from carrier_api import System
+import pytest
+
+from custom_components.ha_carrier.carrier_data_update_coordinator import (
+    CarrierDataUpdateCoordinator,
+)
+from custom_components.ha_carrier.const import DOMAIN
+
+SOAK_ENV = "CARRIER_SOAK"
+SOAK_ROUNDS_ENV = "CARRIER_SOAK_ROUNDS"
+SOAK_DEFAULT_ROUNDS = 30
+SOAK_WARMUP_ROUNDS = 3
+SOAK_MESSAGES_PER_ROUND = 200
+SOAK_RELOAD_EVERY = 5
+SOAK_MEMORY_BUDGET_BYTES = 2 * 1024 * 1024
+SOAK_LOOP_LAG_BUDGET_SECONDS = 0.25
+
+# Task name prefixes of the integration's websocket loop and carrier_api's heartbeat.
+WEBSOCKET_TASK_PREFIXES = (f"{DOMAIN}_ws_", "carrier_api_ws")
+
+requires_soak = pytest.mark.skipif(
+    not os.environ.get(SOAK_ENV), reason=f"set {SOAK_ENV}=1 to run the soak test"
+)
+
+
+def soak_rounds() -> int:
+    """Return how many rounds the soak test runs."""
+    return int(os.environ.get(SOAK_ROUNDS_ENV, SOAK_DEFAULT_ROUNDS))
+
+
+@dataclass
+class SoakSample:
+    """Resource usage measured at the end of one soak round.
+
+    Attributes:
+        round: Round the sample was taken after.
+        traced_bytes: Memory currently traced by ``tracemalloc``.
+        systems_alive: ``carrier_api`` ``System`` objects still reachable.
+        websocket_callbacks: Callbacks registered on the live websocket client.
+        websocket_tasks: Websocket listener and heartbeat tasks still running.
+    """
+
+    round: int
+    traced_bytes: int
+    systems_alive: int
+    websocket_callbacks: int
+    websocket_tasks: int
+
+
+def take_sample(round_number: int, coordinator: CarrierDataUpdateCoordinator) -> SoakSample:
+    """Collect garbage, then measure what the integration still holds.
+
+    Args:
+        round_number: Round that just finished.
+        coordinator: Coordinator of the currently loaded entry.
+
+    Returns:
+        SoakSample: Resource usage after the round.
+    """
+    gc.collect()
+    traced_bytes, _peak = tracemalloc.get_traced_memory()
+    api_websocket = coordinator.api_connection.api_websocket
+    return SoakSample(
+        round=round_number,
+        traced_bytes=traced_bytes,
+        systems_alive=sum(1 for obj in gc.get_objects() if isinstance(obj, System)),
+        websocket_callbacks=len(api_websocket.async_callbacks) if api_websocket else 0,
+        websocket_tasks=sum(
+            1
+            for task in asyncio.all_tasks()
+            if not task.done() and task.get_name().startswith(WEBSOCKET_TASK_PREFIXES)
+        ),
+    )
+
+
+def sustained_growth(values: list[int]) -> int:
+    """Return how far the last third of ``values`` stays above the first third.
+
+    Noise and caches that fill up once go back below an earlier high-water
+    mark; a leak keeps every later sample above every earlier one.
+
+    Args:
+        values: Samples in the order they were taken.
+
+    Returns:
+        int: Lowest late sample minus highest early sample; zero or negative
+            when usage levelled off.
+    """
+    third = max(len(values) // 3, 1)
+    return min(values[-third:]) - max(values[:third])
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes a task that only sleeps."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        """Initialize an idle monitor.
+
+        Args:
+            interval: Seconds between wake-ups.
+        """
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def max_lag(self) -> float:
+        """Return the worst lag seen so far in seconds."""
+        return max(self.samples, default=0.0)
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        self._task = asyncio.create_task(self._run(), name="carrier_soak_loop_lag")
+
+    async def stop(self) -> None:
+        """Stop sampling and wait for the task to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Sleep for ``interval`` repeatedly and record each late wake-up."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(loop.time() - started - self.interval, 0.0))
@@ -0,0 +1,109 @@
+"""Workflow tests for the synthetic HVAC activity simulator."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from copy import deepcopy
+from datetime import UTC, datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from tests.conftest import FakeCarrierApiConnection
+from tests.standin.conftest import async_wait_for
+from tests.standin.server import CarrierStandIn
+from tests.standin.simulator import HvacSimulator
+
+
+def _zone_readings(systems: list[Any]) -> list[tuple[str, str, float, str]]:
+    """Return serial, zone, temperature, and conditioning for every zone."""
+    return [
+        (system.profile.serial, zone.api_id, zone.temperature, zone.conditioning)
+        for system in systems
+        for zone in system.status.zones
+    ]
+
+
+@pytest.fixture
+def simulator() -> HvacSimulator:
+    """Return a simulator for two systems with three zones each."""
+    return HvacSimulator.for_account(2, 3)
+
+
+@pytest.fixture
+def carrier_api(simulator: HvacSimulator) -> FakeCarrierApiConnection:
+    """Return a fake connection that loads the simulator's starting state."""
+    return FakeCarrierApiConnection(systems=simulator.snapshot())
+
+
+def test_step_emits_only_changed_status_fields(simulator: HvacSimulator) -> None:
+    """Send each system's changed fields, keyed by zone id, and nothing else."""
+    before = deepcopy(simulator.systems)
+
+    messages = simulator.step(3600)
+
+    assert messages
+    for message in messages:
+        assert message["messageType"] == "InfinityStatus"
+        status = simulator.systems[message["deviceId"]]["status"]
+        for zone in message.get("zones", []):
+            current = next(item for item in status["zones"] if item["id"] == zone["id"])
+            previous = next(
+                item
+                for item in before[message["deviceId"]]["status"]["zones"]
+                if item["id"] == zone["id"]
+            )
+            for field, value in zone.items():
+                assert current[field] == value
+                assert field == "id" or previous[field] != value
+
+
+def test_schedule_transition_changes_activity() -> None:
+    """Switch the zone to the next scheduled activity when its period starts."""
+    simulator = HvacSimulator.for_account(1, 1, start=datetime(2026, 1, 5, 23, 58, tzinfo=UTC))
+
+    simulator.step(30)
+    assert simulator.systems["SYS000"]["status"]["zones"][0]["currentActivity"] == "home"
+    messages = simulator.step(60)
+
+    assert messages[0]["zones"][0]["currentActivity"] == "sleep"
+    assert messages[0]["zones"][0]["htsp"] == 66
+
+
+@pytest.mark.asyncio
+async def test_simulated_traffic_keeps_coordinator_matching_snapshot(
+    hass: HomeAssistant,
+    simulator: HvacSimulator,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Leave the coordinator where a full refresh of the simulator would."""
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+
+    assert await simulator.async_drive_coordinator(coordinator, messages=200) == 200
+
+    assert _zone_readings(coordinator.systems) == _zone_readings(simulator.snapshot())
+    assert [system.status.raw["mode"] for system in coordinator.systems] == [
+        system.status.raw["mode"] for system in simulator.snapshot()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_simulator_drives_standin_websocket_at_requested_rate(
+    hass: HomeAssistant,
+    carrier_standin: CarrierStandIn,
+    setup_standin_integration: Callable[..., Any],
+) -> None:
+    """Push simulated deltas over the stand-in websocket to the integration."""
+    config_entry = await setup_standin_integration()
+    coordinator = config_entry.runtime_data
+    simulator = HvacSimulator(carrier_standin.systems)
+    loop = hass.loop
+    started = loop.time()
+
+    await simulator.async_run(carrier_standin.push, messages=20, messages_per_second=100)
+
+    assert loop.time() - started >= 0.19
+    await async_wait_for(lambda: coordinator.metrics.websocket_messages >= 20)
+    assert _zone_readings(coordinator.systems) == _zone_readings(simulator.snapshot())
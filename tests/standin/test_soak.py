@@ -0,0 +1,113 @@
+"""Opt-in soak test for memory growth, leaked tasks, and event loop lag."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import replace
+import tracemalloc
+from typing import Any
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN, SERVICE_SET_FAN_MODE
+from homeassistant.components.climate.const import ATTR_FAN_MODE
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.ha_carrier import WEBSOCKET_RETRY_POLICY
+from tests.conftest import build_scaled_systems, entity_id_for_unique_id
+from tests.loop_blocking import allow_loop_blocking
+from tests.standin.conftest import async_wait_for
+from tests.standin.server import CarrierStandIn
+from tests.standin.simulator import HvacSimulator
+from tests.standin.soak import (
+    SOAK_LOOP_LAG_BUDGET_SECONDS,
+    SOAK_MEMORY_BUDGET_BYTES,
+    SOAK_MESSAGES_PER_ROUND,
+    SOAK_RELOAD_EVERY,
+    SOAK_WARMUP_ROUNDS,
+    LoopLagMonitor,
+    SoakSample,
+    requires_soak,
+    soak_rounds,
+    sustained_growth,
+    take_sample,
+)
+
+# Debug-mode source tracebacks would skew the memory and loop lag being measured.
+pytestmark = [requires_soak, allow_loop_blocking]
+
+
+@pytest.fixture
+def carrier_standin() -> CarrierStandIn:
+    """Return a stand-in account with three four-zone systems."""
+    return CarrierStandIn(build_scaled_systems(3, 4))
+
+
+@pytest.fixture(autouse=True)
+def fast_websocket_reconnect(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reconnect dropped websockets quickly so disconnects fit in a round."""
+    monkeypatch.setattr(
+        "custom_components.ha_carrier.WEBSOCKET_RETRY_POLICY",
+        replace(WEBSOCKET_RETRY_POLICY, base_delay=0.05, max_delay=0.05),
+    )
+
+
+@pytest.fixture
+def traced_memory() -> Iterator[None]:
+    """Trace allocations for the length of the test."""
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("traced_memory")
+async def test_soak_keeps_memory_tasks_and_loop_lag_bounded(
+    hass: HomeAssistant,
+    carrier_standin: CarrierStandIn,
+    setup_standin_integration: Callable[..., Any],
+) -> None:
+    """Run messages, refreshes, writes, disconnects, and reloads without leaking."""
+    config_entry = await setup_standin_integration()
+    simulator = HvacSimulator(carrier_standin.systems)
+    entity_id = entity_id_for_unique_id(hass, CLIMATE_DOMAIN, "sys000_zone_1_thermostat")
+    monitor = LoopLagMonitor()
+    monitor.start()
+    samples: list[SoakSample] = []
+    try:
+        for round_number in range(1, soak_rounds() + 1):
+            coordinator = config_entry.runtime_data
+            await simulator.async_run(carrier_standin.push, messages=SOAK_MESSAGES_PER_ROUND)
+            await coordinator.async_refresh()
+            coordinator.data_flush = True
+            await coordinator.async_refresh()
+            await hass.services.async_call(
+                CLIMATE_DOMAIN,
+                SERVICE_SET_FAN_MODE,
+                {ATTR_ENTITY_ID: entity_id, ATTR_FAN_MODE: ("high", "low")[round_number % 2]},
+                blocking=True,
+            )
+            connections = carrier_standin.connections
+            await carrier_standin.disconnect()
+            if round_number % SOAK_RELOAD_EVERY == 0:
+                assert await hass.config_entries.async_reload(config_entry.entry_id)
+            await hass.async_block_till_done()
+            await async_wait_for(
+                lambda seen=connections: carrier_standin.connections > seen, seconds=10
+            )
+            if round_number > SOAK_WARMUP_ROUNDS:
+                samples.append(take_sample(round_number, config_entry.runtime_data))
+    finally:
+        await monitor.stop()
+
+    assert samples, "soak run was shorter than its warm-up"
+    baseline = samples[0]
+    for sample in samples:
+        assert sample.websocket_callbacks == 1, sample
+        assert sample.websocket_tasks <= 2, sample
+        assert sample.systems_alive <= baseline.systems_alive, sample
+    growth = sustained_growth([sample.traced_bytes for sample in samples])
+    assert growth <= SOAK_MEMORY_BUDGET_BYTES, f"memory grew by {growth} bytes"
+    assert monitor.max_lag <= SOAK_LOOP_LAG_BUDGET_SECONDS, (
+        f"event loop lagged {monitor.max_lag:.3f} seconds"
+    )
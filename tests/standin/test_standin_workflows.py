@@ -0,0 +1,97 @@
+"""Workflow tests running the real Carrier client against the local stand-in."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN, SERVICE_SET_FAN_MODE
+from homeassistant.components.climate.const import ATTR_FAN_MODE
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+import pytest
+from yarl import URL
+
+from tests.conftest import entity_id_for_unique_id
+from tests.standin.conftest import async_wait_for
+from tests.standin.server import CarrierStandIn, redirected_url
+
+
+def test_redirect_only_rewrites_carrier_hosts() -> None:
+    """Point Carrier's hosts at the stand-in and leave other hosts alone."""
+    base_url = URL("http://127.0.0.1:8123/")
+
+    assert redirected_url(
+        URL("wss://realtime.infinity.iot.carrier.com/?Token=abc"), base_url
+    ) == URL("ws://127.0.0.1:8123/realtime/?Token=abc")
+    assert redirected_url(
+        URL("https://dataservice.infinity.iot.carrier.com/graphql"), base_url
+    ) == URL("http://127.0.0.1:8123/dataservice/graphql")
+    assert redirected_url(URL("https://example.com/path"), base_url) == URL(
+        "https://example.com/path"
+    )
+
+
+@pytest.mark.asyncio
+async def test_setup_logs_in_and_loads_systems_from_standin(
+    hass: HomeAssistant,
+    carrier_standin: CarrierStandIn,
+    setup_standin_integration: Callable[..., Any],
+) -> None:
+    """Load the account through the real GraphQL client and open the websocket."""
+    await setup_standin_integration()
+
+    assert hass.states.get(
+        entity_id_for_unique_id(hass, CLIMATE_DOMAIN, "abc123_zone_1_thermostat")
+    )
+    assert carrier_standin.operations["assistedLogin"] == 1
+    assert carrier_standin.operations["getInfinitySystems"] >= 1
+    assert carrier_standin.operations["getInfinityEnergy"] >= 1
+    assert len(carrier_standin.websockets) == 1
+
+
+@pytest.mark.asyncio
+async def test_websocket_push_updates_entity_state(
+    hass: HomeAssistant,
+    carrier_standin: CarrierStandIn,
+    setup_standin_integration: Callable[..., Any],
+) -> None:
+    """Apply a status message pushed by the stand-in to the thermostat."""
+    await setup_standin_integration()
+    entity_id = entity_id_for_unique_id(hass, CLIMATE_DOMAIN, "abc123_zone_1_thermostat")
+
+    assert await carrier_standin.push_status("ABC123", {"zones": [{"id": "1", "rh": 55}]}) == 1
+
+    def humidity_applied() -> bool:
+        """Return whether the pushed humidity reached the entity."""
+        state = hass.states.get(entity_id)
+        return state is not None and state.attributes.get("current_humidity") == 55
+
+    await async_wait_for(humidity_applied)
+
+
+@pytest.mark.asyncio
+async def test_fan_mode_write_changes_standin_state(
+    hass: HomeAssistant,
+    carrier_standin: CarrierStandIn,
+    setup_standin_integration: Callable[..., Any],
+) -> None:
+    """Send a fan mode write through the real mutation and receive its echo."""
+    config_entry = await setup_standin_integration()
+    entity_id = entity_id_for_unique_id(hass, CLIMATE_DOMAIN, "abc123_zone_1_thermostat")
+
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_FAN_MODE,
+        {ATTR_ENTITY_ID: entity_id, ATTR_FAN_MODE: "high"},
+        blocking=True,
+    )
+
+    assert carrier_standin.operations["updateInfinityZoneActivity"] == 1
+    home = carrier_standin.systems["ABC123"]["config"]["zones"][0]["activities"][0]
+    assert home["fan"] == "high"
+    coordinator = config_entry.runtime_data
+    await async_wait_for(lambda: coordinator.metrics.websocket_messages >= 1)
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.attributes["fan_mode"] == "high"
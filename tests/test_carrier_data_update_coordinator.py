@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from typing import Any
 from unittest.mock import patch
 
 from carrier_api import CarrierApiAuthError, CarrierApiConnectionError, CarrierApiGraphqlError
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
 from homeassistant.helpers.update_coordinator import UpdateFailed
 import pytest
@@ -23,28 +25,27 @@ from custom_components.ha_carrier.const import (
 from custom_components.ha_carrier.exceptions import CarrierUnauthorizedError
 from custom_components.ha_carrier.resiliency import ResiliencyState
 
-from .conftest import FakeCarrierApiConnection, build_carrier_system
+from .conftest import FakeCarrierApiConnection, build_carrier_system, build_entry_level_system
 
 
-def _set_coordinator_api_connection(
-    coordinator: CarrierDataUpdateCoordinator,
-    api_connection: FakeCarrierApiConnection,
-) -> None:
-    """Attach a fake API connection to a partially constructed coordinator."""
-    object.__setattr__(coordinator, "api_connection", api_connection)
+@pytest.fixture
+def coordinator(
+    hass: HomeAssistant, carrier_api: FakeCarrierApiConnection
+) -> CarrierDataUpdateCoordinator:
+    """Return a coordinator for the fake account that no config entry owns."""
+    return CarrierDataUpdateCoordinator(hass, carrier_api)
 
 
 @pytest.mark.asyncio
 async def test_initial_full_refresh_preserves_systems_list_identity(
     carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
 ) -> None:
     """Mutate the systems list in place when initially loading systems."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     systems: list[Any] = []
     fresh_systems = [build_carrier_system()]
     carrier_api.systems = fresh_systems
     coordinator.systems = systems
-    _set_coordinator_api_connection(coordinator, carrier_api)
     coordinator.resiliency = ResiliencyState(
         unauthorized_threshold=UNAUTHORIZED_RETRY_THRESHOLD,
         transient_threshold=TRANSIENT_FAILURE_THRESHOLD,
@@ -60,11 +61,10 @@ async def test_initial_full_refresh_preserves_systems_list_identity(
 @pytest.mark.asyncio
 async def test_energy_refresh_uses_cycle_scoped_success_reset(
     carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
 ) -> None:
     """Preserve resiliency state across per-system energy successes."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.systems = [build_carrier_system()]
-    _set_coordinator_api_connection(coordinator, carrier_api)
     object.__setattr__(
         coordinator,
         "resiliency",
@@ -90,9 +90,10 @@ async def test_energy_refresh_uses_cycle_scoped_success_reset(
 
 
 @pytest.mark.asyncio
-async def test_update_attempts_refresh_when_previous_auth_count_is_escalated() -> None:
+async def test_update_attempts_refresh_when_previous_auth_count_is_escalated(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Require a fresh failed read before converting an old auth streak to reauth."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.resiliency = ResiliencyState(
         unauthorized_threshold=UNAUTHORIZED_RETRY_THRESHOLD,
         transient_threshold=TRANSIENT_FAILURE_THRESHOLD,
@@ -125,9 +126,10 @@ async def test_update_attempts_refresh_when_previous_auth_count_is_escalated() -
 
 
 @pytest.mark.asyncio
-async def test_successful_write_reconciliation_clears_escalated_auth_state() -> None:
+async def test_successful_write_reconciliation_clears_escalated_auth_state(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Let a successful reconciliation refresh clear a write auth streak."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.resiliency = ResiliencyState(
         unauthorized_threshold=UNAUTHORIZED_RETRY_THRESHOLD,
         transient_threshold=TRANSIENT_FAILURE_THRESHOLD,
@@ -150,9 +152,10 @@ async def test_successful_write_reconciliation_clears_escalated_auth_state() ->
 
 
 @pytest.mark.asyncio
-async def test_recoverable_write_communication_error_reconciles_and_raises_ha_error() -> None:
+async def test_recoverable_write_communication_error_reconciles_and_raises_ha_error(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Surface exhausted write communication failures as Home Assistant errors."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.resiliency = ResiliencyState(unauthorized_threshold=3, transient_threshold=3)
     reconciled = False
 
@@ -164,6 +167,7 @@ async def test_recoverable_write_communication_error_reconciles_and_raises_ha_er
         self: CarrierDataUpdateCoordinator,
         operation_name: str,
         error: BaseException | None = None,
+        entry_level_serial: str | None = None,
     ) -> None:
         """Record reconciliation after the failed write."""
         nonlocal reconciled
@@ -185,9 +189,10 @@ async def test_recoverable_write_communication_error_reconciles_and_raises_ha_er
 
 
 @pytest.mark.asyncio
-async def test_carrier_api_write_rejection_reconciles_and_raises_ha_error() -> None:
+async def test_carrier_api_write_rejection_reconciles_and_raises_ha_error(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Surface Carrier API business rejections as Home Assistant errors."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.resiliency = ResiliencyState(unauthorized_threshold=3, transient_threshold=3)
     reconciled = False
 
@@ -199,6 +204,7 @@ async def test_carrier_api_write_rejection_reconciles_and_raises_ha_error() -> N
         self: CarrierDataUpdateCoordinator,
         operation_name: str,
         error: BaseException | None = None,
+        entry_level_serial: str | None = None,
     ) -> None:
         """Record reconciliation after the failed write."""
         nonlocal reconciled
@@ -220,9 +226,10 @@ async def test_carrier_api_write_rejection_reconciles_and_raises_ha_error() -> N
 
 
 @pytest.mark.asyncio
-async def test_update_data_translates_unauthorized_refresh_to_reauth() -> None:
+async def test_update_data_translates_unauthorized_refresh_to_reauth(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Escalate a fresh unauthorized refresh failure to HA reauthentication."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.data_flush = True
 
     async def fake_full_refresh() -> None:
@@ -240,9 +247,10 @@ async def test_update_data_translates_unauthorized_refresh_to_reauth() -> None:
 
 
 @pytest.mark.asyncio
-async def test_update_data_keeps_plain_unauthorized_server_error_retryable() -> None:
+async def test_update_data_keeps_plain_unauthorized_server_error_retryable(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Keep non-escalated unauthorized transport errors on HA retry cadence."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.data_flush = True
     coordinator.update_interval = None
 
@@ -263,16 +271,15 @@ async def test_update_data_keeps_plain_unauthorized_server_error_retryable() ->
 @pytest.mark.asyncio
 async def test_full_refresh_merges_new_changed_and_stale_systems(
     carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
 ) -> None:
     """Merge fresh full-refresh systems in place and remove stale systems."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     existing = build_carrier_system(serial="ABC123", name="Old")
     stale = build_carrier_system(serial="STALE", name="Stale")
     fresh_existing = build_carrier_system(serial="ABC123", name="Updated")
     fresh_new = build_carrier_system(serial="NEW123", name="New")
     carrier_api.systems = [fresh_existing, fresh_new]
     coordinator.systems = [existing, stale]
-    _set_coordinator_api_connection(coordinator, carrier_api)
     coordinator.resiliency = ResiliencyState(
         unauthorized_threshold=UNAUTHORIZED_RETRY_THRESHOLD,
         transient_threshold=TRANSIENT_FAILURE_THRESHOLD,
@@ -284,23 +291,191 @@ async def test_full_refresh_merges_new_changed_and_stale_systems(
     assert coordinator.systems[0] is existing
     assert coordinator.systems[0].profile.name == "Updated"
     assert [system.profile.serial for system in coordinator.systems] == ["ABC123", "NEW123"]
-    assert len(carrier_api.api_websocket.callbacks) == 2
+    assert carrier_api.api_websocket.callbacks == [coordinator.async_handle_websocket_message]
+    assert coordinator.data_flush is False
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_loads_entry_level_data_concurrently(
+    carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
+    """Start the entry-level fetch before the Infinity load finishes."""
+    coordinator.systems = []
+    coordinator.resiliency = ResiliencyState(
+        unauthorized_threshold=UNAUTHORIZED_RETRY_THRESHOLD,
+        transient_threshold=TRANSIENT_FAILURE_THRESHOLD,
+    )
+    coordinator._websocket_initialized = True
+    entry_level = [build_entry_level_system()]
+    carrier_api.entry_level_systems = entry_level
+    entry_level_started = asyncio.Event()
+    original_load_entry_level_data = carrier_api.load_entry_level_data
+
+    async def load_entry_level_data() -> list[Any]:
+        """Signal that the entry-level fetch is in flight."""
+        entry_level_started.set()
+        return await original_load_entry_level_data()
+
+    async def load_data() -> list[Any]:
+        """Finish only after the entry-level fetch has started."""
+        await asyncio.wait_for(entry_level_started.wait(), timeout=1)
+        return carrier_api.systems
+
+    object.__setattr__(carrier_api, "load_entry_level_data", load_entry_level_data)
+    object.__setattr__(carrier_api, "load_data", load_data)
+
+    await coordinator._async_full_refresh()
+
+    assert coordinator.systems == carrier_api.systems
+    assert coordinator.entry_level_systems == entry_level
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_awaits_cancelled_entry_level_fetch_when_load_fails(
+    carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
+    """Finish cancelling the entry-level fetch before the load error propagates."""
+    coordinator.systems = []
+    coordinator.resiliency = ResiliencyState(
+        unauthorized_threshold=UNAUTHORIZED_RETRY_THRESHOLD,
+        transient_threshold=TRANSIENT_FAILURE_THRESHOLD,
+    )
+    entry_level_started = asyncio.Event()
+    entry_level_cancelled = False
+
+    async def load_entry_level_data() -> list[Any]:
+        """Hang until cancelled, noting the cancellation."""
+        nonlocal entry_level_cancelled
+        entry_level_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            entry_level_cancelled = True
+            raise
+        return []
+
+    async def load_data() -> list[Any]:
+        """Fail once the entry-level fetch is in flight."""
+        await asyncio.wait_for(entry_level_started.wait(), timeout=1)
+        raise RuntimeError("unexpected payload")
+
+    object.__setattr__(carrier_api, "load_entry_level_data", load_entry_level_data)
+    object.__setattr__(carrier_api, "load_data", load_data)
+
+    with pytest.raises(RuntimeError):
+        await coordinator._async_full_refresh()
+
+    assert entry_level_cancelled
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_keeps_entry_level_data_when_entry_level_fetch_fails(
+    carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Treat an entry-level failure as non-fatal and keep the previous data."""
+    monkeypatch.setattr(
+        "custom_components.ha_carrier.resiliency.compute_backoff_delay", lambda *_: 0
+    )
+    coordinator.systems = []
+    previous = [build_entry_level_system()]
+    coordinator.entry_level_systems = previous
+    coordinator.resiliency = ResiliencyState(
+        unauthorized_threshold=UNAUTHORIZED_RETRY_THRESHOLD,
+        transient_threshold=TRANSIENT_FAILURE_THRESHOLD,
+    )
+    coordinator._websocket_initialized = True
+    carrier_api.load_entry_level_data_error = CarrierApiConnectionError("offline")
+
+    await coordinator._async_full_refresh()
+
+    assert coordinator.systems == carrier_api.systems
+    assert coordinator.entry_level_systems is previous
     assert coordinator.data_flush is False
 
 
+@pytest.mark.asyncio
+async def test_entry_level_fetch_retries_transient_failures(
+    carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Retry a dropped entry-level fetch through the shared retry helper."""
+    monkeypatch.setattr(
+        "custom_components.ha_carrier.resiliency.compute_backoff_delay", lambda *_: 0
+    )
+    entry_level = [build_entry_level_system()]
+    carrier_api.entry_level_systems = entry_level
+    carrier_api.load_entry_level_data_error = CarrierApiConnectionError("dropped")
+    original_load_entry_level_data = carrier_api.load_entry_level_data
+
+    async def load_entry_level_data() -> list[Any]:
+        """Fail the first attempt only."""
+        try:
+            return await original_load_entry_level_data()
+        finally:
+            carrier_api.load_entry_level_data_error = None
+
+    object.__setattr__(carrier_api, "load_entry_level_data", load_entry_level_data)
+
+    assert await coordinator.async_refresh_entry_level_systems()
+
+    assert coordinator.entry_level_systems == entry_level
+    assert carrier_api.calls.count(("load_entry_level_data", {})) == 2
+    assert carrier_api.auth_checks == 2
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_gives_up_on_entry_level_fetch_at_the_refresh_deadline(
+    carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Cancel a hung entry-level fetch at the deadline and keep the previous data."""
+    monkeypatch.setattr(
+        "custom_components.ha_carrier.carrier_data_update_coordinator.REFRESH_DEADLINE_SECONDS",
+        0.05,
+    )
+    coordinator.systems = []
+    previous = [build_entry_level_system()]
+    coordinator.entry_level_systems = previous
+    coordinator._websocket_initialized = True
+    entry_level_cancelled = False
+
+    async def load_entry_level_data() -> list[Any]:
+        """Hang until cancelled, noting the cancellation."""
+        nonlocal entry_level_cancelled
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            entry_level_cancelled = True
+            raise
+        return []
+
+    object.__setattr__(carrier_api, "load_entry_level_data", load_entry_level_data)
+
+    await asyncio.wait_for(coordinator._async_full_refresh(), timeout=1)
+
+    assert entry_level_cancelled
+    assert coordinator.systems == carrier_api.systems
+    assert coordinator.entry_level_systems is previous
+
+
 @pytest.mark.asyncio
 async def test_energy_refresh_records_one_unauthorized_per_cycle(
     carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
 ) -> None:
     """Preserve prior energy and escalate only one auth count per energy cycle."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     systems = [
         build_carrier_system(serial="ABC123"),
         build_carrier_system(serial="DEF456"),
     ]
     existing_energy = systems[0].energy
     coordinator.systems = systems
-    _set_coordinator_api_connection(coordinator, carrier_api)
     coordinator.resiliency = ResiliencyState(unauthorized_threshold=2, transient_threshold=3)
     coordinator.update_interval = None
 
@@ -320,9 +495,10 @@ async def test_energy_refresh_records_one_unauthorized_per_cycle(
 
 
 @pytest.mark.asyncio
-async def test_update_data_forces_full_refresh_when_reconcile_interval_elapsed() -> None:
+async def test_update_data_forces_full_refresh_when_reconcile_interval_elapsed(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Force a full reconcile when websocket-maintained data is overdue for a full fetch."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.data_flush = False
     coordinator.systems = [build_carrier_system()]
     coordinator.timestamp_all_data = datetime.now(UTC) - timedelta(
@@ -358,9 +534,10 @@ async def test_update_data_forces_full_refresh_when_reconcile_interval_elapsed()
 
 
 @pytest.mark.asyncio
-async def test_update_data_stays_energy_only_before_reconcile_interval() -> None:
+async def test_update_data_stays_energy_only_before_reconcile_interval(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Keep the periodic poll energy-only until the full-reconcile interval elapses."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.data_flush = False
     coordinator.systems = [build_carrier_system()]
     coordinator.timestamp_all_data = datetime.now(UTC) - timedelta(
@@ -394,10 +571,11 @@ async def test_update_data_stays_energy_only_before_reconcile_interval() -> None
     assert full_refresh_called is False
 
 
-def test_full_reconcile_due_covers_timestamp_states() -> None:
+@pytest.mark.asyncio
+async def test_full_reconcile_due_covers_timestamp_states(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Report reconcile due when never refreshed or overdue, and not when fresh."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
-
     coordinator.timestamp_all_data = None
     assert coordinator._full_reconcile_due() is True
 
@@ -413,9 +591,10 @@ def test_full_reconcile_due_covers_timestamp_states() -> None:
 
 
 @pytest.mark.asyncio
-async def test_begin_post_write_intercept_captures_written_target_only() -> None:
+async def test_begin_post_write_intercept_captures_written_target_only(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Opening a guard records the written system's mode and that zone's set points."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system = build_carrier_system()
     coordinator.systems = [system]
     coordinator._intercept_guards = {}
@@ -435,9 +614,10 @@ async def test_begin_post_write_intercept_captures_written_target_only() -> None
 
 
 @pytest.mark.asyncio
-async def test_reasserts_reverted_mode_and_still_publishes() -> None:
+async def test_reasserts_reverted_mode_and_still_publishes(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """A reverted system mode is restored, and the message is still published."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system = build_carrier_system()
     coordinator.systems = [system]
     coordinator._intercept_guards = {}
@@ -461,9 +641,10 @@ async def test_reasserts_reverted_mode_and_still_publishes() -> None:
 
 
 @pytest.mark.asyncio
-async def test_system_level_write_reasserts_mode_without_zone() -> None:
+async def test_system_level_write_reasserts_mode_without_zone(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """A system-level write (zone_api_id=None) protects mode and records no zone."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system = build_carrier_system()
     coordinator.systems = [system]
     coordinator._intercept_guards = {}
@@ -492,9 +673,10 @@ async def test_system_level_write_reasserts_mode_without_zone() -> None:
 
 
 @pytest.mark.asyncio
-async def test_reasserts_reverted_setpoint_and_still_publishes() -> None:
+async def test_reasserts_reverted_setpoint_and_still_publishes(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """A reverted set point is restored to the written value; message still published."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system = build_carrier_system()
     coordinator.systems = [system]
     coordinator._intercept_guards = {}
@@ -525,9 +707,10 @@ async def test_reasserts_reverted_setpoint_and_still_publishes() -> None:
 
 
 @pytest.mark.asyncio
-async def test_matching_state_is_not_rewritten() -> None:
+async def test_matching_state_is_not_rewritten(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """When nothing reverted, re-assert leaves state as-is and still publishes."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system = build_carrier_system()
     coordinator.systems = [system]
     coordinator._intercept_guards = {}
@@ -548,7 +731,9 @@ async def test_matching_state_is_not_rewritten() -> None:
 
 
 @pytest.mark.asyncio
-async def test_control_revert_does_not_drop_other_system_update() -> None:
+async def test_control_revert_does_not_drop_other_system_update(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """A reverted control field on the written system must not drop another system's update.
 
     One Carrier websocket message carries every system/zone, applied by
@@ -557,7 +742,6 @@ async def test_control_revert_does_not_drop_other_system_update() -> None:
     the other system's already-applied change (e.g. going idle) reaching Home
     Assistant.
     """
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system_a = build_carrier_system(serial="A", zone_id="1")
     system_b = build_carrier_system(serial="B", zone_id="2")
     coordinator.systems = [system_a, system_b]
@@ -585,7 +769,9 @@ async def test_control_revert_does_not_drop_other_system_update() -> None:
 
 
 @pytest.mark.asyncio
-async def test_legit_change_on_unwritten_system_survives() -> None:
+async def test_legit_change_on_unwritten_system_survives(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """A legitimate control change on an unwritten system during the window is not reverted.
 
     Windows are scoped to written systems only, so a real mode change on any other
@@ -593,7 +779,6 @@ async def test_legit_change_on_unwritten_system_survives() -> None:
     ``climate.turn_off`` auto-shutoff writing a different system — flows through
     untouched instead of being reverted to the written system's stale snapshot.
     """
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system_a = build_carrier_system(serial="A", zone_id="1")
     system_b = build_carrier_system(serial="B", zone_id="2")
     coordinator.systems = [system_a, system_b]
@@ -622,7 +807,9 @@ async def test_legit_change_on_unwritten_system_survives() -> None:
 
 
 @pytest.mark.asyncio
-async def test_overlapping_windows_protect_each_written_target() -> None:
+async def test_overlapping_windows_protect_each_written_target(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """A second write to a different target must not drop the first target's protection.
 
     Windows are tracked per written system, so two writes to different systems
@@ -630,7 +817,6 @@ async def test_overlapping_windows_protect_each_written_target() -> None:
     collection regression: a coordinator-wide single window would let the second
     write overwrite the first, silently abandoning the first target's revert guard.
     """
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system_a = build_carrier_system(serial="A", zone_id="1")
     system_b = build_carrier_system(serial="B", zone_id="2")
     coordinator.systems = [system_a, system_b]
@@ -671,9 +857,10 @@ async def test_overlapping_windows_protect_each_written_target() -> None:
 
 
 @pytest.mark.asyncio
-async def test_updated_callback_notifies_when_not_in_window() -> None:
+async def test_updated_callback_notifies_when_not_in_window(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Outside a post-write window, updates publish normally without re-assert."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.systems = [build_carrier_system()]
     coordinator._intercept_guards = {}
 
@@ -690,9 +877,10 @@ async def test_updated_callback_notifies_when_not_in_window() -> None:
 
 
 @pytest.mark.asyncio
-async def test_expired_guard_is_pruned_and_not_reasserted() -> None:
+async def test_expired_guard_is_pruned_and_not_reasserted(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """A guard past its expiry is dropped and no longer re-asserts a revert."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system = build_carrier_system()
     coordinator.systems = [system]
     original_mode = system.config.mode
@@ -722,7 +910,9 @@ async def test_expired_guard_is_pruned_and_not_reasserted() -> None:
 
 
 @pytest.mark.asyncio
-async def test_same_system_zone_guard_expiry_is_independent() -> None:
+async def test_same_system_zone_guard_expiry_is_independent(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """A written zone's guard expires on its own clock, not extended by a sibling write.
 
     Two zones of the SAME system are written a few minutes apart. The first zone's
@@ -731,7 +921,6 @@ async def test_same_system_zone_guard_expiry_is_independent() -> None:
     as if it were a stale replay. This is the per-entry-expiry regression: a shared
     per-system clock would let the sibling write extend the first zone's guard.
     """
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system = build_carrier_system(serial="A", zone_id="1", second_zone_id="2")
     coordinator.systems = [system]
     coordinator._intercept_guards = {}
@@ -779,11 +968,10 @@ async def test_same_system_zone_guard_expiry_is_independent() -> None:
 @pytest.mark.asyncio
 async def test_full_refresh_ends_post_write_window(
     carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
 ) -> None:
     """An authoritative full read ends every post-write guard."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.systems = [build_carrier_system()]
-    _set_coordinator_api_connection(coordinator, carrier_api)
     coordinator.resiliency = ResiliencyState(
         unauthorized_threshold=UNAUTHORIZED_RETRY_THRESHOLD,
         transient_threshold=TRANSIENT_FAILURE_THRESHOLD,
@@ -802,9 +990,10 @@ async def test_full_refresh_ends_post_write_window(
 
 
 @pytest.mark.asyncio
-async def test_failed_write_does_not_begin_intercept() -> None:
+async def test_failed_write_does_not_begin_intercept(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """A failed write must not open a post-write intercept window."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.resiliency = ResiliencyState(
         unauthorized_threshold=UNAUTHORIZED_RETRY_THRESHOLD,
         transient_threshold=TRANSIENT_FAILURE_THRESHOLD,
@@ -819,6 +1008,7 @@ async def test_failed_write_does_not_begin_intercept() -> None:
         self: CarrierDataUpdateCoordinator,
         operation_name: str,
         error: BaseException | None = None,
+        entry_level_serial: str | None = None,
     ) -> None:
         """Swallow the reconcile so the error path can finish."""
         return
@@ -835,11 +1025,10 @@ async def test_failed_write_does_not_begin_intercept() -> None:
 @pytest.mark.asyncio
 async def test_energy_refresh_escalates_after_threshold(
     carrier_api: FakeCarrierApiConnection,
+    coordinator: CarrierDataUpdateCoordinator,
 ) -> None:
     """Raise CarrierUnauthorizedError once the energy-cycle auth threshold is crossed."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.systems = [build_carrier_system()]
-    _set_coordinator_api_connection(coordinator, carrier_api)
     coordinator.resiliency = ResiliencyState(unauthorized_threshold=1, transient_threshold=3)
     coordinator.update_interval = None
 
@@ -858,9 +1047,10 @@ async def test_energy_refresh_escalates_after_threshold(
 
 
 @pytest.mark.asyncio
-async def test_updated_callback_records_timestamp_and_notifies_listeners() -> None:
+async def test_updated_callback_records_timestamp_and_notifies_listeners(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Handle websocket callbacks by timestamping and notifying listeners."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     coordinator.systems = [build_carrier_system()]
     coordinator._intercept_guards = {}
     notified = False
@@ -877,9 +1067,47 @@ async def test_updated_callback_records_timestamp_and_notifies_listeners() -> No
     assert notified is True
 
 
-def test_system_returns_matching_system_or_none() -> None:
+@pytest.mark.asyncio
+async def test_websocket_message_records_stage_costs_lag_and_slow_warning(
+    caplog: pytest.LogCaptureFixture,
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
+    """Time merge, fan-out, and Carrier lag, and warn about slow messages."""
+    coordinator.systems = [build_carrier_system()]
+    coordinator._intercept_guards = {}
+    handled: list[str] = []
+
+    async def message_handler(message: str) -> None:
+        """Record the message carrier_api would merge."""
+        handled.append(message)
+
+    coordinator.websocket_data_updater = SimpleNamespace(message_handler=message_handler)
+    produced_at = (datetime.now(UTC) - timedelta(seconds=2)).isoformat()
+    message = f'{{"messageType": "InfinityStatus", "timestamp": "{produced_at}"}}'
+
+    with (
+        patch.object(coordinator, "async_update_listeners", lambda: None),
+        patch(
+            "custom_components.ha_carrier.carrier_data_update_coordinator."
+            "WEBSOCKET_SLOW_CALLBACK_SECONDS",
+            -1.0,
+        ),
+    ):
+        await coordinator.async_handle_websocket_message(message)
+
+    stages = coordinator.metrics.websocket_stages
+    assert handled == [message]
+    assert set(stages.samples) == {"message_handler", "carrier_lag", "listener_fanout", "total"}
+    assert stages.samples["carrier_lag"][0] == pytest.approx(2, abs=1)
+    assert coordinator.metrics.slow_websocket_messages == 1
+    assert "blocked the event loop" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_system_returns_matching_system_or_none(
+    coordinator: CarrierDataUpdateCoordinator,
+) -> None:
     """Look up tracked systems by Carrier serial."""
-    coordinator = CarrierDataUpdateCoordinator.__new__(CarrierDataUpdateCoordinator)
     system = build_carrier_system(serial="ABC123")
     coordinator.systems = [system]
 
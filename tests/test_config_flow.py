@@ -18,6 +18,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.ha_carrier import config_flow
 from custom_components.ha_carrier.const import (
+    CONF_DIAGNOSTICS_SECTIONS,
     CONF_INFINITE_HOLDS,
     DOMAIN,
     ERROR_AUTH,
@@ -349,6 +350,29 @@ async def test_options_flow_updates_infinite_hold_option(hass: HomeAssistant) ->
     assert result["data"] == {CONF_INFINITE_HOLDS: False}
 
 
+@pytest.mark.asyncio
+async def test_options_flow_stores_diagnostics_sections(hass: HomeAssistant) -> None:
+    """Keep the diagnostics sections chosen in the options flow."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=USERNAME,
+        data={CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD},
+    )
+    config_entry.add_to_hass(hass)
+
+    form = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        form["flow_id"],
+        user_input={CONF_INFINITE_HOLDS: True, CONF_DIAGNOSTICS_SECTIONS: ["raw", "device"]},
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"] == {
+        CONF_INFINITE_HOLDS: True,
+        CONF_DIAGNOSTICS_SECTIONS: ["raw", "device"],
+    }
+
+
 def test_reauth_confirm_returns_unknown_when_validated_identity_is_missing(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -0,0 +1,141 @@
+"""Tests for rate-limited debug snapshots of Carrier system state."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.ha_carrier.debug_snapshots import (
+    DebugSnapshotLogger,
+    changed_fields,
+    flatten_mapping,
+    redact_paths,
+)
+from custom_components.ha_carrier.redaction import REDACTED
+
+from .conftest import FakeCarrierApiConnection, build_carrier_system
+
+LOGGER_NAME = "custom_components.ha_carrier.test_debug_snapshots"
+
+
+def _messages(caplog: pytest.LogCaptureFixture) -> list[str]:
+    """Return the messages the snapshot logger under test wrote."""
+    return [record.getMessage() for record in caplog.records if record.name == LOGGER_NAME]
+
+
+def test_changed_fields_compares_flattened_paths() -> None:
+    """Report changed, added, and removed leaves by dotted path."""
+    previous = flatten_mapping({"status": {"zones": [{"rt": 70, "rh": 40}], "mode": "off"}})
+    current = flatten_mapping({"status": {"zones": [{"rt": 71, "rh": 40}], "oat": 30}})
+
+    assert changed_fields(previous, current) == {
+        "status.zones.0.rt": 71,
+        "status.oat": 30,
+        "status.mode": None,
+    }
+
+
+def test_flatten_mapping_keeps_depth_first_order() -> None:
+    """List leaves in the order they appear, however deep they are nested."""
+    flat = flatten_mapping({"a": {"b": [1, {"c": 2}], "d": 3}, "e": [], "f": None})
+
+    assert list(flat.items()) == [("a.b.0", 1), ("a.b.1.c", 2), ("a.d", 3), ("f", None)]
+
+
+def test_redact_paths_hides_values_under_redacted_keys() -> None:
+    """Redact any path that passes through a redacted key."""
+    fields = {"serial": "ABC123", "profile.indoor_serial": "IDU1", "name": "Home"}
+
+    assert redact_paths(fields, {"serial", "indoor_serial"}) == {
+        "serial": REDACTED,
+        "profile.indoor_serial": REDACTED,
+        "name": "Home",
+    }
+
+
+@pytest.mark.asyncio
+async def test_snapshot_then_diffs_until_interval_elapses(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Log one redacted snapshot, then only changed fields, then a snapshot again."""
+    caplog.set_level(logging.DEBUG, logger=LOGGER_NAME)
+    snapshots = DebugSnapshotLogger(logging.getLogger(LOGGER_NAME), interval=3600)
+
+    snapshots.async_log(hass, [build_carrier_system()])
+    await hass.async_block_till_done()
+    snapshots.async_log(hass, [build_carrier_system(zone_name="Kitchen")])
+    await hass.async_block_till_done()
+
+    messages = _messages(caplog)
+    assert len(messages) == 2
+    assert messages[0].startswith("system Home snapshot:")
+    assert "ABC123" not in messages[0]
+    assert REDACTED in messages[0]
+    assert messages[1].startswith("system Home changed:")
+    assert "'Kitchen'" in messages[1]
+
+    caplog.clear()
+    snapshots.interval = 0
+    snapshots.async_log(hass, [build_carrier_system(zone_name="Kitchen")])
+    await hass.async_block_till_done()
+
+    assert [message.split(":")[0] for message in _messages(caplog)] == ["system Home snapshot"]
+
+
+@pytest.mark.asyncio
+async def test_snapshots_do_nothing_without_debug_logging(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Skip mapping and diffing entirely when debug logging is off."""
+    caplog.set_level(logging.INFO, logger=LOGGER_NAME)
+    snapshots = DebugSnapshotLogger(logging.getLogger(LOGGER_NAME))
+
+    snapshots.async_log(hass, [build_carrier_system()])
+    await hass.async_block_till_done()
+
+    assert not _messages(caplog)
+    assert snapshots._previous == {}
+
+
+@pytest.mark.asyncio
+async def test_websocket_message_logs_only_the_system_it_names(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+    carrier_api: FakeCarrierApiConnection,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Diff only the system in the message's deviceId, not every system."""
+    carrier_api.systems = [
+        build_carrier_system(serial="ABC123", name="Home"),
+        build_carrier_system(serial="DEF456", name="Cabin"),
+    ]
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+    coordinator.debug_snapshots.logger = logging.getLogger(LOGGER_NAME)
+    caplog.set_level(logging.DEBUG, logger=LOGGER_NAME)
+    coordinator.debug_snapshots.async_log(hass, coordinator.systems)
+    await hass.async_block_till_done()
+    caplog.clear()
+
+    await coordinator.async_handle_websocket_message(
+        json.dumps(
+            {
+                "messageType": "InfinityStatus",
+                "deviceId": "DEF456",
+                "zones": [{"id": "1", "rt": 64.0}],
+            }
+        )
+    )
+    await hass.async_block_till_done()
+
+    messages = _messages(caplog)
+    assert len(messages) == 1
+    assert messages[0].startswith("system Cabin changed:")
+    assert "64.0" in messages[0]
@@ -9,6 +9,8 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 import pytest
 
+from custom_components.ha_carrier import diagnostics as diagnostics_module
+from custom_components.ha_carrier.const import CONF_DIAGNOSTICS_SECTIONS
 from custom_components.ha_carrier.diagnostics import async_get_config_entry_diagnostics
 
 
@@ -37,3 +39,59 @@ async def test_diagnostics_redacts_config_entry_and_includes_device_entities(
         == "home"
     )
     assert diagnostics["ABC123"]["device"]["entities"]
+    assert diagnostics["resiliency"]["breaker_state"] == "closed"
+    assert diagnostics["resiliency"]["retry_budget"]["denied"] == 0
+    assert diagnostics["api_metrics"]["operations"]["full data refresh"]["calls"] == 1
+    assert diagnostics["api_metrics"]["refreshes"]["full data refresh"]["errors"] == {}
+    assert diagnostics["diagnostics"]["sections"] == ["mapped_data", "raw", "device"]
+    assert diagnostics["diagnostics"]["omitted_for_size"] == []
+    assert diagnostics["diagnostics"]["generation_seconds"] >= 0
+    assert any(entry["label"] == "full data refresh" for entry in diagnostics["journal"]["entries"])
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_use_a_snapshot_of_the_raw_payloads(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Return raw payloads that do not share state with the live systems."""
+    config_entry = await setup_integration()
+    carrier_system = config_entry.runtime_data.systems[0]
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    carrier_system.status.raw["zones"][0]["rt"] = "changed after download"
+
+    status_raw = diagnostics["ABC123"]["status_raw"]
+    assert status_raw["zones"][0]["rt"] != "changed after download"
+    assert diagnostics["ABC123"]["profile_raw"]["serial"] == "**REDACTED**"
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_include_only_selected_sections(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Leave out the per-system sections the options deselect."""
+    config_entry = await setup_integration(options={CONF_DIAGNOSTICS_SECTIONS: ["raw"]})
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert set(diagnostics["ABC123"]) == {"profile_raw", "status_raw", "config_raw", "energy_raw"}
+    assert diagnostics["diagnostics"]["sections"] == ["raw"]
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_replace_sections_over_the_size_cap(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Replace an oversized section with a note giving its size."""
+    config_entry = await setup_integration()
+    monkeypatch.setattr(diagnostics_module, "DIAGNOSTICS_MAX_SECTION_BYTES", 1024)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert diagnostics["ABC123"]["mapped_data"]["size_bytes"] > 1024
+    assert "ABC123.mapped_data" in diagnostics["diagnostics"]["omitted_for_size"]
+    assert diagnostics["diagnostics"]["max_section_bytes"] == 1024
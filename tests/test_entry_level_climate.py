@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
+from datetime import timedelta
 from typing import Any
 
+from carrier_api import CarrierApiGraphqlError
 from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN, HVACMode
 from homeassistant.components.climate.const import SERVICE_SET_HVAC_MODE, SERVICE_SET_TEMPERATURE
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
 from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.ha_carrier.const import (
+    ENTRY_LEVEL_ACTIVE_POLL_SECONDS,
+    ENTRY_LEVEL_CONFIRM_READ_DELAY_SECONDS,
+    ENTRY_LEVEL_IDLE_POLL_SECONDS,
+    ENTRY_LEVEL_POST_WRITE_POLL_SECONDS,
+)
 
 from .conftest import FakeCarrierApiConnection, build_entry_level_system, entity_id_for_unique_id
 
@@ -87,3 +100,222 @@ async def test_entry_level_set_hvac_mode(
     name, payload = carrier_api.calls[-1]
     assert name == "update_entry_level_zone"
     assert payload["mode"] == "heat"
+
+
+@pytest.mark.asyncio
+async def test_entry_level_fast_poll_after_write_skips_infinity_payload(
+    hass: HomeAssistant,
+    carrier_api: FakeCarrierApiConnection,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Poll only entry-level data on the fast cadence after a write."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    carrier_api.entry_level_systems = [build_entry_level_system()]
+    await setup_integration()
+    entity_id = entity_id_for_unique_id(hass, CLIMATE_DOMAIN, ENTITY_UNIQUE_ID)
+
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_HVAC_MODE,
+        {ATTR_ENTITY_ID: entity_id, "hvac_mode": HVACMode.HEAT},
+        blocking=True,
+    )
+    carrier_api.entry_level_systems = [build_entry_level_system(mode="off")]
+    carrier_api.calls.clear()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=ENTRY_LEVEL_POST_WRITE_POLL_SECONDS + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert [call[0] for call in carrier_api.calls] == ["load_entry_level_data"]
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == HVACMode.OFF
+
+
+@pytest.mark.asyncio
+async def test_entry_level_poll_cadence_follows_activity(
+    hass: HomeAssistant,
+    carrier_api: FakeCarrierApiConnection,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Poll faster while a zone is conditioning and slower when idle."""
+    carrier_api.entry_level_systems = [build_entry_level_system()]
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+
+    assert coordinator._entry_level_poll_delay() == ENTRY_LEVEL_IDLE_POLL_SECONDS
+
+    coordinator.entry_level_systems = [build_entry_level_system(stage_status="Cooling")]
+    assert coordinator._entry_level_poll_delay() == ENTRY_LEVEL_ACTIVE_POLL_SECONDS
+
+    coordinator.begin_entry_level_fast_poll()
+    assert coordinator._entry_level_poll_delay() == ENTRY_LEVEL_POST_WRITE_POLL_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_entry_level_confirm_read_corrects_clamped_set_point(
+    hass: HomeAssistant,
+    carrier_api: FakeCarrierApiConnection,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Replace the optimistic set point with the value Carrier actually kept."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    carrier_api.entry_level_systems = [build_entry_level_system()]
+    await setup_integration()
+    entity_id = entity_id_for_unique_id(hass, CLIMATE_DOMAIN, ENTITY_UNIQUE_ID)
+
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_TEMPERATURE,
+        {ATTR_ENTITY_ID: entity_id, ATTR_TEMPERATURE: 55},
+        blocking=True,
+    )
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.attributes["temperature"] == 55
+
+    # Carrier rejected the out-of-range set point and still reports 78.
+    carrier_api.entry_level_systems = [build_entry_level_system()]
+    carrier_api.calls.clear()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=ENTRY_LEVEL_CONFIRM_READ_DELAY_SECONDS + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert [call[0] for call in carrier_api.calls] == ["load_entry_level_data"]
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.attributes["temperature"] == 78
+
+
+@pytest.mark.asyncio
+async def test_entry_level_poll_in_flight_during_write_keeps_optimistic_state(
+    hass: HomeAssistant,
+    carrier_api: FakeCarrierApiConnection,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Drop a poll result read before the write instead of reverting the entity."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    carrier_api.entry_level_systems = [build_entry_level_system()]
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+    entity_id = entity_id_for_unique_id(hass, CLIMATE_DOMAIN, ENTITY_UNIQUE_ID)
+    poll_started = asyncio.Event()
+    release_poll = asyncio.Event()
+    original_load_entry_level_data = carrier_api.load_entry_level_data
+
+    async def load_entry_level_data() -> list[Any]:
+        """Read the pre-write state, then answer only after the write lands."""
+        poll_started.set()
+        await release_poll.wait()
+        return [build_entry_level_system()]
+
+    object.__setattr__(carrier_api, "load_entry_level_data", load_entry_level_data)
+    poll = hass.async_create_task(coordinator.async_refresh_entry_level_systems())
+    await poll_started.wait()
+    object.__setattr__(carrier_api, "load_entry_level_data", original_load_entry_level_data)
+
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_HVAC_MODE,
+        {ATTR_ENTITY_ID: entity_id, "hvac_mode": HVACMode.HEAT},
+        blocking=True,
+    )
+    release_poll.set()
+    await poll
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == HVACMode.HEAT
+
+
+@pytest.mark.asyncio
+async def test_entry_level_failed_write_reconciles_only_entry_level_system(
+    hass: HomeAssistant,
+    carrier_api: FakeCarrierApiConnection,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Reconcile a rejected entry-level write without an account-wide refresh."""
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    carrier_api.entry_level_systems = [build_entry_level_system()]
+    await setup_integration()
+    entity_id = entity_id_for_unique_id(hass, CLIMATE_DOMAIN, ENTITY_UNIQUE_ID)
+    carrier_api.update_entry_level_zone_error = CarrierApiGraphqlError("rejected")
+    carrier_api.calls.clear()
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            CLIMATE_DOMAIN,
+            SERVICE_SET_HVAC_MODE,
+            {ATTR_ENTITY_ID: entity_id, "hvac_mode": HVACMode.HEAT},
+            blocking=True,
+        )
+    await hass.async_block_till_done()
+
+    assert [call[0] for call in carrier_api.calls] == [
+        "update_entry_level_zone",
+        "load_entry_level_data",
+    ]
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == HVACMode.COOL
+
+
+@pytest.mark.asyncio
+async def test_entry_level_poll_reschedules_after_a_failed_refresh(
+    carrier_api: FakeCarrierApiConnection,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Keep the lane alive when one poll raises instead of returning."""
+    carrier_api.entry_level_systems = [build_entry_level_system()]
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+    carrier_api.load_entry_level_data_error = RuntimeError("unexpected payload")
+
+    with pytest.raises(RuntimeError):
+        await coordinator._async_entry_level_poll(dt_util.utcnow())
+
+    assert coordinator._entry_level_unsub is not None
+
+
+@pytest.mark.asyncio
+async def test_entry_level_lane_starts_when_a_full_refresh_finds_systems(
+    hass: HomeAssistant,
+    carrier_api: FakeCarrierApiConnection,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Start polling once entry-level systems first appear on the account."""
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+    assert coordinator._entry_level_unsub is None
+
+    carrier_api.entry_level_systems = [build_entry_level_system()]
+    await coordinator._async_full_refresh()
+    carrier_api.calls.clear()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=ENTRY_LEVEL_IDLE_POLL_SECONDS + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert ("load_entry_level_data", {}) in carrier_api.calls
+
+
+@pytest.mark.asyncio
+async def test_entry_level_poll_notifies_only_entry_level_entities(
+    carrier_api: FakeCarrierApiConnection,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Leave Infinity entities alone when only entry-level data changed."""
+    carrier_api.entry_level_systems = [build_entry_level_system()]
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+    notified: list[str] = []
+    coordinator.async_add_listener(lambda: notified.append("infinity"), "ABC123")
+    coordinator.async_add_listener(lambda: notified.append("entry-level"), "EL123")
+
+    assert await coordinator.async_refresh_entry_level_systems()
+
+    assert notified == ["entry-level"]
@@ -36,7 +36,7 @@ async def test_setup_entry_loads_platforms_and_unload_cancels_websocket(
     carrier_api: FakeCarrierApiConnection,
     setup_integration: Callable[..., Any],
 ) -> None:
-    """Set up the config entry through HA and unload the websocket task cleanly."""
+    """Set up the config entry through HA, then cancel the websocket and close the session."""
     config_entry = await setup_integration()
 
     assert config_entry.state is ConfigEntryState.LOADED
@@ -50,6 +50,7 @@ async def test_setup_entry_loads_platforms_and_unload_cancels_websocket(
 
     assert config_entry.state is ConfigEntryState.NOT_LOADED
     assert coordinator.websocket_task is None
+    assert carrier_api.cleanup_calls == 1
 
 
 @pytest.mark.asyncio
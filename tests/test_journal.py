@@ -0,0 +1,84 @@
+"""Tests for the bounded journal of websocket messages and refresh outcomes."""
+
+from __future__ import annotations
+
+import json
+
+from carrier_api import CarrierApiConnectionError
+
+from custom_components.ha_carrier.const import JOURNAL_MAX_ENTRY_CHARS
+from custom_components.ha_carrier.journal import (
+    JOURNAL_KIND_REFRESH,
+    JOURNAL_KIND_WEBSOCKET,
+    MessageJournal,
+)
+from custom_components.ha_carrier.redaction import REDACTED
+
+
+def test_record_message_keeps_a_redacted_summary() -> None:
+    """Summarize the fields a message sets, without identifiers."""
+    journal = MessageJournal()
+
+    journal.record_message(
+        {
+            "messageType": "InfinityStatus",
+            "deviceId": "ABC123",
+            "zones": [{"id": "1", "rt": 71.0}],
+            "idu": {"serial": "IDU1"},
+        }
+    )
+    journal.record_message(None)
+
+    first, second = journal.as_dict()["entries"]
+    assert first["kind"] == JOURNAL_KIND_WEBSOCKET
+    assert first["label"] == "InfinityStatus"
+    assert first["detail"] == f"zones.0.id='1', zones.0.rt=71.0, idu.serial='{REDACTED}'"
+    assert "ABC123" not in json.dumps(journal.as_dict())
+    assert second["detail"] == "not a JSON object"
+
+
+def test_record_refresh_keeps_outcome_and_duration() -> None:
+    """Journal successful and failed refreshes."""
+    journal = MessageJournal()
+
+    journal.record_refresh("full data refresh", 0.25)
+    journal.record_refresh("energy refresh", 1.5, CarrierApiConnectionError("down"))
+
+    assert [
+        (entry["kind"], entry["label"], entry["detail"]) for entry in journal.as_dict()["entries"]
+    ] == [
+        (JOURNAL_KIND_REFRESH, "full data refresh", "ok in 0.250s"),
+        (JOURNAL_KIND_REFRESH, "energy refresh", "failed: CarrierApiConnectionError in 1.500s"),
+    ]
+
+
+def test_journal_stays_within_entry_and_size_caps() -> None:
+    """Drop the oldest entries past either cap and shorten long summaries."""
+    journal = MessageJournal(max_entries=3)
+    for temperature in range(5):
+        journal.record_message({"messageType": "InfinityStatus", "oat": temperature})
+
+    snapshot = journal.as_dict()
+    assert [entry["detail"] for entry in snapshot["entries"]] == ["oat=2", "oat=3", "oat=4"]
+    assert snapshot["dropped"] == 2
+
+    journal = MessageJournal(max_bytes=2 * JOURNAL_MAX_ENTRY_CHARS)
+    for _ in range(5):
+        journal.record_message({"messageType": "InfinityConfig", "name": "x" * 5000})
+
+    snapshot = journal.as_dict()
+    assert len(snapshot["entries"][0]["detail"]) == JOURNAL_MAX_ENTRY_CHARS
+    assert snapshot["size_bytes"] <= 2 * JOURNAL_MAX_ENTRY_CHARS
+    assert snapshot["dropped"] == 5 - len(snapshot["entries"])
+
+
+def test_journal_size_counts_utf8_bytes() -> None:
+    """Measure stored text in encoded bytes, not characters."""
+    journal = MessageJournal()
+
+    journal.record_message({"messageType": "InfinityConfig", "name": "Séjour"})
+
+    (entry,) = journal.as_dict()["entries"]
+    expected = len(entry["label"].encode()) + len(entry["detail"].encode())
+    assert journal.as_dict()["size_bytes"] == expected
+    assert expected > len(entry["label"]) + len(entry["detail"])
@@ -0,0 +1,81 @@
+"""Tests for Carrier API call and latency instrumentation."""
+
+from __future__ import annotations
+
+import logging
+
+from carrier_api import CarrierApiConnectionError
+import pytest
+
+from custom_components.ha_carrier.metrics import ApiMetrics, LatencyTracker
+from custom_components.ha_carrier.resiliency import (
+    ResiliencyState,
+    RetryPolicy,
+    async_call_with_retry,
+)
+
+
+def test_latency_summary_uses_nearest_rank_percentiles() -> None:
+    """Summarize samples without interpolating between them."""
+    tracker = LatencyTracker()
+    for value in range(1, 21):
+        tracker.record("load", float(value))
+
+    assert tracker.summary("load") == {"p50": 10.0, "p95": 19.0, "max": 20.0}
+    assert tracker.summary("missing") == {"p50": None, "p95": None, "max": None}
+
+
+@pytest.mark.asyncio
+async def test_retry_helper_records_calls_attempts_retries_and_errors() -> None:
+    """Count one logical call, both attempts, the retry, and the failure class."""
+    state = ResiliencyState(unauthorized_threshold=3, transient_threshold=3)
+    metrics = ApiMetrics(state.latency)
+    attempts = 0
+
+    async def operation() -> str:
+        """Fail once, then succeed."""
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise CarrierApiConnectionError("boom")
+        return "ok"
+
+    result = await async_call_with_retry(
+        operation,
+        policy=RetryPolicy(
+            name="test",
+            max_attempts=2,
+            base_delay=0,
+            max_delay=0,
+            jitter_fraction=0,
+            retry_on_unauthorized=False,
+        ),
+        state=state,
+        operation_name="test operation",
+        logger=logging.getLogger(__name__),
+        metrics=metrics,
+    )
+
+    assert result == "ok"
+    stats = metrics.operations["test operation"]
+    assert (stats.calls, stats.attempts, stats.retries) == (1, 2, 1)
+    assert stats.errors == {"CarrierApiConnectionError": 1}
+    assert metrics.calls_last_hour == 2
+    assert metrics.errors_last_hour == 1
+    assert metrics.latency_p95() == state.latency.percentile("test operation", 0.95)
+    assert metrics.as_dict()["operations"]["test operation"]["latency"]["max"] is not None
+
+
+def test_websocket_messages_and_refreshes_show_up_in_diagnostics_snapshot() -> None:
+    """Expose websocket counts and refresh cycles in the diagnostics dict."""
+    metrics = ApiMetrics()
+    metrics.record_websocket_message()
+    metrics.record_refresh("energy refresh", 0.5, CarrierApiConnectionError("boom"))
+
+    snapshot = metrics.as_dict()
+
+    assert snapshot["websocket_messages"] == 1
+    assert snapshot["websocket_messages_last_hour"] == 1
+    assert snapshot["refreshes"]["energy refresh"]["calls"] == 1
+    assert snapshot["refreshes"]["energy refresh"]["errors"] == {"CarrierApiConnectionError": 1}
+    assert snapshot["refreshes"]["energy refresh"]["latency"]["max"] == 0.5
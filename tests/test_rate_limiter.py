@@ -0,0 +1,104 @@
+"""Workflow tests for per-account Carrier API rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from aiohttp import ClientResponseError, RequestInfo
+from carrier_api import CarrierApiConnectionError
+from multidict import CIMultiDict, CIMultiDictProxy
+import pytest
+from yarl import URL
+
+from custom_components.ha_carrier.rate_limiter import ApiCallKind, CarrierRateLimiter, TokenBucket
+from custom_components.ha_carrier.resiliency import (
+    ResiliencyState,
+    RetryPolicy,
+    async_call_with_retry,
+)
+
+
+def _limiter(rate: float = 20.0, burst: int = 1) -> CarrierRateLimiter:
+    """Return a limiter with small, fast-refilling buckets."""
+    return CarrierRateLimiter(
+        read_bucket=TokenBucket(rate=rate, capacity=burst),
+        write_bucket=TokenBucket(rate=rate, capacity=burst),
+    )
+
+
+def test_token_bucket_allows_burst_then_reports_wait() -> None:
+    """Spend the burst immediately and report the refill delay afterwards."""
+    bucket = TokenBucket(rate=2.0, capacity=2)
+    now = time.monotonic()
+
+    assert bucket.try_take(now) == 0
+    assert bucket.try_take(now) == 0
+    assert bucket.try_take(now) == pytest.approx(0.5)
+    assert bucket.try_take(now + 0.5) == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_write_goes_before_queued_read() -> None:
+    """Let a user write overtake a background read waiting on the same account."""
+    limiter = _limiter()
+    await limiter.async_acquire(ApiCallKind.READ)
+    await limiter.async_acquire(ApiCallKind.WRITE)
+    order: list[str] = []
+
+    async def acquire(kind: ApiCallKind) -> None:
+        """Record when a call of ``kind`` is allowed out."""
+        await limiter.async_acquire(kind)
+        order.append(kind)
+
+    read = asyncio.create_task(acquire(ApiCallKind.READ))
+    await asyncio.sleep(0)
+    write = asyncio.create_task(acquire(ApiCallKind.WRITE))
+    await asyncio.gather(read, write)
+
+    assert order == [ApiCallKind.WRITE, ApiCallKind.READ]
+
+
+@pytest.mark.asyncio
+async def test_retry_helper_honors_carrier_retry_after() -> None:
+    """Pause the account's calls for Carrier's Retry-After before retrying."""
+    limiter = _limiter(rate=1000.0, burst=10)
+    attempts: list[float] = []
+
+    async def operation() -> str:
+        """Throttle the first attempt, then succeed."""
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            error = CarrierApiConnectionError("throttled")
+            error.__cause__ = ClientResponseError(
+                RequestInfo(
+                    url=URL("https://example.invalid"),
+                    method="POST",
+                    headers=CIMultiDictProxy(CIMultiDict()),
+                ),
+                (),
+                status=429,
+                headers=CIMultiDictProxy(CIMultiDict({"Retry-After": "0.2"})),
+            )
+            raise error
+        return "ok"
+
+    result = await async_call_with_retry(
+        operation,
+        policy=RetryPolicy(
+            name="test",
+            max_attempts=2,
+            base_delay=0,
+            max_delay=0,
+            jitter_fraction=0,
+            retry_on_unauthorized=False,
+        ),
+        state=ResiliencyState(unauthorized_threshold=3, transient_threshold=3),
+        operation_name="test operation",
+        logger=logging.getLogger(__name__),
+        rate_limiter=limiter,
+    )
+
+    assert result == "ok"
+    assert attempts[1] - attempts[0] >= 0.15
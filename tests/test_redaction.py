@@ -0,0 +1,68 @@
+"""Tests for copy-on-write redaction of nested Carrier payloads."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+from homeassistant.components.diagnostics import async_redact_data as ha_redact_data
+
+from custom_components.ha_carrier.const import TO_REDACT_RAW
+from custom_components.ha_carrier.redaction import REDACTED, Redactor, compile_redactor
+
+from .conftest import build_carrier_system
+
+
+def test_redact_copies_only_paths_to_redacted_keys() -> None:
+    """Share subtrees without redacted keys and leave the input untouched."""
+    payload = {
+        "profile": {"serial": "ABC123", "name": "Home"},
+        "zones": [{"id": "1", "rt": 70}, {"id": "2", "pin": "1234"}],
+        "oat": {"value": 30},
+    }
+    original = deepcopy(payload)
+
+    redacted = Redactor({"serial", "pin"}).redact(payload)
+
+    assert redacted == {
+        "profile": {"serial": REDACTED, "name": "Home"},
+        "zones": [{"id": "1", "rt": 70}, {"id": "2", "pin": REDACTED}],
+        "oat": {"value": 30},
+    }
+    assert payload == original
+    assert redacted is not payload
+    assert redacted["profile"] is not payload["profile"]
+    assert redacted["zones"] is not payload["zones"]
+    assert redacted["zones"][0] is payload["zones"][0]
+    assert redacted["oat"] is payload["oat"]
+
+
+def test_redact_returns_input_when_nothing_is_redacted() -> None:
+    """Return the very same object, keeping None and empty values under redacted keys."""
+    payload = {"serial": None, "pin": "", "zones": [{"id": "1"}], "empty": {}}
+
+    assert Redactor({"serial", "pin"}).redact(payload) is payload
+    assert Redactor(()).redact(payload) is payload
+    assert Redactor({"serial"}).redact("ABC123") == "ABC123"
+
+
+def test_redact_handles_payloads_deeper_than_the_recursion_limit() -> None:
+    """Walk deep nesting without recursion."""
+    payload: dict[str, object] = {"serial": "ABC123"}
+    for _ in range(5000):
+        payload = {"child": [payload]}
+
+    redacted = Redactor({"serial"}).redact(payload)
+
+    for _ in range(5000):
+        redacted = redacted["child"][0]
+    assert redacted == {"serial": REDACTED}
+
+
+def test_redact_matches_home_assistant_on_carrier_payloads() -> None:
+    """Produce the same output as Home Assistant's redactor for raw Carrier data."""
+    system = build_carrier_system(second_zone_id="2")
+    redactor = compile_redactor(frozenset(TO_REDACT_RAW))
+
+    assert compile_redactor(frozenset(TO_REDACT_RAW)) is redactor
+    for payload in (system.profile.raw, system.status.raw, system.config.raw, system.energy.raw):
+        assert redactor.redact(payload) == ha_redact_data(payload, TO_REDACT_RAW)
@@ -0,0 +1,78 @@
+"""Workflow tests for per-account Carrier request scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.ha_carrier.request_scheduler import CarrierRequestScheduler, RequestPriority
+
+
+@pytest.mark.asyncio
+async def test_reserved_slot_lets_write_start_while_background_is_saturated() -> None:
+    """Start an interactive write even when background calls fill their lane."""
+    scheduler = CarrierRequestScheduler(max_concurrent=2, reserved_interactive=1)
+    await scheduler.async_acquire(RequestPriority.BACKGROUND)
+
+    background = asyncio.create_task(scheduler.async_acquire(RequestPriority.BACKGROUND))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(scheduler.async_acquire(RequestPriority.INTERACTIVE), timeout=1)
+
+    assert scheduler.active == 2
+    assert not background.done()
+
+    background.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await background
+
+
+@pytest.mark.asyncio
+async def test_queued_calls_start_in_priority_order() -> None:
+    """Hand freed slots to writes, then confirm-reads, then background refreshes."""
+    scheduler = CarrierRequestScheduler(max_concurrent=1, reserved_interactive=0)
+    await scheduler.async_acquire(RequestPriority.BACKGROUND)
+    order: list[RequestPriority] = []
+
+    async def run(priority: RequestPriority) -> None:
+        """Record when ``priority`` gets a slot, then give it back."""
+        await scheduler.async_acquire(priority)
+        order.append(priority)
+        scheduler.release()
+
+    tasks = [
+        asyncio.create_task(run(priority))
+        for priority in (
+            RequestPriority.BACKGROUND,
+            RequestPriority.CONFIRM,
+            RequestPriority.INTERACTIVE,
+        )
+    ]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == [
+        RequestPriority.INTERACTIVE,
+        RequestPriority.CONFIRM,
+        RequestPriority.BACKGROUND,
+    ]
+    assert scheduler.active == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_hold_a_slot() -> None:
+    """Drop a cancelled waiter so the next call can use the freed slot."""
+    scheduler = CarrierRequestScheduler(max_concurrent=1, reserved_interactive=0)
+    await scheduler.async_acquire(RequestPriority.BACKGROUND)
+    waiter = asyncio.create_task(scheduler.async_acquire(RequestPriority.INTERACTIVE))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    scheduler.release()
+
+    await asyncio.wait_for(scheduler.async_acquire(RequestPriority.BACKGROUND), timeout=1)
+    assert scheduler.active == 1
+    assert scheduler.waiting == 0
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import logging
 
-from carrier_api import CarrierApiAuthError, CarrierApiConnectionError
+from carrier_api import CarrierApiAuthError, CarrierApiConnectionError, CarrierApiGraphqlError
 import pytest
 
-from custom_components.ha_carrier.exceptions import CarrierUnauthorizedError
+from custom_components.ha_carrier import resiliency
+from custom_components.ha_carrier.const import (
+    ATTEMPT_TIMEOUT_DEFAULT_SECONDS,
+    ATTEMPT_TIMEOUT_MIN_SECONDS,
+    LATENCY_MIN_SAMPLES,
+)
+from custom_components.ha_carrier.exceptions import (
+    CarrierCircuitOpenError,
+    CarrierUnauthorizedError,
+)
 from custom_components.ha_carrier.resiliency import (
+    BreakerState,
+    LatencyTracker,
     ResiliencyState,
+    RetryBudget,
     RetryPolicy,
     async_call_with_retry,
     compute_backoff_delay,
@@ -97,3 +111,330 @@ def test_compute_backoff_delay_caps_exponential_delay(attempt: int, expected: fl
     )
 
     assert compute_backoff_delay(policy, attempt) == expected
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_after_escalation_and_blocks_calls(
+    retry_policy: RetryPolicy,
+) -> None:
+    """Stop calling Carrier once transient failures escalate."""
+    state = ResiliencyState(unauthorized_threshold=3, transient_threshold=2)
+    calls = 0
+
+    async def operation() -> None:
+        """Always fail with a transient transport error."""
+        nonlocal calls
+        calls += 1
+        raise CarrierApiConnectionError("down")
+
+    with pytest.raises(CarrierApiConnectionError):
+        await async_call_with_retry(
+            operation,
+            policy=retry_policy,
+            state=state,
+            operation_name="test operation",
+            logger=logging.getLogger(__name__),
+        )
+
+    assert state.breaker_state is BreakerState.OPEN
+    assert calls == 2
+
+    with pytest.raises(CarrierCircuitOpenError):
+        await async_call_with_retry(
+            operation,
+            policy=retry_policy,
+            state=state,
+            operation_name="test operation",
+            logger=logging.getLogger(__name__),
+        )
+
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_half_open_allows_one_probe_and_closes_on_success(
+    retry_policy: RetryPolicy,
+) -> None:
+    """Hand out a single half-open probe and close the breaker when it succeeds."""
+    state = ResiliencyState(unauthorized_threshold=3, transient_threshold=2, breaker_open_seconds=0)
+    state.trip_breaker(logging.getLogger(__name__))
+
+    assert state.breaker_allows_request() is True
+    assert state.breaker_state is BreakerState.HALF_OPEN
+    assert state.breaker_allows_request() is False
+
+    state.release_probe()
+
+    async def operation() -> str:
+        """Succeed as the half-open probe."""
+        return "ok"
+
+    result = await async_call_with_retry(
+        operation,
+        policy=retry_policy,
+        state=state,
+        operation_name="test operation",
+        logger=logging.getLogger(__name__),
+    )
+
+    assert result == "ok"
+    assert state.breaker_state is BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_hands_back_a_cancelled_half_open_probe(
+    retry_policy: RetryPolicy,
+) -> None:
+    """Let the next caller probe after the first probe is cancelled mid-request."""
+    state = ResiliencyState(unauthorized_threshold=3, transient_threshold=2, breaker_open_seconds=0)
+    state.trip_breaker(logging.getLogger(__name__))
+    probe_started = asyncio.Event()
+
+    async def hung_probe() -> None:
+        """Hang as the half-open probe until cancelled."""
+        probe_started.set()
+        await asyncio.Event().wait()
+
+    probe = asyncio.create_task(
+        async_call_with_retry(
+            hung_probe,
+            policy=retry_policy,
+            state=state,
+            operation_name="test operation",
+            logger=logging.getLogger(__name__),
+        )
+    )
+    await probe_started.wait()
+    assert state.breaker_probe_in_flight
+
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert state.breaker_state is BreakerState.HALF_OPEN
+    assert not state.breaker_probe_in_flight
+
+    async def operation() -> str:
+        """Succeed as the next half-open probe."""
+        return "ok"
+
+    result = await async_call_with_retry(
+        operation,
+        policy=retry_policy,
+        state=state,
+        operation_name="test operation",
+        logger=logging.getLogger(__name__),
+    )
+
+    assert result == "ok"
+    assert state.breaker_state is BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_reopens_when_half_open_probe_fails(
+    retry_policy: RetryPolicy,
+) -> None:
+    """Re-open the breaker when the half-open probe hits another transport failure."""
+    state = ResiliencyState(unauthorized_threshold=3, transient_threshold=5, breaker_open_seconds=0)
+    state.trip_breaker(logging.getLogger(__name__))
+
+    async def operation() -> None:
+        """Fail the probe with a transient transport error."""
+        raise CarrierApiConnectionError("still down")
+
+    with pytest.raises(CarrierApiConnectionError):
+        await async_call_with_retry(
+            operation,
+            policy=retry_policy,
+            state=state,
+            operation_name="test operation",
+            logger=logging.getLogger(__name__),
+        )
+
+    assert state.breaker_state is BreakerState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_closes_when_carrier_answers_with_an_error(
+    retry_policy: RetryPolicy,
+) -> None:
+    """Treat a non-transient Carrier response as proof the service is reachable."""
+    state = ResiliencyState(unauthorized_threshold=3, transient_threshold=2, breaker_open_seconds=0)
+    state.trip_breaker(logging.getLogger(__name__))
+
+    async def operation() -> None:
+        """Reject the probe with a GraphQL error."""
+        raise CarrierApiGraphqlError("rejected")
+
+    with pytest.raises(CarrierApiGraphqlError):
+        await async_call_with_retry(
+            operation,
+            policy=retry_policy,
+            state=state,
+            operation_name="test operation",
+            logger=logging.getLogger(__name__),
+        )
+
+    assert state.breaker_state is BreakerState.CLOSED
+
+
+def test_latency_tracker_derives_attempt_timeout_from_recent_p95() -> None:
+    """Size attempt timeouts from recent latency once enough samples exist."""
+    tracker = LatencyTracker()
+
+    assert tracker.attempt_timeout("full data refresh") == ATTEMPT_TIMEOUT_DEFAULT_SECONDS
+
+    for _ in range(LATENCY_MIN_SAMPLES):
+        tracker.record("full data refresh", 5.0)
+        tracker.record("set mode", 0.5)
+
+    assert tracker.attempt_timeout("full data refresh") == 15.0
+    assert tracker.attempt_timeout("set mode") == ATTEMPT_TIMEOUT_MIN_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_attempt_timeout_widens_when_carrier_slows_after_fast_samples(
+    retry_policy: RetryPolicy,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Count timed-out attempts at their limit so a slowdown recovers."""
+    monkeypatch.setattr(resiliency, "ATTEMPT_TIMEOUT_MIN_SECONDS", 0.01)
+    monkeypatch.setattr(resiliency, "ATTEMPT_TIMEOUT_MAX_SECONDS", 1.0)
+    state = ResiliencyState(
+        unauthorized_threshold=3,
+        transient_threshold=100,
+        latency=LatencyTracker(window=LATENCY_MIN_SAMPLES),
+    )
+    for _ in range(LATENCY_MIN_SAMPLES):
+        state.latency.record("set mode", 0.005)
+    single_attempt = dataclasses.replace(retry_policy, max_attempts=1)
+
+    async def operation() -> None:
+        """Answer ten times slower than the recorded samples."""
+        await asyncio.sleep(0.05)
+
+    outcomes: list[str] = []
+    for _ in range(4):
+        try:
+            await async_call_with_retry(
+                operation,
+                policy=single_attempt,
+                state=state,
+                operation_name="set mode",
+                logger=logging.getLogger(__name__),
+            )
+        except CarrierApiConnectionError:
+            outcomes.append("timed out")
+        else:
+            outcomes.append("answered")
+            break
+
+    assert outcomes == ["timed out", "timed out", "answered"]
+
+
+@pytest.mark.asyncio
+async def test_retry_helper_times_out_hung_attempt_within_deadline(
+    retry_policy: RetryPolicy,
+) -> None:
+    """Cut off a hung Carrier call at the caller deadline without retrying past it."""
+    state = ResiliencyState(unauthorized_threshold=3, transient_threshold=3)
+    calls = 0
+
+    async def operation() -> None:
+        """Hang far longer than the caller is willing to wait."""
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(10)
+
+    with pytest.raises(CarrierApiConnectionError, match="timed out"):
+        await async_call_with_retry(
+            operation,
+            policy=retry_policy,
+            state=state,
+            operation_name="set mode",
+            logger=logging.getLogger(__name__),
+            deadline=0.1,
+        )
+
+    assert calls == 1
+    assert state.consecutive_transient == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_fails_fast_once_retries_outpace_first_attempts(
+    retry_policy: RetryPolicy,
+) -> None:
+    """Stop retrying once the account's retry budget is spent."""
+    state = ResiliencyState(
+        unauthorized_threshold=3,
+        transient_threshold=100,
+        retry_budget=RetryBudget(ratio=0, min_retries=1),
+    )
+    calls = 0
+
+    async def operation() -> None:
+        """Always fail with a transient transport error."""
+        nonlocal calls
+        calls += 1
+        raise CarrierApiConnectionError("flaky")
+
+    for _ in range(2):
+        with pytest.raises(CarrierApiConnectionError):
+            await async_call_with_retry(
+                operation,
+                policy=retry_policy,
+                state=state,
+                operation_name="test operation",
+                logger=logging.getLogger(__name__),
+            )
+
+    assert calls == 3
+    assert state.retry_budget.as_dict() == {
+        "window_seconds": state.retry_budget.window_seconds,
+        "first_attempts": 2,
+        "retries": 1,
+        "limit": 1,
+        "denied": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_retry_helper_holds_attempt_slot_only_while_an_attempt_runs() -> None:
+    """Free the shared slot during backoff so other accounts can refresh."""
+    state = ResiliencyState(unauthorized_threshold=3, transient_threshold=3)
+    slot = asyncio.Semaphore(1)
+    policy = RetryPolicy(
+        name="test",
+        max_attempts=2,
+        base_delay=0.05,
+        max_delay=0.05,
+        jitter_fraction=0,
+        retry_on_unauthorized=False,
+    )
+    held_during_attempt: list[bool] = []
+
+    async def operation() -> str:
+        """Fail once with a transient error, then succeed."""
+        held_during_attempt.append(slot.locked())
+        if len(held_during_attempt) == 1:
+            raise CarrierApiConnectionError("temporary")
+        return "ok"
+
+    call = asyncio.create_task(
+        async_call_with_retry(
+            operation,
+            policy=policy,
+            state=state,
+            operation_name="full data refresh",
+            logger=logging.getLogger(__name__),
+            attempt_slot=slot,
+        )
+    )
+    await asyncio.sleep(0.01)
+
+    assert held_during_attempt == [True]
+    assert not slot.locked()
+
+    assert await call == "ok"
+    assert held_during_attempt == [True, True]
+    assert not slot.locked()
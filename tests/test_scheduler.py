@@ -0,0 +1,98 @@
+"""Workflow tests for cross-entry Carrier scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ha_carrier.carrier_data_update_coordinator import (
+    CarrierDataUpdateCoordinator,
+)
+from custom_components.ha_carrier.const import DOMAIN, MAX_CONCURRENT_LOGINS
+from custom_components.ha_carrier.scheduler import CarrierScheduler, async_get_scheduler
+
+from .conftest import FakeCarrierApiConnection
+
+INTERVAL = timedelta(minutes=30)
+
+
+def _add_entries(hass: HomeAssistant, count: int) -> list[MockConfigEntry]:
+    """Register ``count`` Carrier config entries with Home Assistant."""
+    entries = []
+    for index in range(count):
+        entry = MockConfigEntry(domain=DOMAIN, unique_id=f"account-{index}")
+        entry.add_to_hass(hass)
+        entries.append(entry)
+    return entries
+
+
+def test_phase_fraction_is_deterministic_and_bounded() -> None:
+    """Derive the same in-range phase for an entry every time."""
+    first = CarrierScheduler.phase_fraction("entry-a")
+
+    assert first == CarrierScheduler.phase_fraction("entry-a")
+    assert 0 <= first < 1
+    assert first != CarrierScheduler.phase_fraction("entry-b")
+
+
+@pytest.mark.asyncio
+async def test_single_entry_keeps_interval(hass: HomeAssistant) -> None:
+    """Leave a lone Carrier account on the plain poll interval."""
+    (entry,) = _add_entries(hass, 1)
+    scheduler = async_get_scheduler(hass)
+
+    assert scheduler.next_poll_interval(entry.entry_id, INTERVAL) == INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_multiple_entries_poll_on_their_own_phase_slots(hass: HomeAssistant) -> None:
+    """Land each entry's next poll on its own phase within the interval."""
+    entries = _add_entries(hass, 3)
+    scheduler = async_get_scheduler(hass)
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+
+    for entry in entries:
+        wait = scheduler.next_poll_interval(entry.entry_id, INTERVAL, now)
+        next_poll = (now + wait).timestamp()
+        expected_phase = CarrierScheduler.phase_fraction(entry.entry_id) * INTERVAL.total_seconds()
+
+        assert INTERVAL / 2 <= wait < INTERVAL * 1.5
+        assert next_poll % INTERVAL.total_seconds() == pytest.approx(expected_phase)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_is_shared_in_hass_data(hass: HomeAssistant) -> None:
+    """Reuse one scheduler for every config entry."""
+    scheduler = async_get_scheduler(hass)
+
+    assert async_get_scheduler(hass) is scheduler
+    assert hass.data[DOMAIN] is scheduler
+
+
+@pytest.mark.asyncio
+async def test_refresh_authenticates_inside_a_shared_login_slot(
+    hass: HomeAssistant, carrier_api: FakeCarrierApiConnection
+) -> None:
+    """Hold a refresh's token check until another entry frees a login slot."""
+    scheduler = async_get_scheduler(hass)
+    coordinator = CarrierDataUpdateCoordinator(hass, carrier_api, scheduler=scheduler)
+    coordinator._websocket_initialized = True
+    for _ in range(MAX_CONCURRENT_LOGINS):
+        await scheduler.login_semaphore.acquire()
+
+    refresh = asyncio.create_task(coordinator._async_full_refresh())
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert carrier_api.auth_checks == 0
+    assert not refresh.done()
+
+    scheduler.login_semaphore.release()
+    await refresh
+
+    assert carrier_api.auth_checks == 1
+    assert ("load_data", {}) in carrier_api.calls
@@ -5,11 +5,13 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
+from carrier_api import CarrierApiConnectionError
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 import pytest
 
-from custom_components.ha_carrier.const import DOMAIN
+from custom_components.ha_carrier.const import DOMAIN, TRANSIENT_FAILURE_THRESHOLD
 
 from .conftest import FakeCarrierApiConnection, build_carrier_system, entity_id_for_unique_id
 
@@ -263,3 +265,67 @@ async def test_sensor_platform_maps_outdoor_operational_status_variants(
 
     assert state is not None
     assert state.state == expected_state
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_sensor_follows_breaker_through_failing_refreshes(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+    carrier_api: FakeCarrierApiConnection,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Show the breaker opening during an outage and closing once Carrier answers."""
+    monkeypatch.setattr(
+        "custom_components.ha_carrier.resiliency.compute_backoff_delay", lambda *_: 0
+    )
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+    entity_id = entity_id_for_unique_id(hass, "sensor", "abc123_api_circuit_breaker")
+
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "closed"
+
+    carrier_api.load_data_error = CarrierApiConnectionError("offline")
+    for _ in range(TRANSIENT_FAILURE_THRESHOLD):
+        coordinator.data_flush = True
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert not coordinator.last_update_success
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "open"
+
+    carrier_api.load_data_error = None
+    coordinator.resiliency.breaker_open_seconds = 0
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_api_metric_sensors_are_disabled_diagnostics_by_default(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Register API rate and latency sensors without enabling them."""
+    await setup_integration()
+    registry = er.async_get(hass)
+
+    for unique_id in (
+        "abc123_api_calls_last_hour",
+        "abc123_api_errors_last_hour",
+        "abc123_api_websocket_messages_last_hour",
+        "abc123_api_latency_p95",
+    ):
+        entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+        assert entity_id is not None
+        entry = registry.async_get(entity_id)
+        assert entry is not None
+        assert entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+        assert entry.entity_category is EntityCategory.DIAGNOSTIC
@@ -0,0 +1,114 @@
+"""Workflow tests for Carrier profiling services."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+import pytest
+
+from custom_components.ha_carrier.const import DOMAIN
+from custom_components.ha_carrier.diagnostics import async_get_config_entry_diagnostics
+from custom_components.ha_carrier.services import SERVICE_PROFILE, SERVICE_PROFILE_ENTITIES
+
+
+@pytest.mark.asyncio
+async def test_profile_entities_service_reports_costliest_entities_in_diagnostics(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Open a profiling window and charge entity updates to class and unique ID."""
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PROFILE_ENTITIES,
+        {"config_entry_id": config_entry.entry_id, "duration": 60},
+        blocking=True,
+    )
+    coordinator.async_update_listeners()
+    await hass.async_block_till_done()
+
+    profile = (await async_get_config_entry_diagnostics(hass, config_entry))["entity_profile"]
+    assert profile["enabled"] is True
+    assert profile["entities_measured"] > 0
+    assert "Thermostat" in profile["total_seconds_by_class"]
+    top = profile["top_entities"]
+    assert top[0]["calls"] >= 1
+    assert [cost["total_seconds"] for cost in top] == sorted(
+        (cost["total_seconds"] for cost in top), reverse=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_entity_profiling_is_off_until_requested(
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Leave the entity update path unmeasured without a service call."""
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+
+    coordinator.async_update_listeners()
+
+    assert coordinator.entity_profiler.enabled is False
+    assert coordinator.entity_profiler.costs == {}
+
+
+@pytest.mark.asyncio
+async def test_profile_entities_service_rejects_unknown_entry(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Reject a service call that targets no loaded Carrier entry."""
+    await setup_integration()
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE_ENTITIES,
+            {"config_entry_id": "missing"},
+            blocking=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_profile_service_writes_capture_after_requested_cycles(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Profile two fan-out cycles, then write the stats and a text summary."""
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PROFILE,
+        {"config_entry_id": config_entry.entry_id, "cycles": 2},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    output_path = Path(str(response["path"]))
+    assert output_path.parent == Path(hass.config.config_dir)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE,
+            {"config_entry_id": config_entry.entry_id},
+            blocking=True,
+        )
+
+    coordinator.async_update_listeners()
+    assert coordinator.cycle_profiler.active is True
+    await coordinator.updated_callback("{}")
+    await hass.async_block_till_done()
+
+    assert coordinator.cycle_profiler.active is False
+    assert await hass.async_add_executor_job(output_path.exists)
+    summary = await hass.async_add_executor_job(output_path.with_suffix(".txt").read_text)
+    assert "_handle_coordinator_update" in summary
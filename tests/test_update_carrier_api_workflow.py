@@ -14,6 +14,7 @@ WORKFLOW_PATH = Path(".github/workflows/update_carrier_api.yml")
 SCRIPT_PATH = Path(".github/scripts/update_carrier_api_pins.py")
 RELEASE_NOTES_SCRIPT_PATH = Path(".github/scripts/build_carrier_api_release_notes.py")
 CLEANUP_SCRIPT_PATH = Path(".github/scripts/cleanup_carrier_api_update_branches.py")
+BENCHMARK_SCRIPT_PATH = Path(".github/scripts/compare_carrier_api_benchmarks.py")
 
 
 class FakeCleanupClient:
@@ -123,6 +124,12 @@ def release_notes_script() -> ModuleType:
     return _load_script("build_carrier_api_release_notes", RELEASE_NOTES_SCRIPT_PATH)
 
 
+@pytest.fixture
+def benchmark_script() -> ModuleType:
+    """Load the carrier-api benchmark comparison script as a test module."""
+    return _load_script("compare_carrier_api_benchmarks", BENCHMARK_SCRIPT_PATH)
+
+
 @pytest.fixture
 def cleanup_script() -> ModuleType:
     """Load the carrier-api cleanup script as a test module."""
@@ -152,6 +159,10 @@ def _load_script(module_name: str, script_path: Path) -> ModuleType:
         str(SCRIPT_PATH),
         str(RELEASE_NOTES_SCRIPT_PATH),
         str(CLEANUP_SCRIPT_PATH),
+        str(BENCHMARK_SCRIPT_PATH),
+        "CARRIER_BENCHMARK_OUTPUT: benchmarks-current.json",
+        "CARRIER_BENCHMARK_OUTPUT: benchmarks-latest.json",
+        "--benchmark-report-path carrier-api-benchmarks.md",
         "--body-path carrier-api-update-pr-body.md",
         "--delete-merged-branches",
         "LATEST_VERSION: ${{ steps.versions.outputs.latest }}",
@@ -405,6 +416,27 @@ def test_release_note_script_builds_sanitized_pr_body(
     assert "Ignored prerelease" not in body
 
 
+def test_release_note_script_includes_benchmark_report(
+    tmp_path: Path,
+    release_notes_script: ModuleType,
+) -> None:
+    """Release-note script should put the benchmark comparison before release notes."""
+    body_path = tmp_path / "body.md"
+
+    release_notes_script.write_pr_body(
+        body_path=body_path,
+        releases=[],
+        current_version="3.3.0",
+        pyproject_current_version="3.3.0",
+        latest_version="3.3.1",
+        benchmark_report="No benchmark figure regressed.\n",
+    )
+
+    body = body_path.read_text()
+    assert "## Integration benchmarks\nNo benchmark figure regressed.\n" in body
+    assert body.index("## Integration benchmarks") < body.index("## carrier-api release notes")
+
+
 def test_release_note_script_handles_url_errors(
     tmp_path: Path,
     release_notes_script: ModuleType,
@@ -508,3 +540,86 @@ def test_cleanup_script_keeps_active_update_branch(cleanup_script: ModuleType) -
     assert client.deleted_refs == ["heads/chore/update-carrier-api-old"]
     assert result.closed_prs == []
     assert result.deleted_branches == ["chore/update-carrier-api-old"]
+
+
+def _write_benchmark_results(path: Path, *, median_seconds: float, peak_memory_bytes: int) -> None:
+    """Write a benchmark results file with one entity fan-out case."""
+    path.write_text(
+        json.dumps(
+            {
+                "results": [
+                    {
+                        "name": "entity_fan_out",
+                        "params": {"systems": 5, "zones": 4},
+                        "median_seconds": median_seconds,
+                        "peak_memory_bytes": peak_memory_bytes,
+                    },
+                ],
+            },
+        ),
+    )
+
+
+def test_benchmark_script_flags_regressions_above_threshold(
+    tmp_path: Path,
+    benchmark_script: ModuleType,
+) -> None:
+    """Benchmark comparison should table both versions and flag slower figures."""
+    before_path = tmp_path / "before.json"
+    after_path = tmp_path / "after.json"
+    report_path = tmp_path / "report.md"
+    output_path = tmp_path / "github-output"
+    _write_benchmark_results(before_path, median_seconds=0.002, peak_memory_bytes=10240)
+    _write_benchmark_results(after_path, median_seconds=0.003, peak_memory_bytes=10240)
+
+    result = benchmark_script.main(
+        [
+            "--before-path",
+            str(before_path),
+            "--after-path",
+            str(after_path),
+            "--current-version",
+            "3.3.0",
+            "--latest-version",
+            "3.3.1",
+            "--report-path",
+            str(report_path),
+            "--github-output",
+            str(output_path),
+        ],
+    )
+
+    report = report_path.read_text()
+    assert result == 0
+    assert "1 benchmark figure(s) regressed by more than 25%" in report
+    assert "`entity_fan_out[systems=5,zones=4]` median_seconds: 2.000 ms → 3.000 ms" in report
+    assert "| 10.0 KiB | 10.0 KiB | +0.0% |" in report
+    assert output_path.read_text() == "regressed=true\n"
+
+
+def test_benchmark_script_reports_missing_run(
+    tmp_path: Path,
+    benchmark_script: ModuleType,
+) -> None:
+    """Benchmark comparison should still write a report when one run failed."""
+    before_path = tmp_path / "before.json"
+    report_path = tmp_path / "report.md"
+    _write_benchmark_results(before_path, median_seconds=0.002, peak_memory_bytes=10240)
+
+    result = benchmark_script.main(
+        [
+            "--before-path",
+            str(before_path),
+            "--after-path",
+            str(tmp_path / "missing.json"),
+            "--current-version",
+            "3.3.0",
+            "--latest-version",
+            "3.3.1",
+            "--report-path",
+            str(report_path),
+        ],
+    )
+
+    assert result == 0
+    assert "did not complete with `carrier-api==3.3.1`" in report_path.read_text()
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import ast
 from collections.abc import Callable
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
+from aiohttp import ClientResponseError, RequestInfo
 from carrier_api import (
     CarrierApiAuthError,
     CarrierApiConnectionError,
@@ -13,12 +16,18 @@ from carrier_api import (
     CarrierApiTokenRefreshError,
     CarrierApiWebsocketError,
 )
+from multidict import CIMultiDict, CIMultiDictProxy
 import pytest
+from yarl import URL
 
+from custom_components.ha_carrier.const import RATE_LIMIT_THROTTLED_DEFAULT_SECONDS
 from custom_components.ha_carrier.util import (
     async_redact_data,
+    carrier_message_timestamp,
     is_transient_transport_error,
     is_unauthorized_error,
+    parse_websocket_message,
+    throttle_retry_after,
 )
 
 INTEGRATION_ROOT = Path(__file__).parents[1] / "custom_components" / "ha_carrier"
@@ -79,3 +88,67 @@ def test_async_redact_data_recursively_redacts_mappings_and_lists() -> None:
         "nested": [{"password": "**REDACTED**", "mode": "auto"}],
     }
     assert payload["username"] == "user"
+
+
+def _wrapped_http_error(status: int, headers: dict[str, str] | None = None) -> BaseException:
+    """Return a Carrier connection error caused by an aiohttp HTTP response error."""
+    response_error = ClientResponseError(
+        RequestInfo(
+            url=URL("https://example.invalid"),
+            method="POST",
+            headers=CIMultiDictProxy(CIMultiDict()),
+        ),
+        (),
+        status=status,
+        headers=CIMultiDictProxy(CIMultiDict(headers or {})),
+    )
+    error = CarrierApiConnectionError("throttled")
+    error.__cause__ = response_error
+    return error
+
+
+@pytest.mark.parametrize(
+    ("status", "headers", "expected"),
+    [
+        (429, {"Retry-After": "12"}, 12.0),
+        (429, {}, RATE_LIMIT_THROTTLED_DEFAULT_SECONDS),
+        (429, {"Retry-After": "soon"}, RATE_LIMIT_THROTTLED_DEFAULT_SECONDS),
+        (503, {"Retry-After": "12"}, None),
+    ],
+)
+def test_throttle_retry_after_reads_429_from_the_cause_chain(
+    status: int, headers: dict[str, str], expected: float | None
+) -> None:
+    """Find Carrier throttling behind carrier_api's wrapped connection errors."""
+    assert throttle_retry_after(_wrapped_http_error(status, headers)) == expected
+
+
+def test_throttle_retry_after_ignores_errors_without_http_status() -> None:
+    """Leave ordinary transport failures unthrottled."""
+    assert throttle_retry_after(CarrierApiConnectionError("timeout")) is None
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ({"timestamp": "2024-05-01T12:00:00Z"}, datetime(2024, 5, 1, 12, tzinfo=UTC)),
+        ({"timestamp": 1714564800000}, datetime(2024, 5, 1, 12, tzinfo=UTC)),
+        ({"updatedTime": 1714564800}, datetime(2024, 5, 1, 12, tzinfo=UTC)),
+        ({"timestamp": "not a time"}, None),
+        ({}, None),
+    ],
+)
+def test_carrier_message_timestamp_parses_iso_and_epoch_values(
+    message: dict[str, Any], expected: datetime | None
+) -> None:
+    """Read Carrier's message timestamp in each format it has been seen in."""
+    assert carrier_message_timestamp(message) == expected
+
+
+def test_parse_websocket_message_accepts_only_json_objects() -> None:
+    """Return the message object, or None for anything else."""
+    assert parse_websocket_message('{"messageType": "InfinityStatus"}') == {
+        "messageType": "InfinityStatus"
+    }
+    assert parse_websocket_message("not json") is None
+    assert parse_websocket_message("[]") is None
@@ -0,0 +1,131 @@
+"""Workflow tests for recording and replaying Carrier websocket traffic."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.ha_carrier import websocket_trace
+from custom_components.ha_carrier.const import DOMAIN
+from custom_components.ha_carrier.services import SERVICE_RECORD_WEBSOCKET
+from custom_components.ha_carrier.websocket_trace import async_replay_trace, read_trace
+from tests.conftest import FakeCarrierApiConnection, build_carrier_system
+
+
+def _zone_temperature_message(serial: str, temperature: float) -> str:
+    """Return an InfinityStatus message that changes zone 1's temperature."""
+    return json.dumps(
+        {
+            "messageType": "InfinityStatus",
+            "deviceId": serial,
+            "zones": [{"id": "1", "rt": temperature}],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_recorded_trace_is_redacted_and_replays_into_coordinator(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Record live messages without serials, then replay them offline."""
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_RECORD_WEBSOCKET,
+        {"config_entry_id": config_entry.entry_id, "duration": 60},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+
+    for temperature in (71.0, 72.0):
+        message = _zone_temperature_message("ABC123", temperature)
+        await coordinator.async_handle_websocket_message(message)
+    coordinator.websocket_recorder.stop()
+    await hass.async_block_till_done()
+
+    trace = await hass.async_add_executor_job(read_trace, Path(str(response["path"])))
+    assert [entry["message"]["zones"][0]["rt"] for entry in trace] == [71.0, 72.0]
+    assert trace[0]["offset"] <= trace[1]["offset"]
+    assert {entry["message"]["deviceId"] for entry in trace} == {"system-1"}
+    assert "ABC123" not in json.dumps(trace)
+
+    coordinator.systems[0].status.raw["zones"][0]["rt"] = 65.0
+    assert await async_replay_trace(coordinator, trace) == 2
+    assert coordinator.systems[0].status.zones[0].temperature == 72.0
+
+
+@pytest.mark.asyncio
+async def test_replay_at_recorded_speed_keeps_message_gaps(
+    setup_integration: Callable[..., Any],
+) -> None:
+    """Wait out the recorded offsets when replaying in real time."""
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+    trace = [
+        {"offset": 0.0, "message": json.loads(_zone_temperature_message("**REDACTED**", 71.0))},
+        {"offset": 0.2, "message": json.loads(_zone_temperature_message("**REDACTED**", 74.0))},
+    ]
+    loop = coordinator.hass.loop
+
+    started = loop.time()
+    await async_replay_trace(coordinator, trace, realtime=True)
+
+    assert loop.time() - started >= 0.15
+    assert coordinator.systems[0].status.zones[0].temperature == 74.0
+
+
+@pytest.mark.asyncio
+async def test_trace_is_written_in_batches_and_replays_onto_each_system(
+    hass: HomeAssistant,
+    setup_integration: Callable[..., Any],
+    carrier_api: FakeCarrierApiConnection,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Append batches while recording and map pseudonyms back in system order."""
+    monkeypatch.setattr(websocket_trace, "WEBSOCKET_TRACE_FLUSH_MESSAGES", 2)
+    carrier_api.systems = [
+        build_carrier_system(serial="ABC123", name="Home"),
+        build_carrier_system(serial="DEF456", name="Cabin"),
+    ]
+    config_entry = await setup_integration()
+    coordinator = config_entry.runtime_data
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_RECORD_WEBSOCKET,
+        {"config_entry_id": config_entry.entry_id, "duration": 60},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    trace_path = Path(str(response["path"]))
+
+    await coordinator.async_handle_websocket_message(_zone_temperature_message("DEF456", 66.0))
+    await coordinator.async_handle_websocket_message(_zone_temperature_message("ABC123", 71.0))
+    await hass.async_block_till_done()
+    flushed = await hass.async_add_executor_job(read_trace, trace_path)
+    assert [entry["message"]["deviceId"] for entry in flushed] == ["system-2", "system-1"]
+
+    await coordinator.async_handle_websocket_message(_zone_temperature_message("DEF456", 67.0))
+    coordinator.websocket_recorder.stop()
+    await hass.async_block_till_done()
+    trace = await hass.async_add_executor_job(read_trace, trace_path)
+    assert [entry["message"]["deviceId"] for entry in trace] == [
+        "system-2",
+        "system-1",
+        "system-2",
+    ]
+    assert "DEF456" not in json.dumps(trace)
+
+    for system in coordinator.systems:
+        system.status.raw["zones"][0]["rt"] = 60.0
+    assert await async_replay_trace(coordinator, trace) == 3
+    assert coordinator.systems[0].status.zones[0].temperature == 71.0
+    assert coordinator.systems[1].status.zones[0].temperature == 67.0